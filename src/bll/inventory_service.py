@@ -1,14 +1,55 @@
-from typing import Dict, List, Optional, Tuple
+import csv
+from io import TextIOWrapper
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 import logging
 from decimal import Decimal
+from operator import mul
 from sqlalchemy.orm import Session
 from src.dal.inventory_dao import InventoryDAO
-from src.utils.validators import validate_amount, validate_quantity
+from src.utils.validators import validate_amount, validate_date, validate_quantity
 from src.database.models import InventoryItem
 
+# Optional reportlab imports, as in the reporting service
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Display labels for stock status, as shown in the inventory screen
+STATUS_LABELS = {
+    'out_of_stock': 'Out of Stock',
+    'low_stock': 'Low Stock',
+    'normal': 'In Stock'
+}
+_STATUS_KEYS = {label: key for key, label in STATUS_LABELS.items()}
+
+
+def _stock_status(item: InventoryItem) -> str:
+    if item.quantity == 0:
+        return 'out_of_stock'
+    if item.quantity <= item.reorder_level:
+        return 'low_stock'
+    return 'normal'
+
+
+def _write_csv(out: BinaryIO, header: List[str], rows: Iterable) -> None:
+    """Write header and rows to a binary file object as UTF-8 CSV"""
+    text = TextIOWrapper(out, encoding='utf-8', newline='')
+    try:
+        writer = csv.writer(text)
+        writer.writerow(header)
+        writer.writerows(rows)
+        text.flush()
+    finally:
+        # Hand out back to the caller open
+        text.detach()
+
 
 class InventoryService:
     def __init__(self, session: Session):
@@ -107,14 +148,23 @@ class InventoryService:
             logger.error(f"Failed to update stock: {str(e)}")
             raise
 
-    def get_inventory_status(self) -> Dict:
-        """Get current inventory status with alerts"""
+    def get_inventory_status(self, search_term: Optional[str] = None,
+                             status: Optional[str] = None) -> Dict:
+        """Get current inventory status with alerts, optionally filtered by name and status"""
         try:
-            # Get all inventory items
-            items = self.inventory_dao.get_all_items()
+            if status is not None and status not in STATUS_LABELS:
+                raise ValueError(f"Invalid status. Must be one of: {', '.join(STATUS_LABELS)}")
 
-            # Calculate total inventory value
-            total_value = sum(item.quantity * item.unit_cost for item in items)
+            # Get inventory items; filters are applied in the query
+            if search_term or status:
+                items = self.inventory_dao.search_items(search_term, status)
+            else:
+                items = self.inventory_dao.get_all_items()
+
+            # Convert costs out of Decimal once; totals are then plain float products
+            costs = [float(item.unit_cost) for item in items]
+            totals = list(map(mul, [item.quantity for item in items], costs))
+            total_value = sum(totals)
 
             # Identify low stock items
             low_stock = [item for item in items if item.quantity <= item.reorder_level]
@@ -124,19 +174,19 @@ class InventoryService:
 
             return {
                 'total_items': len(items),
-                'total_value': float(total_value),
+                'total_value': round(total_value, 2),
                 'items': [
                     {
                         'id': item.id,
                         'name': item.name,
                         'quantity': item.quantity,
-                        'unit_cost': float(item.unit_cost),
-                        'total_value': float(item.quantity * item.unit_cost),
+                        'unit_cost': cost,
+                        'total_value': total,
                         'reorder_level': item.reorder_level,
                         'status': 'out_of_stock' if item.quantity == 0 else
                         'low_stock' if item.quantity <= item.reorder_level else 'normal'
                     }
-                    for item in items
+                    for item, cost, total in zip(items, costs, totals)
                 ],
                 'alerts': {
                     'low_stock_items': [
@@ -184,4 +234,84 @@ class InventoryService:
 
         except Exception as e:
             logger.error(f"Failed to get transaction history: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def export_inventory(self, out: BinaryIO, search_term: Optional[str] = None,
+                         status_filter: Optional[str] = None, format: str = 'csv') -> None:
+        """Write the inventory list, optionally filtered, to a binary file object"""
+        try:
+            if format != 'csv':
+                raise ValueError(f"Unsupported export format: {format}")
+
+            status = None
+            if status_filter:
+                status = _STATUS_KEYS.get(status_filter)
+                if status is None:
+                    raise ValueError(f"Invalid status filter: {status_filter}")
+            items = self.inventory_dao.iter_items(search_term, status)
+
+            def rows():
+                for item in items:
+                    yield (item.id, item.name, item.quantity, f"{item.unit_cost:.2f}",
+                           f"{item.quantity * item.unit_cost:.2f}", item.reorder_level,
+                           STATUS_LABELS[_stock_status(item)])
+
+            _write_csv(out, ['ID', 'Item', 'Quantity', 'Unit Cost', 'Total Value',
+                             'Reorder Level', 'Status'], rows())
+
+        except Exception as e:
+            logger.error(f"Failed to export inventory: {str(e)}")
+            raise
+
+    def export_transactions(self, out: BinaryIO, start_date: str, end_date: str,
+                            transaction_type: Optional[str] = None,
+                            format: str = 'csv') -> None:
+        """Write inventory transactions in a date range to a binary file object"""
+        try:
+            if format != 'csv':
+                raise ValueError(f"Unsupported export format: {format}")
+            for date_str in (start_date, end_date):
+                date_valid, date_error = validate_date(date_str)
+                if not date_valid:
+                    raise ValueError(date_error)
+
+            transactions = self.inventory_dao.iter_transaction_rows(
+                datetime.strptime(start_date, '%Y-%m-%d').date(),
+                datetime.strptime(end_date, '%Y-%m-%d').date(),
+                transaction_type.lower() if transaction_type else None
+            )
+
+            rows = (
+                (date.isoformat(), name, trans_type, quantity, username, notes or '')
+                for date, name, trans_type, quantity, username, notes in transactions
+            )
+            _write_csv(out, ['Date', 'Item', 'Type', 'Quantity', 'User', 'Notes'], rows)
+
+        except Exception as e:
+            logger.error(f"Failed to export transactions: {str(e)}")
+            raise
+
+    def generate_reorder_report(self, out: BinaryIO) -> None:
+        """Write a PDF listing items at or below their reorder level to a binary file object"""
+        try:
+            if not REPORTLAB_AVAILABLE:
+                raise ValueError("PDF export requires reportlab package")
+
+            items = self.inventory_dao.get_low_stock_items()
+            styles = getSampleStyleSheet()
+            table = Table(
+                [['Item', 'Current Stock', 'Reorder Level', 'Status']] +
+                [[item.name, item.quantity, item.reorder_level,
+                  STATUS_LABELS[_stock_status(item)]] for item in items]
+            )
+            doc = SimpleDocTemplate(out, pagesize=letter)
+            doc.build([
+                Paragraph("Brew and Bite Café - Reorder Report", styles['Title']),
+                Paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                          styles['Normal']),
+                table
+            ])
+
+        except Exception as e:
+            logger.error(f"Failed to generate reorder report: {str(e)}")
+            raise
@@ -1,8 +1,12 @@
-from io import BytesIO
-from typing import Dict, List, Optional
+import csv
+import heapq
+from io import BytesIO, TextIOWrapper
+from typing import BinaryIO, Dict, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 import logging
 from decimal import Decimal
+from itertools import islice
+from operator import itemgetter
 from sqlalchemy.orm import Session
 
 # Optional reportlab imports with proper error handling
@@ -135,20 +139,27 @@ class ReportingService:
     def export_report(self, report_type: str, start_date: str,
                       end_date: str, format: str = 'pdf') -> bytes:
         """Export report in specified format"""
+        buffer = BytesIO()
+        self.write_report(report_type, start_date, end_date, buffer, format)
+        return buffer.getvalue()
+
+    def write_report(self, report_type: str, start_date: str, end_date: str,
+                     fileobj: BinaryIO, format: str = 'pdf') -> None:
+        """Write report in specified format straight to a binary file object"""
         try:
             if not REPORTLAB_AVAILABLE and format == 'pdf':
                 raise ValueError("PDF export requires reportlab package")
+            if format not in ('pdf', 'csv'):
+                raise ValueError(f"Unsupported export format: {format}")
 
             # Get report data based on type
             report_data = self._get_report_data(report_type, start_date, end_date)
 
             # Export based on format
             if format == 'pdf':
-                return self._export_to_pdf(report_data, report_type)
-            elif format == 'csv':
-                return self._export_to_csv(report_data, report_type)
+                self._export_to_pdf(report_data, report_type, fileobj)
             else:
-                raise ValueError(f"Unsupported export format: {format}")
+                self._export_to_csv(report_data, report_type, fileobj)
 
         except Exception as e:
             logger.error(f"Failed to export report: {str(e)}")
@@ -165,13 +176,12 @@ class ReportingService:
         else:
             raise ValueError(f"Invalid report type: {report_type}")
 
-    def _export_to_pdf(self, data: Dict, report_type: str) -> bytes:
-        """Export report data to PDF format"""
+    def _export_to_pdf(self, data: Dict, report_type: str, fileobj: BinaryIO) -> None:
+        """Write report data to fileobj in PDF format"""
         if not REPORTLAB_AVAILABLE:
             raise ValueError("PDF export requires reportlab package")
 
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
+        doc = SimpleDocTemplate(fileobj, pagesize=letter)
         elements = []
         styles = getSampleStyleSheet()
 
@@ -180,20 +190,19 @@ class ReportingService:
 
         # Build PDF
         doc.build(elements)
-        return buffer.getvalue()
-
-    def _export_to_csv(self, data: Dict, report_type: str) -> bytes:
-        """Export report data to CSV format"""
-        import csv
-        from io import StringIO
-
-        output = StringIO()
-        writer = csv.writer(output)
 
-        # Write report data
-        self._write_csv_data(writer, data, report_type)
+    def _export_to_csv(self, data: Dict, report_type: str, fileobj: BinaryIO) -> None:
+        """Write report data to fileobj in CSV format"""
+        output = TextIOWrapper(fileobj, encoding='utf-8', newline='')
+        try:
+            writer = csv.writer(output)
 
-        return output.getvalue().encode('utf-8')
+            # Write report data
+            self._write_csv_data(writer, data, report_type)
+            output.flush()
+        finally:
+            # Hand fileobj back to the caller open
+            output.detach()
 
     def _get_pdf_elements(self, data: Dict, report_type: str, styles) -> List:
         """Generate PDF elements based on report type"""
@@ -228,46 +237,129 @@ class ReportingService:
         elif report_type == 'inventory':
             self._write_inventory_report_csv(writer, data)
 
-    def get_recent_activities(self, limit: int = 50) -> List[Dict]:
-        """Get recent activities for dashboard"""
+    @staticmethod
+    def _write_overview_csv(writer, overview: Dict):
+        writer.writerow(['Overview'])
+        writer.writerows(
+            (key.replace('_', ' ').title(), value) for key, value in overview.items()
+        )
+        writer.writerow([])
+
+    @staticmethod
+    def _write_expenses_csv(writer, by_category: List[Dict]):
+        writer.writerow(['Expenses by Category'])
+        writer.writerow(['Category', 'Total Amount', 'Transactions'])
+        writer.writerows(
+            (c['category'], c['total_amount'], c['transaction_count']) for c in by_category
+        )
+        writer.writerow([])
+
+    def _write_daily_report_csv(self, writer, data: Dict):
+        """Write daily report sections as CSV rows"""
+        writer.writerow(['Date', data['date']])
+        writer.writerow([])
+        self._write_overview_csv(writer, data['overview'])
+
+        sales = data['sales']
+        writer.writerow(['Sales by Hour'])
+        writer.writerow(['Hour', 'Amount', 'Transactions'])
+        writer.writerows((h['hour'], h['amount'], h['count']) for h in sales['by_hour'])
+        writer.writerow([])
+
+        writer.writerow(['Sales by Payment Method'])
+        writer.writerow(['Method', 'Amount', 'Transactions'])
+        writer.writerows(
+            (m['method'], m['amount'], m['count']) for m in sales['by_payment_method']
+        )
+        writer.writerow([])
+
+        writer.writerow(['Top Items'])
+        writer.writerow(['Item', 'Quantity', 'Revenue'])
+        writer.writerows((i['name'], i['quantity'], i['revenue']) for i in sales['top_items'])
+        writer.writerow([])
+
+        self._write_expenses_csv(writer, data['expenses']['by_category'])
+
+        writer.writerow(['Staff Performance'])
+        writer.writerow(['User', 'Sales', 'Total Sales'])
+        writer.writerows(
+            (p['username'], p['sales_count'], p['total_sales'])
+            for p in data['staff_performance']
+        )
+
+    def _write_periodic_report_csv(self, writer, data: Dict):
+        """Write periodic report sections as CSV rows"""
+        writer.writerow(['Period', data['period']['start_date'], data['period']['end_date']])
+        writer.writerow([])
+        self._write_overview_csv(writer, data['overview'])
+
+        writer.writerow(['Sales Over Time'])
+        writer.writerow(['Date', 'Total Amount', 'Transactions', 'Average Sale'])
+        writer.writerows(
+            (s['date'], s['total_amount'], s['transaction_count'], s['average_sale'])
+            for s in data['sales_analysis']['over_time']
+        )
+        writer.writerow([])
+
+        self._write_expenses_csv(writer, data['expenses'])
+
+    def _write_inventory_report_csv(self, writer, data: Dict):
+        """Write inventory status as CSV rows"""
+        writer.writerow(['Total Items', data['total_items']])
+        writer.writerow(['Total Value', data['total_value']])
+        writer.writerow([])
+        writer.writerow(['ID', 'Name', 'Quantity', 'Unit Cost', 'Total Value',
+                         'Reorder Level', 'Status'])
+        writer.writerows(
+            (i['id'], i['name'], i['quantity'], i['unit_cost'], i['total_value'],
+             i['reorder_level'], i['status'])
+            for i in data['items']
+        )
+
+    def get_recent_activities(self, limit: int = 50, offset: int = 0) -> List[Dict]:
+        """Get recent activities for dashboard, newest first, one page at a time"""
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=7)
-
-            activities = []
-
-            # Get recent sales via DAO
-            sales = self.sales_service.sale_dao.get_sales_by_date_range(
-                start_date=start_date.date(),
-                end_date=end_date.date()
-            )
-
-            # Get recent expenses via DAO
-            expenses = self.expense_service.expense_dao.get_expenses_by_date_range(
-                start_date=start_date.date(),
-                end_date=end_date.date()
-            )
-
-            for sale in sales:
-                activities.append({
-                    'timestamp': sale.date,
+            start_date = (datetime.now() - timedelta(days=7)).date()
+
+            # Neither source can contribute more than offset + limit rows to
+            # this page, so only that many are read from each
+            wanted = offset + limit
+            sales = [
+                {
+                    'timestamp': sale_date,
                     'type': 'SALE',
-                    'amount': float(sale.total_amount),
-                    'details': f"Sale #{sale.id} - {len(sale.sale_items)} items"
-                })
-
-            for expense in expenses:
-                category_name = expense.category.name if expense.category else 'Unknown'
-                activities.append({
-                    'timestamp': expense.date,
+                    'amount': float(total),
+                    'details': f"Sale #{sale_id} - {item_count} items"
+                }
+                for sale_id, sale_date, total, item_count
+                in self.sales_service.sale_dao.get_recent_sale_rows(start_date, wanted)
+            ]
+            expenses = [
+                {
+                    'timestamp': expense_date,
                     'type': 'EXPENSE',
-                    'amount': float(expense.amount),
-                    'details': f"{category_name} - {expense.description or ''}"
-                })
+                    'amount': float(amount),
+                    'details': f"{category_name or 'Unknown'} - {description or ''}"
+                }
+                for expense_date, amount, category_name, description
+                in self.expense_service.expense_dao.get_recent_expense_rows(start_date, wanted)
+            ]
 
-            activities.sort(key=lambda x: x['timestamp'], reverse=True)
-            return activities[:limit]
+            activities = heapq.merge(sales, expenses,
+                                     key=itemgetter('timestamp'), reverse=True)
+            return list(islice(activities, offset, wanted))
 
         except Exception as e:
             logger.error(f"Failed to get recent activities: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def get_recent_activities_formatted(self, limit: int = 50,
+                                        offset: int = 0) -> List[Tuple[str, str, str, str]]:
+        """Recent activities as display-ready (time, type, details, amount) rows"""
+        return [
+            (act['timestamp'].strftime('%m-%d %H:%M'),
+             act['type'].title(),
+             act['details'],
+             f"${act['amount']:,.2f}")
+            for act in self.get_recent_activities(limit=limit, offset=offset)
+        ]
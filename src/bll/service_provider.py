@@ -10,12 +10,15 @@ from .auth_service import AuthService
 
 
 class ServiceProvider:
+    """Services for the Tk thread; worker threads build their own with create_services(get_session())"""
     _instance: Optional['ServiceProvider'] = None
     _services: Dict = {}
 
     def __init__(self):
         if ServiceProvider._instance is not None:
             raise Exception("ServiceProvider is a singleton!")
+        # Session is a scoped_session, so this is the creating (Tk) thread's own
+        # session; sessions are not thread-safe and must not reach other threads
         self._session = get_session()
         self._initialize_services()
 
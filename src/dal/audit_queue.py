@@ -0,0 +1,150 @@
+"""
+Background writer for audit log entries.
+
+DAO mutations record plain dicts here instead of adding AuditLog rows to
+their own session, so the user-facing commit does not wait on the audit
+insert. Entries are held on the session until it commits (and dropped on
+rollback), then handed to a daemon thread that writes them in batches.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.database.models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+FLUSH_INTERVAL = 0.2  # seconds
+_PENDING_KEY = 'pending_audit_entries'
+_STOP = None  # queued by stop() to end the writer thread
+
+
+class AuditQueue:
+    def __init__(self, batch_size: int = BATCH_SIZE, flush_interval: float = FLUSH_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[Tuple[Engine, Dict]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def put(self, session: Session, user_id: int, action: str, table_name: str,
+            record_id: Optional[int] = None, details: Optional[str] = None) -> None:
+        """Record an audit entry to be written once the session commits"""
+        if not session.in_transaction():
+            # Make sure a later rollback() fires and discards the entry
+            session.begin()
+        session.info.setdefault(_PENDING_KEY, []).append({
+            'user_id': user_id,
+            'action': action,
+            'table_name': table_name,
+            'record_id': record_id,
+            'details': details,
+            'timestamp': datetime.utcnow()
+        })
+
+    def enqueue(self, engine: Engine, entries: List[Dict]) -> None:
+        """Hand committed entries to the background writer"""
+        # Held across the worker check and the puts so stop() cannot queue its
+        # marker in between and leave these entries with no writer
+        with self._lock:
+            self._ensure_worker()
+            for entry in entries:
+                self._queue.put((engine, entry))
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written"""
+        self._queue.join()
+
+    def stop(self) -> None:
+        """Write out queued entries and end the writer thread; the next enqueue starts a new one"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                # Entries queued before the marker are written before the thread exits
+                self._queue.put(_STOP)
+                self._thread.join()
+            self._thread = None
+
+    def _ensure_worker(self) -> None:
+        # Called with self._lock held
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name='audit-writer', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.error("Error writing audit log batch: %s", e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write(batch: List[Tuple[Engine, Dict]]) -> None:
+        by_engine: Dict[Engine, List[Dict]] = {}
+        for engine, entry in batch:
+            by_engine.setdefault(engine, []).append(entry)
+
+        for engine, entries in by_engine.items():
+            with engine.begin() as conn:
+                conn.execute(insert(AuditLog), entries)
+
+
+audit_queue = AuditQueue()
+atexit.register(audit_queue.flush)
+
+
+@event.listens_for(Session, 'after_commit')
+def _enqueue_pending(session: Session) -> None:
+    entries = session.info.pop(_PENDING_KEY, None)
+    if entries:
+        audit_queue.enqueue(session.get_bind().engine, entries)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_pending(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def flush() -> None:
+    """Write out any pending audit entries"""
+    audit_queue.flush()
+
+
+def stop() -> None:
+    """Write out pending audit entries and stop the background writer"""
+    audit_queue.stop()
@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, date
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
-from src.database.models import Expense, Category, AuditLog
+from src.database.models import Expense, Category
+from src.dal.audit_queue import audit_queue
 
 
 class ExpenseDAO:
@@ -23,13 +24,13 @@ class ExpenseDAO:
         self.session.add(expense)
 
         # Add audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=user_id,
             action='CREATE',
             table_name='expenses',
             details=f'Created expense: Amount {amount}, Category {category_id}'
         )
-        self.session.add(audit)
 
         self.session.commit()
         return expense
@@ -53,6 +54,16 @@ class ExpenseDAO:
 
         return query.order_by(Expense.date.desc()).all()
 
+    def get_recent_expense_rows(self, start_date: date, limit: int) -> List[Tuple]:
+        """Newest expenses since start_date as (date, amount, category name, description) rows"""
+        return self.session.query(
+            Expense.date, Expense.amount, Category.name, Expense.description
+        ).outerjoin(Expense.category) \
+            .filter(func.date(Expense.date) >= start_date) \
+            .order_by(Expense.date.desc()) \
+            .limit(limit) \
+            .all()
+
     def get_expenses_by_category(self, category_id: int,
                                  start_date: Optional[date] = None,
                                  end_date: Optional[date] = None) -> List[Expense]:
@@ -96,14 +107,14 @@ class ExpenseDAO:
                 setattr(expense, key, value)
 
         # Add audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=audit_user_id,
             action='UPDATE',
             table_name='expenses',
             record_id=expense_id,
             details=f'Updated expense: {update_data}'
         )
-        self.session.add(audit)
 
         self.session.commit()
         return expense
@@ -115,14 +126,14 @@ class ExpenseDAO:
             return False
 
         # Add audit log before deletion
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=audit_user_id,
             action='DELETE',
             table_name='expenses',
             record_id=expense_id,
             details=f'Deleted expense: Amount {expense.amount}, Category {expense.category_id}'
         )
-        self.session.add(audit)
 
         self.session.delete(expense)
         self.session.commit()
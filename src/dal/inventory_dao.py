@@ -1,8 +1,12 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from src.database.models import InventoryItem, InventoryTransaction, AuditLog
+from src.database.models import InventoryItem, InventoryTransaction, User
+from src.dal.audit_queue import audit_queue
+
+# Rows fetched per round-trip when streaming results for exports
+STREAM_BATCH_SIZE = 500
 
 
 class InventoryDAO:
@@ -35,13 +39,13 @@ class InventoryDAO:
             self.session.add(transaction)
 
         # Add audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=audit_user_id,
             action='CREATE',
             table_name='inventory_items',
             details=f'Created inventory item: {name}'
         )
-        self.session.add(audit)
 
         self.session.commit()
         return item
@@ -54,6 +58,34 @@ class InventoryDAO:
         """Get all inventory items"""
         return self.session.query(InventoryItem).order_by(InventoryItem.name).all()
 
+    def search_items(self, search_term: Optional[str] = None,
+                     status: Optional[str] = None) -> List[InventoryItem]:
+        """Get inventory items matching a name search and/or stock status"""
+        return self._item_query(search_term, status).all()
+
+    def iter_items(self, search_term: Optional[str] = None, status: Optional[str] = None,
+                   batch_size: int = STREAM_BATCH_SIZE) -> Iterator[InventoryItem]:
+        """Stream inventory items matching the filters from the cursor in batches"""
+        return self._item_query(search_term, status).yield_per(batch_size)
+
+    def _item_query(self, search_term: Optional[str], status: Optional[str]):
+        query = self.session.query(InventoryItem)
+
+        if search_term:
+            # Escape LIKE wildcards so this is a plain substring match, as in the GUI filter
+            pattern = search_term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            query = query.filter(InventoryItem.name.ilike(f'%{pattern}%', escape='\\'))
+        if status == 'out_of_stock':
+            query = query.filter(InventoryItem.quantity == 0)
+        elif status == 'low_stock':
+            query = query.filter(InventoryItem.quantity > 0,
+                                 InventoryItem.quantity <= InventoryItem.reorder_level)
+        elif status == 'normal':
+            query = query.filter(InventoryItem.quantity > 0,
+                                 InventoryItem.quantity > InventoryItem.reorder_level)
+
+        return query.order_by(InventoryItem.name)
+
     def get_low_stock_items(self) -> List[InventoryItem]:
         """Get items that are below reorder level"""
         return self.session.query(InventoryItem) \
@@ -85,14 +117,14 @@ class InventoryDAO:
         self.session.add(transaction)
 
         # Add audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=user_id,
             action='UPDATE',
             table_name='inventory_items',
             record_id=item_id,
             details=f'Updated quantity by {quantity_change}: {transaction_type}'
         )
-        self.session.add(audit)
 
         self.session.commit()
         return item
@@ -109,14 +141,14 @@ class InventoryDAO:
                 setattr(item, key, value)
 
         # Add audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=audit_user_id,
             action='UPDATE',
             table_name='inventory_items',
             record_id=item_id,
             details=f'Updated item details: {update_data}'
         )
-        self.session.add(audit)
 
         self.session.commit()
         return item
@@ -133,6 +165,29 @@ class InventoryDAO:
 
         return query.all()
 
+    def iter_transaction_rows(self, start_date: datetime, end_date: datetime,
+                              transaction_type: Optional[str] = None,
+                              batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Tuple]:
+        """Stream (date, item name, type, quantity, username, notes) rows for a date range"""
+        query = self.session.query(
+            InventoryTransaction.date,
+            InventoryItem.name,
+            InventoryTransaction.transaction_type,
+            InventoryTransaction.quantity,
+            User.username,
+            InventoryTransaction.notes
+        ) \
+            .join(InventoryItem, InventoryTransaction.inventory_item_id == InventoryItem.id) \
+            .join(User, InventoryTransaction.user_id == User.id) \
+            .filter(func.date(InventoryTransaction.date) >= start_date,
+                    func.date(InventoryTransaction.date) <= end_date) \
+            .order_by(InventoryTransaction.date.desc())
+
+        if transaction_type:
+            query = query.filter(InventoryTransaction.transaction_type == transaction_type)
+
+        return query.yield_per(batch_size)
+
     def get_inventory_value(self) -> float:
         """Calculate total inventory value"""
         result = self.session.query(
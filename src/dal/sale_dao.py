@@ -2,7 +2,8 @@ from typing import List, Optional, Dict, Tuple
 from datetime import datetime, date
 from sqlalchemy import func, and_, desc, asc
 from sqlalchemy.orm import Session, joinedload
-from src.database.models import Sale, SaleItem, InventoryItem, User, AuditLog
+from src.database.models import Sale, SaleItem, InventoryItem, User
+from src.dal.audit_queue import audit_queue
 
 
 class SaleDAO:
@@ -71,7 +72,8 @@ class SaleDAO:
                 )
 
             # Add inventory transaction audit
-            audit = AuditLog(
+            audit_queue.put(
+                self.session,
                 user_id=user_id,
                 action='UPDATE',
                 table_name='inventory_items',
@@ -79,17 +81,16 @@ class SaleDAO:
                 details=(f'Reduced quantity by {item["quantity"]} '
                          f'due to sale {sale.id}')
             )
-            self.session.add(audit)
 
         # Add sale audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=user_id,
             action='CREATE',
             table_name='sales',
             record_id=sale.id,
             details=f'Created sale: Total amount {total_amount}'
         )
-        self.session.add(audit)
 
         self.session.commit()
         return sale, warnings
@@ -125,6 +126,17 @@ class SaleDAO:
 
         return query.order_by(desc(Sale.date)).all()
 
+    def get_recent_sale_rows(self, start_date: date, limit: int) -> List[Tuple]:
+        """Newest sales since start_date as (id, date, total_amount, item_count) rows"""
+        return self.session.query(
+            Sale.id, Sale.date, Sale.total_amount, func.count(SaleItem.id)
+        ).outerjoin(Sale.sale_items) \
+            .filter(func.date(Sale.date) >= start_date) \
+            .group_by(Sale.id) \
+            .order_by(desc(Sale.date)) \
+            .limit(limit) \
+            .all()
+
     def get_daily_sales_summary(self, target_date: date) -> Dict:
         """Generate detailed daily sales summary"""
         # Get total sales and transaction count
@@ -335,24 +347,24 @@ class SaleDAO:
             inventory_item.quantity += sale_item.quantity
 
             # Add inventory adjustment audit
-            audit = AuditLog(
+            audit_queue.put(
+                self.session,
                 user_id=user_id,
                 action='UPDATE',
                 table_name='inventory_items',
                 record_id=inventory_item.id,
                 details=f'Restored quantity {sale_item.quantity} due to void of sale {sale_id}'
             )
-            self.session.add(audit)
 
         # Add void audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=user_id,
             action='VOID',
             table_name='sales',
             record_id=sale_id,
             details=f'Voided sale: {reason}'
         )
-        self.session.add(audit)
 
         # Delete sale items and sale
         for sale_item in sale.sale_items:
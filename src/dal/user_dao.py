@@ -1,12 +1,16 @@
 from typing import Optional, List
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
-from src.database.models import User, AuditLog, UserRole
+from sqlalchemy import or_, and_, select, lambda_stmt
+from src.database.models import User, UserRole
+from src.dal.audit_queue import audit_queue
 from src.utils.logger import log_function_call
 
 
 class UserDAO:
+    # Columns update_user may touch; id, password_hash and reset tokens have dedicated paths
+    _UPDATABLE = frozenset({'username', 'email', 'role', 'last_login'})
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -29,14 +33,14 @@ class UserDAO:
 
         # Use the provided auditor's ID; fall back to the new user's own ID
         effective_auditor = audit_user_id if audit_user_id is not None else user.id
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=effective_auditor,
             action='CREATE',
             table_name='users',
             record_id=user.id,
             details=f'Created new user: {username}'
         )
-        self.session.add(audit)
         self.session.commit()
         return user
 
@@ -58,11 +62,13 @@ class UserDAO:
     @log_function_call
     def get_users(self, search_term: Optional[str] = None, role: Optional[UserRole] = None) -> List[User]:
         """Get all active users, optionally filtered by search term and role"""
-        query = self.session.query(User).filter_by(is_active=True)
+        # lambda_stmt caches one compiled form per filter combination; the
+        # search term and role are picked up as bound parameters
+        stmt = lambda_stmt(lambda: select(User).where(User.is_active == True))
 
         if search_term:
             search = f"%{search_term}%"
-            query = query.filter(
+            stmt += lambda s: s.where(
                 or_(
                     User.username.ilike(search),
                     User.email.ilike(search)
@@ -70,9 +76,9 @@ class UserDAO:
             )
 
         if role:
-            query = query.filter_by(role=role)
+            stmt += lambda s: s.where(User.role == role)
 
-        return query.all()
+        return self.session.execute(stmt).scalars().all()
 
     @log_function_call
     def update_user(self, user_id: int, update_data: dict, audit_user_id: int) -> Optional[User]:
@@ -82,19 +88,18 @@ class UserDAO:
             return None
 
         # Update user attributes
-        for key, value in update_data.items():
-            if hasattr(user, key) and key not in ['id', 'password_hash']:
-                setattr(user, key, value)
+        for key in update_data.keys() & self._UPDATABLE:
+            setattr(user, key, update_data[key])
 
         # Add audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=audit_user_id,
             action='UPDATE',
             table_name='users',
             record_id=user_id,
             details=f'Updated user data: {update_data}'
         )
-        self.session.add(audit)
 
         self.session.commit()
         return user
@@ -111,14 +116,14 @@ class UserDAO:
         user.reset_token_expiry = None
 
         # Add audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=audit_user_id,
             action='UPDATE',
             table_name='users',
             record_id=user_id,
             details='Updated user password'
         )
-        self.session.add(audit)
 
         self.session.commit()
         return True
@@ -157,14 +162,14 @@ class UserDAO:
         user.is_active = False
 
         # Add audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=audit_user_id,
             action='DEACTIVATE',
             table_name='users',
             record_id=user_id,
             details=f'Deactivated user: {user.username}'
         )
-        self.session.add(audit)
 
         self.session.commit()
         return True
@@ -179,14 +184,14 @@ class UserDAO:
         user.is_active = True
 
         # Add audit log
-        audit = AuditLog(
+        audit_queue.put(
+            self.session,
             user_id=audit_user_id,
             action='REACTIVATE',
             table_name='users',
             record_id=user_id,
             details=f'Reactivated user: {user.username}'
         )
-        self.session.add(audit)
 
         self.session.commit()
         return True
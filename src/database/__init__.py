@@ -2,9 +2,6 @@
 Database configuration and models for the Brew and Bite Café Management System.
 """
 
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
-from src.config import DATABASE_URL
 from src.database.models import (
     Base,
     User,
@@ -17,17 +14,16 @@ from src.database.models import (
     AuditLog,
     UserRole
 )
+# One engine and thread-local session registry for the whole application
 from src.database.database import (
+    engine,
+    Session,
     initialize_database,
     get_session,
     backup_database,
     session_scope
 )
 
-# Create engine and session factory
-engine = create_engine(DATABASE_URL, echo=False)
-Session = sessionmaker(bind=engine)
-
 __all__ = [
     'Base',
     'User',
@@ -1,8 +1,10 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
+import functools
 
 Base = declarative_base()
 
@@ -13,6 +15,33 @@ class UserRole(enum.Enum):
     STAFF = "STAFF"
 
 
+@functools.lru_cache(maxsize=8)
+def _role_to_db(value) -> str:
+    return value.value if isinstance(value, UserRole) else UserRole(value.upper()).value
+
+
+@functools.lru_cache(maxsize=8)
+def _role_from_db(value: str) -> UserRole:
+    # schema.sql seeds lowercase roles
+    return UserRole(value.upper())
+
+
+class RoleType(TypeDecorator):
+    """Stores UserRole as its plain string value (matches schema.sql VARCHAR)."""
+    impl = String(20)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return _role_to_db(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _role_from_db(value)
+
+
 class User(Base):
     __tablename__ = 'users'
 
@@ -20,7 +49,7 @@ class User(Base):
     username = Column(String(50), unique=True, nullable=False)
     email = Column(String(100), unique=True, nullable=False)
     password_hash = Column(String(256), nullable=False)
-    role = Column(Enum(UserRole), default=UserRole.STAFF)
+    role = Column(RoleType, default=UserRole.STAFF)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     last_login = Column(DateTime)
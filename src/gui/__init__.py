@@ -3,14 +3,20 @@ Graphical User Interface (GUI) package for the Brew and Bite Café Management Sy
 Implements all GUI screens and dialogs using tkinter.
 """
 
-from src.gui.login_window import LoginWindow
-from src.gui.main_window import MainWindow
-from src.gui.sales_screen import SalesScreen
-from src.gui.inventory_screen import InventoryScreen
-from src.gui.expense_screen import ExpenseScreen
-from src.gui.reports_screen import ReportsScreen
-from src.gui.user_management_screen import UserManagementScreen
-from src.gui.settings_screen import SettingsScreen
+import importlib
+
+# Screens are loaded on first access so importing the login window does not
+# pull in every other view
+_MODULES = {
+    'LoginWindow': 'login_window',
+    'MainWindow': 'main_window',
+    'SalesScreen': 'sales_screen',
+    'InventoryScreen': 'inventory_screen',
+    'ExpenseScreen': 'expense_screen',
+    'ReportsScreen': 'reports_screen',
+    'UserManagementScreen': 'user_management_screen',
+    'SettingsScreen': 'settings_screen'
+}
 
 __all__ = [
     'LoginWindow',
@@ -24,4 +30,11 @@ __all__ = [
 ]
 
 # GUI Version
-__version__ = '1.0.0'
\ No newline at end of file
+__version__ = '1.0.0'
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        module = importlib.import_module(f'src.gui.{_MODULES[name]}')
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Background service calls for the GUI.
+
+Slow queries and exports run on a single worker thread per screen so the
+window stays responsive. The worker uses its own services on its own scoped
+session, as SQLAlchemy sessions are not thread-safe, and results are handed
+back to the Tk thread by polling with after().
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+from src.bll import create_services
+from src.database.database import Session, get_session
+
+_POLL_MS = 50
+
+
+class BackgroundWorker:
+    """Mixin giving a screen one worker thread with its own services"""
+
+    def _start_worker(self, name: str) -> None:
+        # Single worker so service calls from the screen never overlap
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._worker_services = None
+
+    def _worker_widget(self):
+        """Widget the results are delivered through; they are dropped once it is destroyed"""
+        return self
+
+    def _run_in_background(self, func, on_done, on_error, buttons=()):
+        """Run func on the worker thread; on_done/on_error are called back on the Tk thread"""
+        widget = self._worker_widget()
+        for button in buttons:
+            button.configure(state="disabled")
+        future = self._executor.submit(self._call_in_worker, func)
+
+        def poll():
+            if not widget.winfo_exists():
+                return
+            if not future.done():
+                widget.after(_POLL_MS, poll)
+                return
+            for button in buttons:
+                button.configure(state="normal")
+            try:
+                result = future.result()
+            except Exception as e:
+                on_error(e)
+            else:
+                on_done(result)
+
+        widget.after(_POLL_MS, poll)
+
+    @staticmethod
+    def _call_in_worker(func):
+        """func() on the worker thread, closing its session afterwards so the next call reads fresh rows"""
+        try:
+            return func()
+        finally:
+            # Session is a scoped_session, so this only closes the worker's own session
+            Session.close()
+
+    def _get_worker_services(self) -> Dict:
+        """Services for the worker thread, created on first use"""
+        if self._worker_services is None:
+            # Session is a scoped_session, so this is the worker thread's own session
+            self._worker_services = create_services(get_session())
+        return self._worker_services
+
+    def _stop_worker(self) -> None:
+        """Drop the worker's session and let the thread exit once queued calls finish"""
+        self._executor.submit(Session.remove)
+        self._executor.shutdown(wait=False)
@@ -1,28 +1,236 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import functools
 import logging
+import threading
 from datetime import datetime
 import webbrowser
 
+from src.gui.styles import init_fonts
+
 logger = logging.getLogger(__name__)
 
 
-class AboutDialog:
+
+_OVERVIEW_TEXT = """\
+Welcome to the Brew and Bite Café Management System!
+
+This application helps you manage your café operations effectively by providing:
+• Sales tracking and management
+• Inventory control
+• Expense management
+• Financial reporting
+• User management
+
+Each module is designed to be intuitive and easy to use while providing
+powerful features for managing your business."""
+
+_REQUIREMENTS_TEXT = """\
+• At least 8 characters
+• One uppercase letter
+• One lowercase letter
+• One number
+• One special character"""
+
+# User manual content: tab name -> ((section title, body), ...)
+MANUAL_SECTIONS = {
+    "Sales": (
+        ("Recording Sales", """\
+To record a new sale:
+1. Click the "New Sale" button
+2. Select items from inventory
+3. Specify quantities
+4. Choose payment method
+5. Complete the sale
+
+The system will automatically update inventory and generate a receipt.
+"""),
+        ("Managing Sales History", """\
+View and manage past sales:
+• Filter by date range
+• Search by transaction ID
+• Export sales reports
+• Void transactions (requires manager approval)
+"""),
+        ("Reports & Analytics", """\
+The sales module provides:
+• Daily sales summaries
+• Best-selling items
+• Payment method breakdown
+• Staff performance metrics
+""")
+    ),
+    "Inventory": (
+        ("Managing Stock", """\
+Keep track of your inventory:
+1. Add new items with details
+2. Update quantities
+3. Set reorder levels
+4. Track stock movements
+
+The system will alert you when items are running low.
+"""),
+        ("Stock Adjustments", """\
+Adjust inventory levels:
+• Record new stock arrivals
+• Handle damaged/expired items
+• Transfer stock
+• Conduct stock takes
+"""),
+        ("Reports", """\
+Monitor your inventory:
+• Current stock levels
+• Stock movement history
+• Low stock alerts
+• Valuation reports
+""")
+    ),
+    "Expenses": (
+        ("Recording Expenses", """\
+Track all business expenses:
+1. Select expense category
+2. Enter amount and details
+3. Attach receipts (optional)
+4. Save the record
+
+Expenses are categorized for better tracking.
+"""),
+        ("Categories", """\
+Manage expense categories:
+• Create custom categories
+• Set budgets
+• Track spending by category
+• Generate category reports
+"""),
+        ("Analysis", """\
+Analyze your expenses:
+• Monthly summaries
+• Category breakdown
+• Budget vs. Actual
+• Trend analysis
+""")
+    ),
+    "Reports": (
+        ("Available Reports", """\
+The system provides various reports:
+• Daily Sales Summary
+• Inventory Status
+• Expense Analysis
+• Profit & Loss
+• Staff Performance
+"""),
+        ("Generating Reports", """\
+To generate a report:
+1. Select report type
+2. Choose date range
+3. Apply any filters
+4. Generate report
+5. Export if needed
+"""),
+        ("Customization", """\
+Customize your reports:
+• Select specific metrics
+• Choose display format
+• Save report templates
+• Schedule automated reports
+""")
+    ),
+    "Settings": (
+        ("User Management", """\
+Manage system users:
+• Add/remove users
+• Set permissions
+• Reset passwords
+• View user activity
+"""),
+        ("System Settings", """\
+Configure the system:
+• Email settings
+• Backup options
+• Display preferences
+• Regional settings
+"""),
+        ("Data Management", """\
+Manage your data:
+• Create backups
+• Restore from backup
+• Export data
+• Clear old records
+""")
+    )
+}
+
+
+def _grab_when_mapped(dialog):
+    """Take the modal grab once the dialog is mapped rather than during construction"""
+    def on_map(event):
+        if event.widget is dialog:
+            dialog.unbind("<Map>", funcid)
+            dialog.grab_set()
+    funcid = dialog.bind("<Map>", on_map, add="+")
+
+
+def _center(dialog, parent, w, h):
+    """Place a w x h dialog over the middle of parent without an idletasks flush"""
+    x = parent.winfo_rootx() + (parent.winfo_width() - w) // 2
+    y = parent.winfo_rooty() + (parent.winfo_height() - h) // 2
+    dialog.geometry(f"{w}x{h}+{x}+{y}")
+
+
+class _CachedDialog:
+    """Static dialog that is built once and then re-shown instead of rebuilt"""
+    _instance = None
+    _size = (400, 300)
+
+    def _reuse(self, parent) -> bool:
+        """Re-open the cached dialog over parent; False if one must be built"""
+        cached = type(self)._instance
+        if cached is None or not cached.dialog.winfo_exists():
+            return False
+
+        self.dialog = cached.dialog
+        self.dialog.transient(parent)
+        _center(self.dialog, parent, *self._size)
+        _grab_when_mapped(self.dialog)
+        self.dialog.deiconify()
+        return True
+
+    def _cache(self, parent):
+        """Keep this dialog for later opens; _reuse builds a new one once it is destroyed"""
+        type(self)._instance = self
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
+
+    def close(self):
+        """Hide the dialog so the next open can reuse it"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+
+
+class AboutDialog(_CachedDialog):
+    _size = (400, 500)
+
     def __init__(self, parent):
+        if self._reuse(parent):
+            return
+
+        init_fonts(parent)
         self.dialog = tk.Toplevel(parent)
+        # Stay hidden until fully built so the window maps only once
+        self.dialog.withdraw()
         self.dialog.title("About")
         self.dialog.geometry("400x500")
+        self.dialog.minsize(400, 500)
+        self.dialog.maxsize(400, 500)
         self.dialog.resizable(False, False)
-        self.dialog.grab_set()
+        _grab_when_mapped(self.dialog)
 
         self.create_widgets()
 
         # Center dialog on parent
         self.dialog.transient(parent)
-        self.dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.dialog.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.dialog.winfo_height()) // 2
-        self.dialog.geometry(f"+{x}+{y}")
+        _center(self.dialog, parent, *self._size)
+        self._cache(parent)
+        self.dialog.deiconify()
 
     def create_widgets(self):
         """Create dialog widgets"""
@@ -30,13 +238,13 @@ class AboutDialog:
         ttk.Label(
             self.dialog,
             text="Brew and Bite Café",
-            font=("Helvetica", 20, "bold")
+            font="BB_H20B"
         ).pack(pady=20)
 
         ttk.Label(
             self.dialog,
             text="Management System",
-            font=("Helvetica", 12)
+            font="BB_H12"
         ).pack()
 
         # Version info
@@ -55,7 +263,7 @@ class AboutDialog:
             ttk.Label(
                 info_frame,
                 text=label,
-                font=("Helvetica", 10, "bold")
+                font="BB_H10B"
             ).pack(anchor="w", pady=2)
             ttk.Label(
                 info_frame,
@@ -66,7 +274,7 @@ class AboutDialog:
         ttk.Label(
             self.dialog,
             text="Developed by:",
-            font=("Helvetica", 10, "bold")
+            font="BB_H10B"
         ).pack(pady=(20, 5))
 
         ttk.Label(
@@ -81,38 +289,46 @@ class AboutDialog:
         ttk.Button(
             link_frame,
             text="Documentation",
-            command=lambda: webbrowser.open("https://docs.brewandbite.com")
+            command=functools.partial(webbrowser.open, "https://docs.brewandbite.com")
         ).pack(side="left", padx=5)
 
         ttk.Button(
             link_frame,
             text="Support",
-            command=lambda: webbrowser.open("https://support.brewandbite.com")
+            command=functools.partial(webbrowser.open, "https://support.brewandbite.com")
         ).pack(side="left", padx=5)
 
         # Close button
         ttk.Button(
             self.dialog,
             text="Close",
-            command=self.dialog.destroy
+            command=self.close
         ).pack(pady=20)
 
 
-class UserManualDialog:
+class UserManualDialog(_CachedDialog):
+    _size = (800, 600)
+
     def __init__(self, parent):
+        if self._reuse(parent):
+            return
+
+        init_fonts(parent)
         self.dialog = tk.Toplevel(parent)
+        # Stay hidden until fully built so the window maps only once
+        self.dialog.withdraw()
         self.dialog.title("User Manual")
         self.dialog.geometry("800x600")
-        self.dialog.grab_set()
+        self.dialog.minsize(800, 600)
+        _grab_when_mapped(self.dialog)
 
         self.create_widgets()
 
         # Center dialog
         self.dialog.transient(parent)
-        self.dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.dialog.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.dialog.winfo_height()) // 2
-        self.dialog.geometry(f"+{x}+{y}")
+        _center(self.dialog, parent, *self._size)
+        self._cache(parent)
+        self.dialog.deiconify()
 
     def create_widgets(self):
         """Create dialog widgets"""
@@ -127,301 +343,88 @@ class UserManualDialog:
         ttk.Label(
             overview_tab,
             text="Brew and Bite Café Management System",
-            font=("Helvetica", 16, "bold")
+            font="BB_H16B"
         ).pack(pady=20)
 
-        overview_text = """
-        Welcome to the Brew and Bite Café Management System!
-
-        This application helps you manage your café operations effectively by providing:
-        • Sales tracking and management
-        • Inventory control
-        • Expense management
-        • Financial reporting
-        • User management
-
-        Each module is designed to be intuitive and easy to use while providing
-        powerful features for managing your business.
-        """
-
         ttk.Label(
             overview_tab,
-            text=overview_text,
+            text=_OVERVIEW_TEXT,
             wraplength=700,
             justify="left"
         ).pack(padx=20, pady=10)
 
-        # Create tabs for each main feature
-        self.create_sales_tab(notebook)
-        self.create_inventory_tab(notebook)
-        self.create_expenses_tab(notebook)
-        self.create_reports_tab(notebook)
-        self.create_settings_tab(notebook)
+        # Feature tabs are built the first time they are selected
+        self._builders = {}
+        for name in MANUAL_SECTIONS:
+            tab = ttk.Frame(notebook)
+            notebook.add(tab, text=name)
+            self._builders[str(tab)] = name
+
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Close button
         ttk.Button(
             self.dialog,
             text="Close",
-            command=self.dialog.destroy
+            command=self.close
         ).pack(pady=10)
 
-    def create_sales_tab(self, notebook):
-        """Create sales documentation tab"""
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text="Sales")
-
-        content = ttk.Frame(tab, padding=20)
+    def _on_tab_changed(self, event):
+        """Build a feature tab on first selection"""
+        notebook = event.widget
+        name = self._builders.pop(notebook.select(), None)
+        if name:
+            self._build_doc_tab(notebook.nametowidget(notebook.select()), name)
+
+    def _build_doc_tab(self, tab, name):
+        """Fill a documentation tab from MANUAL_SECTIONS"""
+        # Fixed-size frame: children don't push size requests up to the notebook
+        content = ttk.Frame(tab, padding=20, width=760, height=520)
+        content.pack_propagate(False)
         content.pack(fill="both", expand=True)
 
-        # Add sales documentation
-        sections = [
-            ("Recording Sales", """
-            To record a new sale:
-            1. Click the "New Sale" button
-            2. Select items from inventory
-            3. Specify quantities
-            4. Choose payment method
-            5. Complete the sale
-
-            The system will automatically update inventory and generate a receipt.
-            """),
-
-            ("Managing Sales History", """
-            View and manage past sales:
-            • Filter by date range
-            • Search by transaction ID
-            • Export sales reports
-            • Void transactions (requires manager approval)
-            """),
-
-            ("Reports & Analytics", """
-            The sales module provides:
-            • Daily sales summaries
-            • Best-selling items
-            • Payment method breakdown
-            • Staff performance metrics
-            """)
-        ]
-
-        for title, text in sections:
-            ttk.Label(
-                content,
-                text=title,
-                font=("Helvetica", 12, "bold")
-            ).pack(anchor="w", pady=(10, 5))
-
-            ttk.Label(
-                content,
-                text=text,
-                wraplength=700,
-                justify="left"
-            ).pack(anchor="w", padx=20, pady=(0, 10))
-
-    def create_inventory_tab(self, notebook):
-        """Create inventory documentation tab"""
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text="Inventory")
-
-        content = ttk.Frame(tab, padding=20)
-        content.pack(fill="both", expand=True)
-
-        sections = [
-            ("Managing Stock", """
-            Keep track of your inventory:
-            1. Add new items with details
-            2. Update quantities
-            3. Set reorder levels
-            4. Track stock movements
-
-            The system will alert you when items are running low.
-            """),
-
-            ("Stock Adjustments", """
-            Adjust inventory levels:
-            • Record new stock arrivals
-            • Handle damaged/expired items
-            • Transfer stock
-            • Conduct stock takes
-            """),
-
-            ("Reports", """
-            Monitor your inventory:
-            • Current stock levels
-            • Stock movement history
-            • Low stock alerts
-            • Valuation reports
-            """)
-        ]
-
-        for title, text in sections:
-            ttk.Label(
-                content,
-                text=title,
-                font=("Helvetica", 12, "bold")
-            ).pack(anchor="w", pady=(10, 5))
-
-            ttk.Label(
-                content,
-                text=text,
-                wraplength=700,
-                justify="left"
-            ).pack(anchor="w", padx=20, pady=(0, 10))
-
-    def create_expenses_tab(self, notebook):
-        """Create expenses documentation tab"""
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text="Expenses")
-
-        content = ttk.Frame(tab, padding=20)
-        content.pack(fill="both", expand=True)
-
-        sections = [
-            ("Recording Expenses", """
-            Track all business expenses:
-            1. Select expense category
-            2. Enter amount and details
-            3. Attach receipts (optional)
-            4. Save the record
-
-            Expenses are categorized for better tracking.
-            """),
-
-            ("Categories", """
-            Manage expense categories:
-            • Create custom categories
-            • Set budgets
-            • Track spending by category
-            • Generate category reports
-            """),
-
-            ("Analysis", """
-            Analyze your expenses:
-            • Monthly summaries
-            • Category breakdown
-            • Budget vs. Actual
-            • Trend analysis
-            """)
-        ]
-
-        for title, text in sections:
-            ttk.Label(
-                content,
-                text=title,
-                font=("Helvetica", 12, "bold")
-            ).pack(anchor="w", pady=(10, 5))
-
-            ttk.Label(
-                content,
-                text=text,
-                wraplength=700,
-                justify="left"
-            ).pack(anchor="w", padx=20, pady=(0, 10))
-
-    def create_reports_tab(self, notebook):
-        """Create reports documentation tab"""
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text="Reports")
-
-        content = ttk.Frame(tab, padding=20)
-        content.pack(fill="both", expand=True)
-
-        sections = [
-            ("Available Reports", """
-            The system provides various reports:
-            • Daily Sales Summary
-            • Inventory Status
-            • Expense Analysis
-            • Profit & Loss
-            • Staff Performance
-            """),
-
-            ("Generating Reports", """
-            To generate a report:
-            1. Select report type
-            2. Choose date range
-            3. Apply any filters
-            4. Generate report
-            5. Export if needed
-            """),
-
-            ("Customization", """
-            Customize your reports:
-            • Select specific metrics
-            • Choose display format
-            • Save report templates
-            • Schedule automated reports
-            """)
-        ]
-
-        for title, text in sections:
-            ttk.Label(
-                content,
-                text=title,
-                font=("Helvetica", 12, "bold")
-            ).pack(anchor="w", pady=(10, 5))
-
-            ttk.Label(
-                content,
-                text=text,
-                wraplength=700,
-                justify="left"
-            ).pack(anchor="w", padx=20, pady=(0, 10))
-
-    def create_settings_tab(self, notebook):
-        """Create settings documentation tab"""
-        tab = ttk.Frame(notebook)
-        notebook.add(tab, text="Settings")
-
-        content = ttk.Frame(tab, padding=20)
-        content.pack(fill="both", expand=True)
-
-        sections = [
-            ("User Management", """
-            Manage system users:
-            • Add/remove users
-            • Set permissions
-            • Reset passwords
-            • View user activity
-            """),
-
-            ("System Settings", """
-            Configure the system:
-            • Email settings
-            • Backup options
-            • Display preferences
-            • Regional settings
-            """),
-
-            ("Data Management", """
-            Manage your data:
-            • Create backups
-            • Restore from backup
-            • Export data
-            • Clear old records
-            """)
-        ]
-
-        for title, text in sections:
-            ttk.Label(
-                content,
-                text=title,
-                font=("Helvetica", 12, "bold")
-            ).pack(anchor="w", pady=(10, 5))
-
-            ttk.Label(
-                content,
-                text=text,
-                wraplength=700,
-                justify="left"
-            ).pack(anchor="w", padx=20, pady=(0, 10))
+        # One read-only Text widget instead of a label pair per section
+        txt = tk.Text(content, wrap="word", font="TkDefaultFont",
+                      borderwidth=0, highlightthickness=0)
+        txt.tag_configure("h", font="BB_H12B")
+        for title, text in MANUAL_SECTIONS[name]:
+            txt.insert("end", title + "\n", "h")
+            txt.insert("end", text + "\n")
+        # The frame fixes the size; the text scrolls inside it
+        txt.configure(state="disabled")
+
+        scrollbar = ttk.Scrollbar(content, orient="vertical", command=txt.yview)
+        txt.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        txt.pack(side="left", fill="both", expand=True)
+
+
+def _password_meets_requirements(password: str) -> bool:
+    """Single-pass check of the requirements listed in ChangePasswordDialog"""
+    has = 0
+    for ch in password:
+        if ch.isupper():
+            has |= 1
+        elif ch.islower():
+            has |= 2
+        elif ch.isdigit():
+            has |= 4
+        elif not ch.isalnum():
+            has |= 8
+    return len(password) >= 8 and has == 15
 
 
 class ChangePasswordDialog:
     def __init__(self, parent, auth_service, user_id):
+        init_fonts(parent)
         self.dialog = tk.Toplevel(parent)
+        # Stay hidden until fully built so the window maps only once
+        self.dialog.withdraw()
         self.dialog.title("Change Password")
         self.dialog.geometry("400x300")
-        self.dialog.grab_set()
+        self.dialog.minsize(400, 300)
+        self.dialog.maxsize(400, 300)
+        _grab_when_mapped(self.dialog)
 
         self.auth_service = auth_service
         self.user_id = user_id
@@ -430,10 +433,8 @@ class ChangePasswordDialog:
 
         # Center dialog
         self.dialog.transient(parent)
-        self.dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.dialog.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.dialog.winfo_height()) // 2
-        self.dialog.geometry(f"+{x}+{y}")
+        _center(self.dialog, parent, 400, 300)
+        self.dialog.deiconify()
 
     def create_widgets(self):
         """Create dialog widgets"""
@@ -465,7 +466,9 @@ class ChangePasswordDialog:
             form_frame,
             textvariable=self.new_password_var,
             show="*",
-            width=30
+            width=30,
+            validate="key",
+            validatecommand=(self.dialog.register(self._validate_new_password), "%P")
         ).pack(fill="x", pady=(0, 10))
 
         # Confirm new password
@@ -483,24 +486,17 @@ class ChangePasswordDialog:
         ).pack(fill="x", pady=(0, 10))
 
         # Password requirements
-        ttk.Label(
+        self.requirements_label = ttk.Label(
             form_frame,
             text="Password must contain:",
-            font=("Helvetica", 9, "bold")
-        ).pack(anchor="w", pady=(10, 5))
-
-        requirements_text = """
-                • At least 8 characters
-                • One uppercase letter
-                • One lowercase letter
-                • One number
-                • One special character
-                """
+            font="BB_H9B"
+        )
+        self.requirements_label.pack(anchor="w", pady=(10, 5))
 
         ttk.Label(
             form_frame,
-            text=requirements_text,
-            font=("Helvetica", 9),
+            text=_REQUIREMENTS_TEXT,
+            font="BB_H9",
             justify="left"
         ).pack(anchor="w", padx=20)
 
@@ -508,11 +504,14 @@ class ChangePasswordDialog:
         button_frame = ttk.Frame(form_frame)
         button_frame.pack(pady=20)
 
-        ttk.Button(
+        # Enabled by _validate_new_password once the requirements are met
+        self.change_button = ttk.Button(
             button_frame,
             text="Change Password",
-            command=self.change_password
-        ).pack(side="left", padx=5)
+            command=self.change_password,
+            state="disabled"
+        )
+        self.change_button.pack(side="left", padx=5)
 
         ttk.Button(
             button_frame,
@@ -520,6 +519,15 @@ class ChangePasswordDialog:
             command=self.dialog.destroy
         ).pack(side="left", padx=5)
 
+    def _validate_new_password(self, candidate):
+        """Live requirements check on each keystroke; never rejects the edit"""
+        ok = _password_meets_requirements(candidate)
+        self.requirements_label.configure(
+            text=("✓ " if ok else "") + "Password must contain:"
+        )
+        self.change_button.configure(state="normal" if ok else "disabled")
+        return True
+
     def change_password(self):
         """Handle password change"""
         try:
@@ -534,6 +542,10 @@ class ChangePasswordDialog:
             if new_password != confirm_password:
                 raise ValueError("New passwords do not match")
 
+            # Fail fast before the service does its own (slower) checks
+            if not _password_meets_requirements(new_password):
+                raise ValueError("New password does not meet the requirements")
+
             # Attempt to change password
             success = self.auth_service.change_password(
                 user_id=self.user_id,
@@ -559,12 +571,17 @@ class ChangePasswordDialog:
             logger.error(f"Error changing password: {str(e)}")
             messagebox.showerror("Error", "Failed to change password")
 
+
 class BackupDialog:
     def __init__(self, parent, settings_service):
+        init_fonts(parent)
         self.dialog = tk.Toplevel(parent)
+        # Stay hidden until fully built so the window maps only once
+        self.dialog.withdraw()
         self.dialog.title("Database Backup")
         self.dialog.geometry("500x400")
-        self.dialog.grab_set()
+        self.dialog.minsize(500, 400)
+        _grab_when_mapped(self.dialog)
 
         self.settings_service = settings_service
 
@@ -572,10 +589,8 @@ class BackupDialog:
 
         # Center dialog
         self.dialog.transient(parent)
-        self.dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.dialog.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.dialog.winfo_height()) // 2
-        self.dialog.geometry(f"+{x}+{y}")
+        _center(self.dialog, parent, 500, 400)
+        self.dialog.deiconify()
 
     def create_widgets(self):
         """Create dialog widgets"""
@@ -586,7 +601,7 @@ class BackupDialog:
         ttk.Label(
             content_frame,
             text="Database Backup",
-            font=("Helvetica", 14, "bold")
+            font="BB_H14B"
         ).pack(pady=(0, 20))
 
         # Backup location
@@ -654,36 +669,40 @@ class BackupDialog:
         ).pack(side="left")
 
         self.frequency_var = tk.StringVar(value="daily")
-        ttk.Combobox(
-            self.schedule_options,
-            textvariable=self.frequency_var,
-            values=["daily", "weekly", "monthly"],
-            state="readonly",
-            width=15
-        ).pack(side="left", padx=5)
+        for frequency in ("daily", "weekly", "monthly"):
+            ttk.Radiobutton(
+                self.schedule_options,
+                text=frequency.capitalize(),
+                value=frequency,
+                variable=self.frequency_var
+            ).pack(side="left", padx=5)
 
         # Initially disable schedule options
         self.toggle_schedule_options()
 
+        # Progress bar, shown only while a backup is running
+        self.progress = ttk.Progressbar(content_frame, mode="indeterminate")
+
         # Buttons
-        button_frame = ttk.Frame(content_frame)
-        button_frame.pack(pady=20)
+        self.button_frame = ttk.Frame(content_frame)
+        self.button_frame.pack(pady=20)
 
-        ttk.Button(
-            button_frame,
+        self.start_button = ttk.Button(
+            self.button_frame,
             text="Start Backup",
             command=self.start_backup
-        ).pack(side="left", padx=5)
+        )
+        self.start_button.pack(side="left", padx=5)
 
         ttk.Button(
-            button_frame,
+            self.button_frame,
             text="Cancel",
             command=self.dialog.destroy
         ).pack(side="left", padx=5)
 
     def browse_location(self):
         """Browse for backup location"""
-        directory = tk.filedialog.askdirectory(
+        directory = filedialog.askdirectory(
             title="Select Backup Location"
         )
         if directory:
@@ -711,22 +730,51 @@ class BackupDialog:
                 }
             }
 
-            # Create backup
-            backup_file = self.settings_service.create_backup(options)
+            # Create backup on a worker thread so the dialog stays responsive
+            self._result = None
+            self.start_button.configure(state="disabled")
+            self.progress.pack(fill="x", pady=(0, 10), before=self.button_frame)
+            self.progress.start()
+            threading.Thread(target=self._do_backup, args=(options,), daemon=True).start()
+            self.dialog.after(100, self._poll_backup)
 
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+
+    def _do_backup(self, options):
+        """Run the backup (worker thread) and keep the outcome for _poll_backup"""
+        try:
+            self._result = (self.settings_service.create_backup(options), None)
+        except Exception as e:
+            self._result = (None, e)
+
+    def _poll_backup(self):
+        """Report the backup outcome once the worker thread has finished"""
+        if not self.dialog.winfo_exists():
+            return
+        if self._result is None:
+            self.dialog.after(100, self._poll_backup)
+            return
+
+        self.progress.stop()
+        self.progress.pack_forget()
+        self.start_button.configure(state="normal")
+
+        backup_file, error = self._result
+        if error is None:
             messagebox.showinfo(
                 "Success",
                 f"Backup created successfully!\nLocation: {backup_file}"
             )
             self.dialog.destroy()
-
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
-        except Exception as e:
-            logger.error(f"Error creating backup: {str(e)}")
+        elif isinstance(error, ValueError):
+            messagebox.showerror("Error", str(error))
+        else:
+            logger.error(f"Error creating backup: {str(error)}")
             messagebox.showerror("Error", "Failed to create backup")
 
-# Update dialog boxes registry
+
+# Dialog registry: dialogs[kind](parent, *args)
 dialogs = {
     'about': AboutDialog,
     'user_manual': UserManualDialog,
@@ -1,9 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import re
+import time
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional
+from src.gui.background import BackgroundWorker
 
 try:
     from src.gui.styles import (CREAM, CARD_BG, ESPRESSO, MEDIUM_BROWN, DARK_BROWN,
@@ -16,13 +19,65 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Expense rows are rendered in pages as the user scrolls towards the end
+_EXPENSE_PAGE_SIZE = 200
 
-class ExpenseScreen(ttk.Frame):
+# Seconds a generated analysis is reused for the same date range
+_ANALYSIS_CACHE_TTL = 30
+
+# Exports are streamed to disk through a buffer of this size
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+_AMOUNT_RE = re.compile(r'^\d+(\.\d{1,2})?$')
+
+
+def _parse_amount(text: str) -> Decimal:
+    """Parse a positive currency amount with at most two decimals"""
+    text = text.strip()
+    if not _AMOUNT_RE.match(text):
+        raise ValueError("Amount must be a positive number with at most 2 decimals")
+    amount = Decimal(text)
+    if amount <= 0:
+        raise ValueError("Amount must be a positive number")
+    return amount
+
+
+class _ScreenState:
+    """Non-widget state of an ExpenseScreen, kept in slots"""
+    __slots__ = (
+        'selected_expense', 'selected_full', 'editing_expense',
+        'categories', 'categories_by_name', 'category_names', 'combo_category_names',
+        'expense_rows', 'rendered_expenses', 'rendered_rows', 'analysis_cache',
+        'tab_initialized',
+    )
+
+    def __init__(self):
+        self.selected_expense = None  # stores row values; [0] = expense ID
+        self.selected_full = None  # get_expense_details() result for selected_expense
+        self.editing_expense = None
+        self.categories = None
+        self.categories_by_name = {}
+        self.category_names = ()
+        self.combo_category_names = {}  # combobox path -> names tuple it shows
+        self.expense_rows = []
+        self.rendered_expenses = 0
+        self.rendered_rows = {}  # tree iid (expense id) -> (values, tag) shown
+        self.analysis_cache = {}  # (start, end) -> (generated_at, analysis)
+        self.tab_initialized = {0}  # notebook tabs whose content is built
+
+
+class ExpenseScreen(BackgroundWorker, ttk.Frame):
     def __init__(self, parent, services):
         super().__init__(parent)
         self.parent = parent
         self.services = services
-        self.selected_expense = None  # stores row values; [0] = expense ID
+        self._s = _ScreenState()
+        # Dialogs are built on first use and withdrawn, not destroyed, on close
+        self._add_dialog = None
+        self._edit_dialog = None
+        self._details_dialog = None
+        self._start_worker("expense-screen")
+        self.bind("<Destroy>", self._on_destroy)
 
         self.create_widgets()
         self.load_data()
@@ -67,8 +122,13 @@ class ExpenseScreen(ttk.Frame):
         self.notebook.pack(fill="both", expand=True, padx=12, pady=8)
 
         self.create_expenses_tab()
-        self.create_categories_tab()
-        self.create_analysis_tab()
+
+        # Categories and analysis are built the first time their tab is shown
+        self.categories_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.categories_tab, text="Categories")
+        self.analysis_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.analysis_tab, text="Analysis")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self.pack(fill="both", expand=True)
 
@@ -110,11 +170,13 @@ class ExpenseScreen(ttk.Frame):
             state="readonly", width=18)
         self.category_combo.pack(side="left", padx=(4, 16))
 
-        ttk.Button(filter_bar, text="Search",
-                   command=self.load_expenses).pack(side="left", padx=(0, 4))
-        ttk.Button(filter_bar, text="Export CSV",
-                   style="Secondary.TButton" if _HAS_STYLES else "TButton",
-                   command=self.export_expenses).pack(side="right")
+        self.search_btn = ttk.Button(filter_bar, text="Search",
+                                     command=self.load_expenses)
+        self.search_btn.pack(side="left", padx=(0, 4))
+        self.export_btn = ttk.Button(filter_bar, text="Export CSV",
+                                     style="Secondary.TButton" if _HAS_STYLES else "TButton",
+                                     command=self.export_expenses)
+        self.export_btn.pack(side="right")
 
         # Create expenses treeview (ID is column 0, hidden with width=0)
         columns = ("ID", "Date", "Category", "Amount", "Description", "Added By")
@@ -140,16 +202,16 @@ class ExpenseScreen(ttk.Frame):
         self.expenses_tree.column("Added By", width=100)
 
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(
+        self.expenses_scrollbar = ttk.Scrollbar(
             tab,
             orient="vertical",
             command=self.expenses_tree.yview
         )
-        self.expenses_tree.configure(yscrollcommand=scrollbar.set)
+        self.expenses_tree.configure(yscrollcommand=self._on_expenses_scroll)
 
         # Pack treeview and scrollbar
         self.expenses_tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.expenses_scrollbar.pack(side="right", fill="y")
 
         # Alternating row colours
         self.expenses_tree.tag_configure('odd',  background="#F9F5F0")
@@ -164,10 +226,22 @@ class ExpenseScreen(ttk.Frame):
         self.context_menu.add_separator()
         self.context_menu.add_command(label="View Details",   command=self.show_expense_details)
 
-    def create_categories_tab(self):
+    def _on_tab_changed(self, event=None):
+        """Build a tab's content and load its data on first selection"""
+        index = self.notebook.index("current")
+        if index in self._s.tab_initialized:
+            return
+        self._s.tab_initialized.add(index)
+
+        if index == 1:
+            self.create_categories_tab(self.categories_tab)
+            self.load_categories()
+        elif index == 2:
+            self.create_analysis_tab(self.analysis_tab)
+            self.generate_analysis()
+
+    def create_categories_tab(self, tab):
         """Create expense categories management view"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Categories")
 
         # Split frame for category list and editor
         split_frame = ttk.Frame(tab)
@@ -211,12 +285,8 @@ class ExpenseScreen(ttk.Frame):
 
         # Category editor fields
         ttk.Label(right_frame, text="Category Name:").pack(pady=5)
-        self.category_name_var = tk.StringVar()
-        ttk.Entry(
-            right_frame,
-            textvariable=self.category_name_var,
-            width=30
-        ).pack(pady=5)
+        self.category_name_entry = ttk.Entry(right_frame, width=30)
+        self.category_name_entry.pack(pady=5)
 
         ttk.Label(right_frame, text="Type:").pack(pady=5)
         self.category_type_var = tk.StringVar(value="expense")
@@ -236,12 +306,8 @@ class ExpenseScreen(ttk.Frame):
         ).pack(side="left", padx=5)
 
         ttk.Label(right_frame, text="Description:").pack(pady=5)
-        self.category_desc_var = tk.StringVar()
-        ttk.Entry(
-            right_frame,
-            textvariable=self.category_desc_var,
-            width=30
-        ).pack(pady=5)
+        self.category_desc_entry = ttk.Entry(right_frame, width=30)
+        self.category_desc_entry.pack(pady=5)
 
         # Buttons
         buttons_frame = ttk.Frame(right_frame)
@@ -265,10 +331,8 @@ class ExpenseScreen(ttk.Frame):
             command=self.delete_category
         ).pack(side="left", padx=5)
 
-    def create_analysis_tab(self):
+    def create_analysis_tab(self, tab):
         """Create expense analysis view"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Analysis")
 
         # Controls frame
         controls_frame = ttk.Frame(tab)
@@ -295,50 +359,95 @@ class ExpenseScreen(ttk.Frame):
             width=10
         ).pack(side="left", padx=5)
 
-        ttk.Button(
+        self.generate_btn = ttk.Button(
             controls_frame,
             text="Generate",
             command=self.generate_analysis
-        ).pack(side="left", padx=5)
+        )
+        self.generate_btn.pack(side="left", padx=5)
 
-        ttk.Button(
+        self.export_analysis_btn = ttk.Button(
             controls_frame,
             text="Export",
             command=self.export_analysis
-        ).pack(side="right", padx=5)
+        )
+        self.export_analysis_btn.pack(side="right", padx=5)
 
         # Analysis content
         self.analysis_frame = ttk.Frame(tab)
         self.analysis_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self._stop_worker()
+
+    def _get_categories(self) -> List[Dict]:
+        """Expense categories, fetched once until invalidated"""
+        if self._s.categories is None:
+            cats = self.services['expense'].get_categories()
+            self._s.categories = cats
+            self._s.categories_by_name = {c['name']: c for c in cats}
+            self._s.category_names = tuple(c['name'] for c in cats)
+        return self._s.categories
+
+    def _set_category_values(self, combo):
+        """Point a combobox at the cached category names if they changed"""
+        self._get_categories()
+        names = self._s.category_names
+        if self._s.combo_category_names.get(str(combo)) is not names:
+            combo['values'] = names
+            self._s.combo_category_names[str(combo)] = names
+
+    def _category_id(self, name: str) -> int:
+        """Category id for name; raises KeyError if there is no such category"""
+        self._get_categories()
+        return self._s.categories_by_name[name]['id']
+
+    def _invalidate_categories(self):
+        """Drop cached categories after they change"""
+        self._s.categories = None
+        self._s.categories_by_name = {}
+        self._s.category_names = ()
+
     def load_data(self):
         """Load initial data"""
         try:
             # Load categories for combo box
-            categories = self.services['expense'].get_categories()
-            self.category_combo['values'] = ["All"] + [cat['name'] for cat in categories]
+            self._get_categories()
+            self.category_combo['values'] = ("All",) + self._s.category_names
 
-            # Load expenses
+            # Load expenses; the other tabs load when first opened
             self.load_expenses()
 
-            # Load categories
-            self.load_categories()
-
-            # Generate initial analysis
-            self.generate_analysis()
-
         except Exception as e:
-            logger.error(f"Error loading data: {str(e)}")
+            logger.error("Error loading data: %s", e)
             messagebox.showerror("Error", "Failed to load expense data")
 
+    def _show_dialog(self, dialog):
+        """Bring a previously built dialog back"""
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+
+    def _hide_dialog(self, dialog):
+        """Withdraw a reusable dialog instead of destroying it"""
+        dialog.grab_release()
+        dialog.withdraw()
+
     def show_add_expense_dialog(self):
         """Show dialog to add new expense"""
+        if self._add_dialog is not None:
+            self._reset_add_expense_dialog()
+            self._show_dialog(self._add_dialog)
+            return
+
         bg = CREAM if _HAS_STYLES else "#f0f0f0"
-        dialog = tk.Toplevel(self)
+        dialog = self._add_dialog = tk.Toplevel(self)
         dialog.title("Record Expense")
         dialog.geometry("440x440")
         dialog.resizable(False, False)
         dialog.configure(bg=bg)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
         dialog.grab_set()
 
         # Header
@@ -361,24 +470,24 @@ class ExpenseScreen(ttk.Frame):
 
         _lbl("Category *")
         category_var = tk.StringVar()
-        category_combo = ttk.Combobox(
+        category_combo = self._add_category_combo = ttk.Combobox(
             form, textvariable=category_var,
-            values=[cat['name'] for cat in self.services['expense'].get_categories()],
             state="readonly", width=36, font=FONT_BODY if _HAS_STYLES else None
         )
+        self._set_category_values(category_combo)
         category_combo.pack(fill="x")
 
         _lbl("Amount ($) *")
-        amount_entry = ttk.Entry(form, width=38)
+        amount_entry = self._add_amount_entry = ttk.Entry(form, width=38)
         amount_entry.pack(fill="x")
 
         _lbl("Date (YYYY-MM-DD)")
-        date_entry = ttk.Entry(form, width=38)
+        date_entry = self._add_date_entry = ttk.Entry(form, width=38)
         date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
         date_entry.pack(fill="x")
 
         _lbl("Description *")
-        desc_entry = ttk.Entry(form, width=38)
+        desc_entry = self._add_desc_entry = ttk.Entry(form, width=38)
         desc_entry.pack(fill="x")
 
         def save_expense():
@@ -388,184 +497,207 @@ class ExpenseScreen(ttk.Frame):
                 if not category:
                     raise ValueError("Please select a category")
 
-                try:
-                    amount = float(amount_entry.get())
-                    if amount <= 0:
-                        raise ValueError()
-                except ValueError:
-                    raise ValueError("Amount must be a positive number")
+                amount = _parse_amount(amount_entry.get())
 
                 description = desc_entry.get().strip()
                 if not description:
                     raise ValueError("Please enter a description")
 
-                cats = self.services['expense'].get_categories()
-                cat_match = next((c for c in cats if c['name'] == category), None)
-                if not cat_match:
+                try:
+                    category_id = self._category_id(category)
+                except KeyError:
                     raise ValueError("Selected category not found — please try again")
 
                 # Create expense
                 self.services['expense'].record_expense(
                     user_id=1,
-                    category_id=cat_match['id'],
+                    category_id=category_id,
                     amount=amount,
                     description=description,
                     expense_date=date_entry.get()
                 )
 
+                self._s.analysis_cache.clear()
                 messagebox.showinfo("Success", "Expense recorded successfully!")
-                dialog.destroy()
+                self._hide_dialog(dialog)
                 self.load_expenses()
 
             except ValueError as e:
                 messagebox.showerror("Validation Error", str(e))
             except Exception as e:
-                logger.error(f"Error recording expense: {e}")
+                logger.error("Error recording expense: %s", e)
                 messagebox.showerror("Error", "Failed to record expense")
 
         # Button row
         btn_frame = tk.Frame(dialog, bg=bg, pady=12)
         btn_frame.pack(fill="x", padx=28)
         ttk.Button(btn_frame, text="Cancel", style="Secondary.TButton" if _HAS_STYLES else "TButton",
-                   command=dialog.destroy).pack(side="right", padx=(6, 0))
+                   command=lambda: self._hide_dialog(dialog)).pack(side="right", padx=(6, 0))
         ttk.Button(btn_frame, text="Save Expense",
                    style="Primary.TButton" if _HAS_STYLES else "TButton",
                    command=save_expense).pack(side="right")
 
+    def _reset_add_expense_dialog(self):
+        """Clear the add expense form for another entry"""
+        self._set_category_values(self._add_category_combo)
+        self._add_category_combo.set("")
+        self._add_amount_entry.delete(0, "end")
+        self._add_date_entry.delete(0, "end")
+        self._add_date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self._add_desc_entry.delete(0, "end")
+
     def show_context_menu(self, event):
         """Show context menu for selected expense"""
         item = self.expenses_tree.identify_row(event.y)
         if item:
             self.expenses_tree.selection_set(item)
-            self.selected_expense = self.expenses_tree.item(item)['values']
+            self._s.selected_expense = self.expenses_tree.item(item)['values']
+            self._s.selected_full = None
             self.context_menu.post(event.x_root, event.y_root)
 
+    def _get_selected_full(self) -> Optional[Dict]:
+        """Full details of the selected expense, fetched once per selection"""
+        if self._s.selected_full is None or self._s.selected_full['id'] != self._s.selected_expense[0]:
+            self._s.selected_full = self.services['expense'].get_expense_details(self._s.selected_expense[0])
+        return self._s.selected_full
+
     def show_expense_details(self, event=None):
         """Show details for selected expense"""
-        if not self.selected_expense:
+        if not self._s.selected_expense:
             return
 
-        dialog = tk.Toplevel(self)
-        dialog.title("Expense Details")
-        dialog.geometry("400x300")
-        dialog.grab_set()
-
         # Get full expense details
-        expense = self.services['expense'].get_expense_details(self.selected_expense[0])
-        if expense:
+        expense = self._get_selected_full()
+        if not expense:
+            return
+
+        details = [
+            ("Category:", expense['category']['name']),
+            ("Amount:", f"${expense['amount']:.2f}"),
+            ("Date:", expense['date']),
+            ("Description:", expense['description']),
+            ("Added By:", expense['user']['username']),
+            ("Created At:", expense['created_at'])
+        ]
+
+        if self._details_dialog is None:
+            dialog = self._details_dialog = tk.Toplevel(self)
+            dialog.title("Expense Details")
+            dialog.geometry("400x300")
+            dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
+            dialog.grab_set()
+
             # Create details view
             details_frame = ttk.Frame(dialog, padding="20")
             details_frame.pack(fill="both", expand=True)
 
-            # Display expense details
-            details = [
-                ("Category:", expense['category']['name']),
-                ("Amount:", f"${expense['amount']:.2f}"),
-                ("Date:", expense['date']),
-                ("Description:", expense['description']),
-                ("Added By:", expense['user']['username']),
-                ("Created At:", expense['created_at'])
-            ]
-
-            for i, (label, value) in enumerate(details):
+            self._detail_value_labels = []
+            for i, (label, _) in enumerate(details):
                 ttk.Label(details_frame, text=label, font=("Helvetica", 10, "bold")).grid(
                     row=i, column=0, sticky="e", padx=5, pady=5
                 )
-                ttk.Label(details_frame, text=value).grid(
-                    row=i, column=1, sticky="w", padx=5, pady=5
-                )
+                value_label = ttk.Label(details_frame)
+                value_label.grid(row=i, column=1, sticky="w", padx=5, pady=5)
+                self._detail_value_labels.append(value_label)
 
             # Add close button
             ttk.Button(
                 dialog,
                 text="Close",
-                command=dialog.destroy
+                command=lambda: self._hide_dialog(dialog)
             ).pack(pady=10)
+        else:
+            self._show_dialog(self._details_dialog)
+
+        # Display expense details
+        for value_label, (_, value) in zip(self._detail_value_labels, details):
+            value_label.configure(text=value)
 
     def show_edit_dialog(self):
         """Show dialog to edit selected expense"""
-        if not self.selected_expense:
+        if not self._s.selected_expense:
             return
 
-        dialog = tk.Toplevel(self)
+        # Load expense details
+        expense = self._get_selected_full()
+        self._s.editing_expense = expense
+
+        if self._edit_dialog is None:
+            self._build_edit_dialog()
+        else:
+            self._show_dialog(self._edit_dialog)
+
+        self._set_category_values(self._edit_category_combo)
+        self._edit_category_var.set(expense['category']['name'])
+        for entry, value in ((self._edit_amount_entry, str(expense['amount'])),
+                             (self._edit_date_entry, expense['date']),
+                             (self._edit_description_entry, expense['description'])):
+            entry.delete(0, "end")
+            entry.insert(0, value)
+
+    def _build_edit_dialog(self):
+        """Create the edit expense dialog; show_edit_dialog fills it in"""
+        dialog = self._edit_dialog = tk.Toplevel(self)
         dialog.title("Edit Expense")
         dialog.geometry("400x400")
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
         dialog.grab_set()
 
-        # Load expense details
-        expense = self.services['expense'].get_expense_details(self.selected_expense[0])
-
         # Create edit form
         ttk.Label(dialog, text="Category:").pack(pady=5)
-        category_var = tk.StringVar(value=expense['category']['name'])
-        category_combo = ttk.Combobox(
+        self._edit_category_var = tk.StringVar()
+        category_combo = self._edit_category_combo = ttk.Combobox(
             dialog,
-            textvariable=category_var,
-            values=[cat['name'] for cat in self.services['expense'].get_categories()],
+            textvariable=self._edit_category_var,
             state="readonly",
             width=30
         )
         category_combo.pack(pady=5)
 
         ttk.Label(dialog, text="Amount ($):").pack(pady=5)
-        amount_var = tk.StringVar(value=str(expense['amount']))
-        ttk.Entry(
-            dialog,
-            textvariable=amount_var,
-            width=30
-        ).pack(pady=5)
+        amount_entry = self._edit_amount_entry = ttk.Entry(dialog, width=30)
+        amount_entry.pack(pady=5)
 
         ttk.Label(dialog, text="Date:").pack(pady=5)
-        date_var = tk.StringVar(value=expense['date'])
-        ttk.Entry(
-            dialog,
-            textvariable=date_var,
-            width=30
-        ).pack(pady=5)
+        date_entry = self._edit_date_entry = ttk.Entry(dialog, width=30)
+        date_entry.pack(pady=5)
 
         ttk.Label(dialog, text="Description:").pack(pady=5)
-        description_var = tk.StringVar(value=expense['description'])
-        ttk.Entry(
-            dialog,
-            textvariable=description_var,
-            width=30
-        ).pack(pady=5)
+        description_entry = self._edit_description_entry = ttk.Entry(dialog, width=30)
+        description_entry.pack(pady=5)
 
         def save_changes():
             try:
                 # Validate inputs
-                try:
-                    amount = float(amount_var.get())
-                    if amount <= 0:
-                        raise ValueError()
-                except ValueError:
-                    raise ValueError("Amount must be a positive number")
+                amount = _parse_amount(amount_entry.get())
 
-                description = description_var.get().strip()
+                description = description_entry.get().strip()
                 if not description:
                     raise ValueError("Please enter a description")
 
                 # Update expense — use combo.get() to avoid macOS textvariable lag
                 cat_name = category_combo.get()
-                cats = self.services['expense'].get_categories()
-                cat_match = next((c for c in cats if c['name'] == cat_name), None)
-                if not cat_match:
+                try:
+                    category_id = self._category_id(cat_name)
+                except KeyError:
                     raise ValueError("Please select a valid category")
                 update_data = {
-                    'category_id': cat_match['id'],
+                    'category_id': category_id,
                     'amount': amount,
-                    'date': date_var.get(),
+                    'date': date_entry.get(),
                     'description': description
                 }
 
                 self.services['expense'].update_expense(
-                    expense_id=expense['id'],
+                    expense_id=self._s.editing_expense['id'],
                     update_data=update_data,
                     audit_user_id=1  # TODO: Get actual user ID
                 )
 
+                self._s.analysis_cache.clear()
+                self._s.selected_full = None
                 messagebox.showinfo("Success", "Expense updated successfully!")
-                dialog.destroy()
+                self._hide_dialog(dialog)
 
                 # Refresh expenses list
                 self.load_expenses()
@@ -573,7 +705,7 @@ class ExpenseScreen(ttk.Frame):
             except ValueError as e:
                 messagebox.showerror("Error", str(e))
             except Exception as e:
-                logger.error(f"Error updating expense: {str(e)}")
+                logger.error("Error updating expense: %s", e)
                 messagebox.showerror("Error", "Failed to update expense")
 
         # Add save button
@@ -585,7 +717,7 @@ class ExpenseScreen(ttk.Frame):
 
     def delete_expense(self):
         """Delete selected expense"""
-        if not self.selected_expense:
+        if not self._s.selected_expense:
             return
 
         if messagebox.askyesno(
@@ -594,17 +726,18 @@ class ExpenseScreen(ttk.Frame):
         ):
             try:
                 self.services['expense'].delete_expense(
-                    expense_id=self.selected_expense[0],
+                    expense_id=self._s.selected_expense[0],
                     audit_user_id=1  # TODO: Get actual user ID
                 )
 
+                self._s.analysis_cache.clear()
                 messagebox.showinfo("Success", "Expense deleted successfully!")
 
                 # Refresh expenses list
                 self.load_expenses()
 
             except Exception as e:
-                logger.error(f"Error deleting expense: {str(e)}")
+                logger.error("Error deleting expense: %s", e)
                 messagebox.showerror("Error", "Failed to delete expense")
 
     def load_categories(self):
@@ -612,13 +745,14 @@ class ExpenseScreen(ttk.Frame):
         try:
             for item in self.categories_tree.get_children():
                 self.categories_tree.delete(item)
-            categories = self.services['expense'].get_categories()
+            categories = self._get_categories()
+            insert = self.categories_tree.insert
             for cat in categories:
-                self.categories_tree.insert("", "end", values=(
+                insert("", "end", values=(
                     cat['name'], 'expense', cat.get('description', '')
                 ))
         except Exception as e:
-            logger.error(f"Error loading categories: {str(e)}")
+            logger.error("Error loading categories: %s", e)
 
     def load_expenses(self):
         """Load expenses based on current filters"""
@@ -627,55 +761,125 @@ class ExpenseScreen(ttk.Frame):
             end_date = self.end_date_var.get()
             category = self.category_var.get()
 
-            # Clear existing items
-            for item in self.expenses_tree.get_children():
-                self.expenses_tree.delete(item)
-
             # Get expenses
-            category_id = next(
-                (cat['id'] for cat in self.services['expense'].get_categories()
-                 if cat['name'] == category),
-                None
-            ) if category != "All" else None
+            category_id = None
+            if category != "All":
+                try:
+                    category_id = self._category_id(category)
+                except KeyError:
+                    pass
+
+        except Exception as e:
+            self._on_load_expenses_error(e)
+            return
 
-            expenses = self.services['expense'].get_expenses(
+        self._run_in_background(
+            lambda: self._get_worker_services()['expense'].get_expenses(
                 start_date=start_date,
                 end_date=end_date,
                 category_id=category_id
-            )
+            ),
+            self._populate_expenses,
+            self._on_load_expenses_error,
+            buttons=(self.search_btn,)
+        )
 
-            for i, expense in enumerate(expenses):
-                tag = 'odd' if i % 2 == 0 else 'even'
-                self.expenses_tree.insert("", "end", tags=(tag,), values=(
-                    expense['id'],
-                    expense['date'],
-                    expense['category'],
-                    f"${expense['amount']:.2f}",
-                    expense['description'],
-                    expense['user']
-                ))
+    def _populate_expenses(self, expenses):
+        """Fill the expenses tree from a get_expenses result"""
+        fmt = "${:.2f}".format
+        rows = [
+            (e['id'], e['date'], e['category'], fmt(e['amount']),
+             e['description'], e['user'])
+            for e in expenses
+        ]
 
-        except Exception as e:
-            logger.error(f"Error loading expenses: {str(e)}")
-            messagebox.showerror("Error", "Failed to load expenses")
+        self._s.expense_rows = rows
+        first_page = rows[:_EXPENSE_PAGE_SIZE]
+
+        # Repopulate while unmapped so Tk redraws once, not per row
+        self.expenses_tree.pack_forget()
+        try:
+            self._apply_expense_rows(first_page)
+        finally:
+            self.expenses_tree.pack(side="left", fill="both", expand=True,
+                                    before=self.expenses_scrollbar)
+
+    def _apply_expense_rows(self, rows):
+        """Update the tree to show rows, keeping items that are already there"""
+        rendered = self._s.rendered_rows
+        new_iids = [str(row[0]) for row in rows]
+        new_set = set(new_iids)
+        children = self.expenses_tree.get_children()
+
+        # Rows that survive (e.g. after narrowing the filter) are kept in place as
+        # long as their relative order is unchanged; otherwise start from scratch
+        kept = [iid for iid in children if iid in new_set]
+        if kept == [iid for iid in new_iids if iid in rendered]:
+            removed = [iid for iid in children if iid not in new_set]
+        else:
+            removed = children
+        if removed:
+            self.expenses_tree.delete(*removed)
+            for iid in removed:
+                del rendered[iid]
+
+        # Raw Tcl commands skip Treeview's per-call option handling
+        tree = str(self.expenses_tree)
+        call = self.tk.call
+        for i, (iid, row) in enumerate(zip(new_iids, rows)):
+            tag = 'odd' if i % 2 == 0 else 'even'
+            current = rendered.get(iid)
+            if current is None:
+                call(tree, 'insert', '', i, '-id', iid, '-values', row, '-tags', (tag,))
+            elif current != (row, tag):
+                call(tree, 'item', iid, '-values', row, '-tags', (tag,))
+            rendered[iid] = (row, tag)
+        self._s.rendered_expenses = len(rows)
+
+    def _render_more_expenses(self):
+        """Append the next page of loaded expense rows to the tree"""
+        start = self._s.rendered_expenses
+        end = min(start + _EXPENSE_PAGE_SIZE, len(self._s.expense_rows))
+        # Raw Tcl insert skips Treeview.insert's per-call option handling
+        tree = str(self.expenses_tree)
+        call = self.tk.call
+        rows = self._s.expense_rows
+        rendered = self._s.rendered_rows
+        for i in range(start, end):
+            row = rows[i]
+            iid = str(row[0])
+            tag = 'odd' if i % 2 == 0 else 'even'
+            call(tree, 'insert', '', 'end', '-id', iid, '-values', row, '-tags', (tag,))
+            rendered[iid] = (row, tag)
+        self._s.rendered_expenses = end
+
+    def _on_expenses_scroll(self, first, last):
+        """Scrollbar update; renders another page once the view nears the end"""
+        self.expenses_scrollbar.set(first, last)
+        if float(last) >= 0.95 and self._s.rendered_expenses < len(self._s.expense_rows):
+            self._render_more_expenses()
+
+    def _on_load_expenses_error(self, e):
+        logger.error("Error loading expenses: %s", e)
+        messagebox.showerror("Error", "Failed to load expenses")
 
     def new_category(self):
         """Clear category editor for new category"""
-        self.category_name_var.set("")
+        self.category_name_entry.delete(0, "end")
         self.category_type_var.set("expense")
-        self.category_desc_var.set("")
+        self.category_desc_entry.delete(0, "end")
 
     def save_category(self):
         """Save current category"""
         try:
-            name = self.category_name_var.get().strip()
+            name = self.category_name_entry.get().strip()
             if not name:
                 raise ValueError("Category name is required")
 
             category_data = {
                 'name': name,
                 'type': self.category_type_var.get(),
-                'description': self.category_desc_var.get().strip()
+                'description': self.category_desc_entry.get().strip()
             }
 
             # Create or update category
@@ -687,12 +891,13 @@ class ExpenseScreen(ttk.Frame):
             messagebox.showinfo("Success", "Category saved successfully!")
 
             # Refresh categories
+            self._invalidate_categories()
             self.load_categories()
 
         except ValueError as e:
             messagebox.showerror("Error", str(e))
         except Exception as e:
-            logger.error(f"Error saving category: {str(e)}")
+            logger.error("Error saving category: %s", e)
             messagebox.showerror("Error", "Failed to save category")
 
     def delete_category(self):
@@ -710,65 +915,93 @@ class ExpenseScreen(ttk.Frame):
                 "This will affect all expenses in this category."
         ):
             try:
-                cats = self.services['expense'].get_categories()
-                category_id = next((c['id'] for c in cats if c['name'] == category_name), None)
-                if not category_id:
+                try:
+                    category_id = self._category_id(category_name)
+                except KeyError:
                     raise ValueError("Category not found")
                 self.services['expense'].delete_category(category_id=category_id)
 
                 messagebox.showinfo("Success", "Category deleted successfully!")
 
                 # Refresh categories
+                self._invalidate_categories()
                 self.load_categories()
 
             except Exception as e:
-                logger.error(f"Error deleting category: {str(e)}")
+                logger.error("Error deleting category: %s", e)
                 messagebox.showerror("Error", "Failed to delete category")
 
     def export_expenses(self):
         """Export filtered expenses list"""
-        try:
-            start_date = self.start_date_var.get()
-            end_date = self.end_date_var.get()
-            category = self.category_var.get()
+        start_date = self.start_date_var.get()
+        end_date = self.end_date_var.get()
+
+        # Save file
+        import tkinter.filedialog as filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            initialfile=f"expenses_{start_date}_to_{end_date}.csv"
+        )
+        if not filename:
+            return
 
-            report_data = self.services['reporting'].export_report(
+        self._run_in_background(
+            lambda: self._write_report(filename, start_date, end_date),
+            lambda _: messagebox.showinfo("Success", "Expenses exported successfully!"),
+            self._on_export_error("expenses"),
+            buttons=(self.export_btn,)
+        )
+
+    def _write_report(self, filename, start_date, end_date):
+        """Write the periodic CSV report straight to disk (runs on the worker thread)"""
+        with open(filename, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+            self._get_worker_services()['reporting'].write_report(
                 report_type='periodic',
                 start_date=start_date,
                 end_date=end_date,
+                fileobj=f,
                 format='csv'
             )
 
-            # Save file
-            import tkinter.filedialog as filedialog
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
-                initialfile=f"expenses_{start_date}_to_{end_date}.csv"
-            )
-
-            if filename:
-                with open(filename, 'wb') as f:
-                    f.write(report_data)
-                messagebox.showinfo("Success", "Expenses exported successfully!")
-
-        except Exception as e:
-            logger.error(f"Error exporting expenses: {str(e)}")
-            messagebox.showerror("Error", "Failed to export expenses")
+    def _on_export_error(self, what):
+        def on_error(e):
+            logger.error("Error exporting %s: %s", what, e)
+            messagebox.showerror("Error", f"Failed to export {what}")
+        return on_error
 
     def generate_analysis(self):
         """Generate expense analysis"""
+        start_date = self.analysis_start_var.get()
+        end_date = self.analysis_end_var.get()
+
+        key = (start_date, end_date)
+        cached = self._s.analysis_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _ANALYSIS_CACHE_TTL:
+            self._show_analysis(cached[1])
+            return
+
+        def on_done(analysis):
+            self._s.analysis_cache[key] = (time.monotonic(), analysis)
+            self._show_analysis(analysis)
+
+        self._run_in_background(
+            lambda: self._get_worker_services()['expense'].get_expense_summary(
+                start_date=start_date,
+                end_date=end_date
+            ),
+            on_done,
+            self._on_analysis_error,
+            buttons=(self.generate_btn,)
+        )
+
+    def _show_analysis(self, analysis):
+        """Rebuild the analysis view from a get_expense_summary result"""
         try:
             # Clear analysis frame
             for widget in self.analysis_frame.winfo_children():
                 widget.destroy()
 
-            # Get analysis data
-            analysis = self.services['expense'].get_expense_summary(
-                start_date=self.analysis_start_var.get(),
-                end_date=self.analysis_end_var.get()
-            )
-
             # Create analysis visualization
             # TODO: Add charts and graphs using matplotlib or similar
 
@@ -810,45 +1043,49 @@ class ExpenseScreen(ttk.Frame):
             )
             breakdown_tree.configure(yscrollcommand=scrollbar.set)
 
-            breakdown_tree.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-
-            # Add category data
-            for category in analysis['by_category']:
-                breakdown_tree.insert("", "end", values=(
+            # Add category data before mapping the tree
+            by_category = analysis['by_category']
+            totals = [c['total_amount'] for c in by_category]
+            counts = [c['transaction_count'] for c in by_category]
+            averages = [t / n if n else 0 for t, n in zip(totals, counts)]
+            fmt = "${:.2f}".format
+            tree = str(breakdown_tree)
+            call = self.tk.call
+            for category, total, count, average in zip(by_category, totals, counts, averages):
+                call(tree, 'insert', '', 'end', '-values', (
                     category['category'],
-                    f"${category['total_amount']:.2f}",
-                    category['transaction_count'],
-                    f"${category['total_amount'] / category['transaction_count']:.2f}"
+                    fmt(total),
+                    count,
+                    fmt(average)
                 ))
 
+            scrollbar.pack(side="right", fill="y")
+            breakdown_tree.pack(side="left", fill="both", expand=True)
+
         except Exception as e:
-            logger.error(f"Error generating analysis: {str(e)}")
-            messagebox.showerror("Error", "Failed to generate analysis")
+            self._on_analysis_error(e)
+
+    def _on_analysis_error(self, e):
+        logger.error("Error generating analysis: %s", e)
+        messagebox.showerror("Error", "Failed to generate analysis")
 
     def export_analysis(self):
         """Export current analysis"""
-        try:
-            report_data = self.services['reporting'].export_report(
-                report_type='periodic',
-                start_date=self.analysis_start_var.get(),
-                end_date=self.analysis_end_var.get(),
-                format='csv'
-            )
-
-            # Save file
-            import tkinter.filedialog as filedialog
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
-                initialfile=f"expense_analysis_{datetime.now().strftime('%Y%m%d')}.csv"
-            )
-
-            if filename:
-                with open(filename, 'wb') as f:
-                    f.write(report_data)
-                messagebox.showinfo("Success", "Analysis exported successfully!")
+        # Save file
+        import tkinter.filedialog as filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            initialfile=f"expense_analysis_{datetime.now().strftime('%Y%m%d')}.csv"
+        )
+        if not filename:
+            return
 
-        except Exception as e:
-            logger.error(f"Error exporting analysis: {str(e)}")
-            messagebox.showerror("Error", "Failed to export analysis")
\ No newline at end of file
+        start_date = self.analysis_start_var.get()
+        end_date = self.analysis_end_var.get()
+        self._run_in_background(
+            lambda: self._write_report(filename, start_date, end_date),
+            lambda _: messagebox.showinfo("Success", "Analysis exported successfully!"),
+            self._on_export_error("analysis"),
+            buttons=(self.export_analysis_btn,)
+        )
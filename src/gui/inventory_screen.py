@@ -1,9 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from datetime import datetime
+import re
+from datetime import date
+from itertools import compress
 from decimal import Decimal
 from typing import Dict, Optional
+from src.gui.background import BackgroundWorker
 
 try:
     from src.gui.styles import (CREAM, CARD_BG, ESPRESSO, MEDIUM_BROWN, DARK_BROWN,
@@ -16,13 +19,127 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-
-class InventoryScreen(ttk.Frame):
+# Delay before a search keystroke re-filters, so a burst of typing filters once
+_FILTER_DELAY_MS = 150
+
+# Above this many items, filtering re-queries the database instead of the loaded rows
+_SERVER_FILTER_THRESHOLD = 5000
+
+# Status filter labels to get_inventory_status() status keys
+_STATUS_KEYS = {"Out of Stock": "out_of_stock", "Low Stock": "low_stock", "In Stock": "normal"}
+
+# Inventory rows are rendered in pages as the user scrolls towards the end
+_INVENTORY_PAGE_SIZE = 200
+
+# Exports are streamed to disk through a buffer of this size
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# What the cost entries accept while typing: digits with up to two decimals
+_MONEY_PREFIX_RE = re.compile(r'[0-9]*(\.[0-9]{0,2})?')
+
+
+def _is_int_text(text):
+    return text == '' or (text.isascii() and text.isdigit())
+
+
+def _is_money_text(text):
+    return _MONEY_PREFIX_RE.fullmatch(text) is not None
+
+
+def _get_number(var, message):
+    """Value of an IntVar/DoubleVar, or ValueError(message) if the entry is blank or partial"""
+    try:
+        return var.get()
+    except tk.TclError:
+        raise ValueError(message)
+
+
+# Row colour tag for each stock status; untagged rows when the styles are missing
+_STATUS_TAGS = {
+    "Out of Stock": ("out",) if _HAS_STYLES else (),
+    "Low Stock": ("low",) if _HAS_STYLES else (),
+    "In Stock": ("ok",) if _HAS_STYLES else (),
+}
+
+# Treeview columns for each tab: column id -> (heading, width)
+_INVENTORY_COLUMNS = {
+    "ID": ("ID", 50),
+    "Item": ("Item", 200),
+    "Quantity": ("Quantity", 100),
+    "Unit Cost": ("Unit Cost", 100),
+    "Total Value": ("Total Value", 100),
+    "Reorder Level": ("Reorder Level", 100),
+    "Status": ("Status", 100),
+}
+_TRANSACTION_COLUMNS = {
+    "Date": ("Date", 100),
+    "Item": ("Item", 200),
+    "Type": ("Type", 100),
+    "Quantity": ("Quantity", 100),
+    "User": ("User", 100),
+    "Notes": ("Notes", 300),
+}
+_ALERT_COLUMNS = {
+    "Priority": ("!", 30),
+    "Item": ("Item", 200),
+    "Current Stock": ("Current Stock", 100),
+    "Reorder Level": ("Reorder Level", 100),
+    "Status": ("Status", 100),
+}
+
+# Inserts a list of {values tags ?iid?} rows into a Treeview in one Tcl call
+_INSERT_ROWS_PROC = """
+proc bb_insert_rows {tree rows} {
+    foreach row $rows {
+        if {[llength $row] > 2} {
+            $tree insert {} end -id [lindex $row 2] -values [lindex $row 0] -tags [lindex $row 1]
+        } else {
+            $tree insert {} end -values [lindex $row 0] -tags [lindex $row 1]
+        }
+    }
+}
+"""
+
+
+def _insert_rows(tree, rows):
+    """Append (values, tags) or (values, tags, iid) rows to tree in a single round-trip into Tcl"""
+    if not rows:
+        return
+    if not tree.tk.call('info', 'commands', 'bb_insert_rows'):
+        tree.tk.eval(_INSERT_ROWS_PROC)
+    tree.tk.call('bb_insert_rows', str(tree), rows)
+
+
+class InventoryScreen(BackgroundWorker, ttk.Frame):
     def __init__(self, parent, services):
         super().__init__(parent)
         self.parent = parent
         self.services = services
         self.selected_item = None
+        self._inventory_rows = []  # (values, tags, iid) for every item, in load order
+        self._row_by_iid = {}  # tree iid (the item id) -> row values
+        self._filtered_rows = []  # the subset matching the current filters
+        self._names_lc = []  # lower-cased item names, parallel to _inventory_rows
+        self._statuses = []  # status column, parallel to _inventory_rows
+        self._rendered_inventory = 0
+        self._filter_after_id = None
+        # Transactions and alerts are (re)loaded when their tab is next shown
+        self._tabs_loaded = {0: True, 1: False, 2: False}
+        self._transactions_request = 0
+        self._filter_request = 0
+        self._inventory_cache = None  # last get_inventory_status() result
+        # Dialogs are built on first use and withdrawn, not destroyed, on close
+        self._add_dialog = None
+        self._edit_dialog = None
+        self._adjustment_dialog = None
+        self._editing_item = None
+        self._adjusting_item = None
+        self._today = date.today()  # refreshed on each load_data
+        # Keystroke filters for the numeric dialog entries
+        self._vcmd_int = (self.register(_is_int_text), '%P')
+        self._vcmd_money = (self.register(_is_money_text), '%P')
+        self._start_worker("inventory-screen")
+        self.bind("<Destroy>", self._on_destroy)
 
         self.create_widgets()
         self.load_data()
@@ -80,6 +197,7 @@ class InventoryScreen(ttk.Frame):
         self.create_inventory_tab()
         self.create_transactions_tab()
         self.create_alerts_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Pack main frame
         self.pack(fill="both", expand=True)
@@ -96,7 +214,7 @@ class InventoryScreen(ttk.Frame):
         # Search
         ttk.Label(controls_frame, text="Search:").pack(side="left")
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', lambda *args: self.filter_inventory())
+        self.search_var.trace('w', lambda *args: self._schedule_filter())
         search_entry = ttk.Entry(
             controls_frame,
             textvariable=self.search_var,
@@ -118,48 +236,22 @@ class InventoryScreen(ttk.Frame):
         status_combo.bind('<<ComboboxSelected>>', lambda e: self.filter_inventory())
 
         # Export button
-        ttk.Button(
+        self.export_btn = ttk.Button(
             controls_frame,
             text="Export",
             command=self.export_inventory
-        ).pack(side="right", padx=5)
-
-        # Create main inventory treeview
-        columns = ("ID", "Item", "Quantity", "Unit Cost", "Total Value", "Reorder Level", "Status")
-        self.inventory_tree = ttk.Treeview(
-            tab,
-            columns=columns,
-            show="headings",
-            selectmode="browse"
         )
+        self.export_btn.pack(side="right", padx=5)
 
-        # Configure columns
-        self.inventory_tree.heading("ID", text="ID")
-        self.inventory_tree.column("ID", width=50)
-        self.inventory_tree.heading("Item", text="Item")
-        self.inventory_tree.column("Item", width=200)
-        self.inventory_tree.heading("Quantity", text="Quantity")
-        self.inventory_tree.column("Quantity", width=100)
-        self.inventory_tree.heading("Unit Cost", text="Unit Cost")
-        self.inventory_tree.column("Unit Cost", width=100)
-        self.inventory_tree.heading("Total Value", text="Total Value")
-        self.inventory_tree.column("Total Value", width=100)
-        self.inventory_tree.heading("Reorder Level", text="Reorder Level")
-        self.inventory_tree.column("Reorder Level", width=100)
-        self.inventory_tree.heading("Status", text="Status")
-        self.inventory_tree.column("Status", width=100)
-
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(
-            tab,
-            orient="vertical",
-            command=self.inventory_tree.yview
-        )
-        self.inventory_tree.configure(yscrollcommand=scrollbar.set)
+        # Create main inventory treeview
+        self.inventory_tree, self.inventory_scrollbar = self._make_tree(tab, _INVENTORY_COLUMNS)
+        self.inventory_tree.configure(yscrollcommand=self._on_inventory_scroll)
 
-        # Pack treeview and scrollbar
-        self.inventory_tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # Configure row colour tags — foreground colours chosen for ≥ 4.5:1 on their bg
+        if _HAS_STYLES:
+            self.inventory_tree.tag_configure("out", background=ROW_DANGER_BG,  foreground=DANGER)
+            self.inventory_tree.tag_configure("low", background=ROW_WARNING_BG, foreground=WARNING)
+            self.inventory_tree.tag_configure("ok",  background=CARD_BG,        foreground=TEXT_DARK)
 
         # Bind context menu
         self.inventory_tree.bind("<Button-3>", self.show_context_menu)
@@ -185,7 +277,7 @@ class InventoryScreen(ttk.Frame):
         # Date range
         ttk.Label(controls_frame, text="Date Range:").pack(side="left")
         self.start_date_var = tk.StringVar(
-            value=datetime.now().strftime("%Y-%m-%d")
+            value=self._today.isoformat()
         )
         ttk.Entry(
             controls_frame,
@@ -195,7 +287,7 @@ class InventoryScreen(ttk.Frame):
 
         ttk.Label(controls_frame, text="to").pack(side="left")
         self.end_date_var = tk.StringVar(
-            value=datetime.now().strftime("%Y-%m-%d")
+            value=self._today.isoformat()
         )
         ttk.Entry(
             controls_frame,
@@ -216,49 +308,23 @@ class InventoryScreen(ttk.Frame):
         type_combo.pack(side="left", padx=5)
 
         # Search button
-        ttk.Button(
+        self.trans_search_btn = ttk.Button(
             controls_frame,
             text="Search",
             command=self.load_transactions
-        ).pack(side="left", padx=5)
+        )
+        self.trans_search_btn.pack(side="left", padx=5)
 
         # Export button
-        ttk.Button(
+        self.trans_export_btn = ttk.Button(
             controls_frame,
             text="Export",
             command=self.export_transactions
-        ).pack(side="right", padx=5)
-
-        # Create transactions treeview
-        columns = ("Date", "Item", "Type", "Quantity", "User", "Notes")
-        self.transactions_tree = ttk.Treeview(
-            tab,
-            columns=columns,
-            show="headings",
-            selectmode="browse"
-        )
-
-        # Configure columns
-        for col in columns:
-            self.transactions_tree.heading(col, text=col)
-            if col == "Item":
-                self.transactions_tree.column(col, width=200)
-            elif col == "Notes":
-                self.transactions_tree.column(col, width=300)
-            else:
-                self.transactions_tree.column(col, width=100)
-
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(
-            tab,
-            orient="vertical",
-            command=self.transactions_tree.yview
         )
-        self.transactions_tree.configure(yscrollcommand=scrollbar.set)
+        self.trans_export_btn.pack(side="right", padx=5)
 
-        # Pack treeview and scrollbar
-        self.transactions_tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # Create transactions treeview
+        self.transactions_tree, self.transactions_scrollbar = self._make_tree(tab, _TRANSACTION_COLUMNS)
 
     def create_alerts_tab(self):
         """Create inventory alerts view"""
@@ -266,171 +332,275 @@ class InventoryScreen(ttk.Frame):
         self.notebook.add(tab, text="Alerts")
 
         # Create alerts treeview
-        columns = ("Priority", "Item", "Current Stock", "Reorder Level", "Status")
-        self.alerts_tree = ttk.Treeview(
+        self.alerts_tree, self.alerts_scrollbar = self._make_tree(tab, _ALERT_COLUMNS)
+
+        # Add button to generate reorder report
+        self.reorder_btn = ttk.Button(
             tab,
-            columns=columns,
+            text="Generate Reorder Report",
+            command=self.generate_reorder_report
+        )
+        self.reorder_btn.pack(side="bottom", pady=10)
+
+    @staticmethod
+    def _make_tree(parent, columns):
+        """Pack a headings-only Treeview and its scrollbar into parent from a column spec"""
+        tree = ttk.Treeview(
+            parent,
+            columns=tuple(columns),
             show="headings",
             selectmode="browse"
         )
+        for col, (heading, width) in columns.items():
+            tree.heading(col, text=heading)
+            tree.column(col, width=width)
 
-        # Configure columns
-        self.alerts_tree.heading("Priority", text="!")
-        self.alerts_tree.column("Priority", width=30)
-        self.alerts_tree.heading("Item", text="Item")
-        self.alerts_tree.column("Item", width=200)
-        self.alerts_tree.heading("Current Stock", text="Current Stock")
-        self.alerts_tree.column("Current Stock", width=100)
-        self.alerts_tree.heading("Reorder Level", text="Reorder Level")
-        self.alerts_tree.column("Reorder Level", width=100)
-        self.alerts_tree.heading("Status", text="Status")
-        self.alerts_tree.column("Status", width=100)
-
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(
-            tab,
-            orient="vertical",
-            command=self.alerts_tree.yview
-        )
-        self.alerts_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
 
-        # Pack treeview and scrollbar
-        self.alerts_tree.pack(side="left", fill="both", expand=True)
+        tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        return tree, scrollbar
 
-        # Add button to generate reorder report
-        ttk.Button(
-            tab,
-            text="Generate Reorder Report",
-            command=self.generate_reorder_report
-        ).pack(side="bottom", pady=10)
+    @staticmethod
+    def _replace_rows(tree, scrollbar, rows):
+        """Swap tree's rows for rows while it is unmapped so Tk lays it out once"""
+        tree.pack_forget()
+        try:
+            tree.delete(*tree.get_children())
+            _insert_rows(tree, rows)
+        finally:
+            tree.pack(side="left", fill="both", expand=True, before=scrollbar)
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self._stop_worker()
 
     def load_data(self):
         """Load initial data"""
         try:
-            # Load inventory items
-            inventory = self.services['inventory'].get_inventory_status()
+            self._today = date.today()
 
-            # Clear existing items
-            for item in self.inventory_tree.get_children():
-                self.inventory_tree.delete(item)
-
-            # Configure row colour tags — foreground colours chosen for ≥ 4.5:1 on their bg
-            if _HAS_STYLES:
-                self.inventory_tree.tag_configure("out", background=ROW_DANGER_BG,  foreground=DANGER)
-                self.inventory_tree.tag_configure("low", background=ROW_WARNING_BG, foreground=WARNING)
-                self.inventory_tree.tag_configure("ok",  background=CARD_BG,        foreground=TEXT_DARK)
-
-            # Add items to treeview
-            for item in inventory['items']:
-                total_value = item['quantity'] * item['unit_cost']
-                if item['quantity'] == 0:
-                    status, tag = "Out of Stock", "out"
-                elif item['quantity'] <= item['reorder_level']:
-                    status, tag = "Low Stock", "low"
-                else:
-                    status, tag = "In Stock", "ok"
-
-                self.inventory_tree.insert("", "end",
-                    tags=(tag,) if _HAS_STYLES else (),
-                    values=(
-                        item['id'],
-                        item['name'],
-                        item['quantity'],
-                        f"${item['unit_cost']:.2f}",
-                        f"${total_value:.2f}",
-                        item['reorder_level'],
-                        status
-                    )
-                )
+            # Load inventory items; always refetched, as stock may have changed
+            # elsewhere (e.g. a sale) since the screen was last shown
+            inventory = self._get_inventory(force=True)
 
-            # Load transactions
-            self.load_transactions()
+            # Format rows once; the tree only ever holds the filtered, scrolled-to part
+            columns = self._inventory_columns(inventory['items'])
+            self._inventory_rows = self._inventory_rows_from(columns)
+            self._row_by_iid = {iid: values for values, _, iid in self._inventory_rows}
+            self._names_lc = [name.lower() for name in columns['names']]
+            self._statuses = columns['statuses']
+            self.filter_inventory()
 
-            # Load alerts
-            self.load_alerts()
+            # Transactions and alerts are now stale; refresh whichever is in view
+            self._tabs_loaded[1] = self._tabs_loaded[2] = False
+            self._on_tab_changed()
 
         except Exception as e:
             logger.error(f"Error loading data: {str(e)}")
             messagebox.showerror("Error", "Failed to load inventory data")
 
+    @staticmethod
+    def _inventory_columns(items):
+        """Split get_inventory_status() items into per-field column lists"""
+        quantities = [item['quantity'] for item in items]
+        reorder_levels = [item['reorder_level'] for item in items]
+        statuses = [
+            "Out of Stock" if quantity == 0 else
+            "Low Stock" if quantity <= reorder_level else "In Stock"
+            for quantity, reorder_level in zip(quantities, reorder_levels)
+        ]
+        return {
+            'ids': [item['id'] for item in items],
+            'names': [item['name'] for item in items],
+            'quantities': quantities,
+            'costs': ['$%.2f' % item['unit_cost'] for item in items],
+            'totals': ['$%.2f' % item['total_value'] for item in items],
+            'reorder_levels': reorder_levels,
+            'statuses': statuses,
+            'tags': [_STATUS_TAGS[status] for status in statuses]
+        }
+
+    @staticmethod
+    def _inventory_rows_from(columns):
+        """(values, tags, iid) tree rows zipped back together from _inventory_columns()"""
+        values = zip(columns['ids'], columns['names'], columns['quantities'],
+                     columns['costs'], columns['totals'], columns['reorder_levels'],
+                     columns['statuses'])
+        return list(zip(values, columns['tags'], map(str, columns['ids'])))
+
+    def _get_inventory(self, force: bool = False) -> Dict:
+        """Inventory status as of the last load_data, which the alerts tab reuses"""
+        if force or self._inventory_cache is None:
+            self._inventory_cache = self.services['inventory'].get_inventory_status()
+        return self._inventory_cache
+
+    def _on_tab_changed(self, event=None):
+        """Load the selected tab if it has not been loaded since the last change"""
+        index = self.notebook.index("current")
+        if self._tabs_loaded.get(index, True):
+            return
+        self._tabs_loaded[index] = True
+
+        if index == 1:
+            self.load_transactions()
+        elif index == 2:
+            self.load_alerts()
+
+    def _schedule_filter(self):
+        """Re-filter once typing pauses"""
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(_FILTER_DELAY_MS, self.filter_inventory)
+
     def filter_inventory(self):
         """Filter inventory based on search and status"""
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
         try:
             search_term = self.search_var.get().lower()
             status_filter = self.status_var.get()
+            # Results of any earlier, slower database filter are dropped
+            self._filter_request += 1
+            request = self._filter_request
+
+            if (len(self._inventory_rows) > _SERVER_FILTER_THRESHOLD
+                    and (search_term or status_filter != "All")):
+                # Large catalogue: let the database do the matching, on the worker
+                def on_done(filtered):
+                    if request == self._filter_request:
+                        self._row_by_iid.update((iid, values) for values, _, iid in filtered)
+                        self._show_filtered_rows(filtered)
+
+                self._run_in_background(
+                    lambda: self._inventory_rows_from(self._inventory_columns(
+                        self._get_worker_services()['inventory'].get_inventory_status(
+                            search_term=search_term or None,
+                            status=_STATUS_KEYS.get(status_filter)
+                        )['items']
+                    )),
+                    on_done,
+                    self._on_filter_error
+                )
+                return
 
-            # Show all items first
-            for item in self.inventory_tree.get_children():
-                self.inventory_tree.item(item, tags=())
-
-            # Apply filters
-            for item in self.inventory_tree.get_children():
-                values = self.inventory_tree.item(item)['values']
-                item_name = str(values[1]).lower()
-                status = str(values[6])
-
-                show_item = True
-
-                # Apply search filter
-                if search_term and search_term not in item_name:
-                    show_item = False
+            self._show_filtered_rows(self._filter_loaded_rows(search_term, status_filter))
 
-                # Apply status filter
-                if status_filter != "All" and status_filter != status:
-                    show_item = False
+        except Exception as e:
+            self._on_filter_error(e)
 
-                # Hide or show item
-                if show_item:
-                    self.inventory_tree.item(item, tags=())
-                else:
-                    self.inventory_tree.detach(item)
+    def _show_filtered_rows(self, filtered):
+        """Show the first page of filtered rows in the inventory tree"""
+        if filtered == self._filtered_rows:
+            # Same rows as already shown (e.g. a keystroke that matches the
+            # same items); keep the tree, its scroll position and selection
+            return
 
-        except Exception as e:
-            logger.error(f"Error filtering inventory: {str(e)}")
+        self._filtered_rows = filtered
+        self._rendered_inventory = min(_INVENTORY_PAGE_SIZE, len(filtered))
+        self._replace_rows(self.inventory_tree, self.inventory_scrollbar,
+                           filtered[:self._rendered_inventory])
+
+    def _on_filter_error(self, e):
+        logger.error(f"Error filtering inventory: {str(e)}")
+
+    def _filter_loaded_rows(self, search_term, status_filter):
+        """Loaded rows matching the filters, via a mask over the precomputed columns"""
+        if search_term:
+            mask = bytearray(search_term in name for name in self._names_lc)
+        else:
+            mask = bytearray(b'\x01') * len(self._inventory_rows)
+        if status_filter != "All":
+            for i, status in enumerate(self._statuses):
+                if status != status_filter:
+                    mask[i] = 0
+        return list(compress(self._inventory_rows, mask))
+
+    def _render_more_inventory(self):
+        """Append the next page of filtered inventory rows to the tree"""
+        start = self._rendered_inventory
+        end = min(start + _INVENTORY_PAGE_SIZE, len(self._filtered_rows))
+        _insert_rows(self.inventory_tree, self._filtered_rows[start:end])
+        self._rendered_inventory = end
+
+    def _on_inventory_scroll(self, first, last):
+        """Scrollbar update; renders another page once the view nears the end"""
+        self.inventory_scrollbar.set(first, last)
+        if float(last) >= 0.95 and self._rendered_inventory < len(self._filtered_rows):
+            self._render_more_inventory()
 
     def show_context_menu(self, event):
         """Show context menu for selected item"""
         item = self.inventory_tree.identify_row(event.y)
         if item:
             self.inventory_tree.selection_set(item)
-            self.selected_item = self.inventory_tree.item(item)['values']
+            self.selected_item = self._row_by_iid[item]
             self.context_menu.post(event.x_root, event.y_root)
 
     def show_item_details(self, event):
         """Show details for double-clicked item"""
-        item = self.inventory_tree.selection()
-        if item:
-            self.selected_item = self.inventory_tree.item(item)['values']
+        selection = self.inventory_tree.selection()
+        if selection:
+            self.selected_item = self._row_by_iid[selection[0]]
             self.show_edit_dialog()
 
+    def _show_dialog(self, dialog):
+        """Bring a previously built dialog back"""
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+
+    def _hide_dialog(self, dialog):
+        """Withdraw a reusable dialog instead of destroying it"""
+        dialog.grab_release()
+        dialog.withdraw()
+
     def show_add_item_dialog(self):
         """Show dialog to add new inventory item"""
-        dialog = tk.Toplevel(self)
+        if self._add_dialog is None:
+            self._build_add_item_dialog()
+        else:
+            self._show_dialog(self._add_dialog)
+
+        self._add_name_var.set("")
+        self._add_description_var.set("")
+        self._add_quantity_var.set(0)
+        self._add_cost_var.set(0.0)
+        self._add_reorder_var.set(10)
+
+    def _build_add_item_dialog(self):
+        """Create the add item dialog; show_add_item_dialog resets it"""
+        dialog = self._add_dialog = tk.Toplevel(self)
         dialog.title("Add New Item")
         dialog.geometry("400x400")
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
         dialog.grab_set()
 
         # Form fields
         ttk.Label(dialog, text="Item Name:").pack(pady=5)
-        name_var = tk.StringVar()
+        name_var = self._add_name_var = tk.StringVar()
         ttk.Entry(dialog, textvariable=name_var, width=40).pack(pady=5)
 
         ttk.Label(dialog, text="Description:").pack(pady=5)
-        description_var = tk.StringVar()
+        description_var = self._add_description_var = tk.StringVar()
         ttk.Entry(dialog, textvariable=description_var, width=40).pack(pady=5)
 
         ttk.Label(dialog, text="Initial Quantity:").pack(pady=5)
-        quantity_var = tk.StringVar(value="0")
-        ttk.Entry(dialog, textvariable=quantity_var, width=40).pack(pady=5)
+        quantity_var = self._add_quantity_var = tk.IntVar()
+        ttk.Entry(dialog, textvariable=quantity_var, width=40,
+                  validate="key", validatecommand=self._vcmd_int).pack(pady=5)
 
         ttk.Label(dialog, text="Unit Cost ($):").pack(pady=5)
-        cost_var = tk.StringVar(value="0.00")
-        ttk.Entry(dialog, textvariable=cost_var, width=40).pack(pady=5)
+        cost_var = self._add_cost_var = tk.DoubleVar()
+        ttk.Entry(dialog, textvariable=cost_var, width=40,
+                  validate="key", validatecommand=self._vcmd_money).pack(pady=5)
 
         ttk.Label(dialog, text="Reorder Level:").pack(pady=5)
-        reorder_var = tk.StringVar(value="10")
-        ttk.Entry(dialog, textvariable=reorder_var, width=40).pack(pady=5)
+        reorder_var = self._add_reorder_var = tk.IntVar()
+        ttk.Entry(dialog, textvariable=reorder_var, width=40,
+                  validate="key", validatecommand=self._vcmd_int).pack(pady=5)
 
         def save_item():
             try:
@@ -441,26 +611,10 @@ class InventoryScreen(ttk.Frame):
 
                 description = description_var.get().strip()
 
-                try:
-                    quantity = int(quantity_var.get())
-                    if quantity < 0:
-                        raise ValueError()
-                except ValueError:
-                    raise ValueError("Quantity must be a positive number")
-
-                try:
-                    unit_cost = float(cost_var.get())
-                    if unit_cost < 0:
-                        raise ValueError()
-                except ValueError:
-                    raise ValueError("Unit cost must be a positive number")
-
-                try:
-                    reorder_level = int(reorder_var.get())
-                    if reorder_level < 0:
-                        raise ValueError()
-                except ValueError:
-                    raise ValueError("Reorder level must be a positive number")
+                # Entries only accept unsigned numbers, so these are never negative
+                quantity = _get_number(quantity_var, "Quantity must be a positive number")
+                unit_cost = _get_number(cost_var, "Unit cost must be a positive number")
+                reorder_level = _get_number(reorder_var, "Reorder level must be a positive number")
 
                 # Create new item
                 new_item = self.services['inventory'].add_inventory_item(
@@ -473,7 +627,7 @@ class InventoryScreen(ttk.Frame):
                 )
 
                 messagebox.showinfo("Success", "Inventory item added successfully!")
-                dialog.destroy()
+                self._hide_dialog(dialog)
 
                 # Refresh inventory list
                 self.load_data()
@@ -496,32 +650,46 @@ class InventoryScreen(ttk.Frame):
         if not self.selected_item:
             return
 
-        dialog = tk.Toplevel(self)
+        if self._edit_dialog is None:
+            self._build_edit_dialog()
+        else:
+            self._show_dialog(self._edit_dialog)
+
+        item = self._editing_item = self.selected_item
+        self._edit_name_var.set(item[1])
+        self._edit_quantity_label.configure(text=str(item[2]))
+        self._edit_cost_var.set(float(item[3].replace('$', '')))
+        self._edit_reorder_var.set(int(item[5]))
+
+    def _build_edit_dialog(self):
+        """Create the edit item dialog; show_edit_dialog fills it in"""
+        dialog = self._edit_dialog = tk.Toplevel(self)
         dialog.title("Edit Item")
         dialog.geometry("400x400")
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
         dialog.grab_set()
 
         # Form fields
         ttk.Label(dialog, text="Item Name:").pack(pady=5)
-        name_var = tk.StringVar(value=self.selected_item[1])
+        name_var = self._edit_name_var = tk.StringVar()
         ttk.Entry(dialog, textvariable=name_var, width=40).pack(pady=5)
 
         ttk.Label(dialog, text="Current Quantity:").pack(pady=5)
-        ttk.Label(
+        self._edit_quantity_label = ttk.Label(
             dialog,
-            text=str(self.selected_item[2]),
             font=("Helvetica", 12, "bold")
-        ).pack(pady=5)
+        )
+        self._edit_quantity_label.pack(pady=5)
 
         ttk.Label(dialog, text="Unit Cost ($):").pack(pady=5)
-        cost_var = tk.StringVar(
-            value=str(float(self.selected_item[3].replace('$', '')))
-        )
-        ttk.Entry(dialog, textvariable=cost_var, width=40).pack(pady=5)
+        cost_var = self._edit_cost_var = tk.DoubleVar()
+        ttk.Entry(dialog, textvariable=cost_var, width=40,
+                  validate="key", validatecommand=self._vcmd_money).pack(pady=5)
 
         ttk.Label(dialog, text="Reorder Level:").pack(pady=5)
-        reorder_var = tk.StringVar(value=str(self.selected_item[5]))
-        ttk.Entry(dialog, textvariable=reorder_var, width=40).pack(pady=5)
+        reorder_var = self._edit_reorder_var = tk.IntVar()
+        ttk.Entry(dialog, textvariable=reorder_var, width=40,
+                  validate="key", validatecommand=self._vcmd_int).pack(pady=5)
 
         def save_changes():
             try:
@@ -530,19 +698,8 @@ class InventoryScreen(ttk.Frame):
                 if not name:
                     raise ValueError("Item name is required")
 
-                try:
-                    unit_cost = float(cost_var.get())
-                    if unit_cost < 0:
-                        raise ValueError()
-                except ValueError:
-                    raise ValueError("Unit cost must be a positive number")
-
-                try:
-                    reorder_level = int(reorder_var.get())
-                    if reorder_level < 0:
-                        raise ValueError()
-                except ValueError:
-                    raise ValueError("Reorder level must be a positive number")
+                unit_cost = _get_number(cost_var, "Unit cost must be a positive number")
+                reorder_level = _get_number(reorder_var, "Reorder level must be a positive number")
 
                 # Update item
                 update_data = {
@@ -552,13 +709,13 @@ class InventoryScreen(ttk.Frame):
                 }
 
                 self.services['inventory'].update_item(
-                    item_id=self.selected_item[0],
+                    item_id=self._editing_item[0],
                     update_data=update_data,
                     audit_user_id=1  # TODO: Get actual user ID
                 )
 
                 messagebox.showinfo("Success", "Item updated successfully!")
-                dialog.destroy()
+                self._hide_dialog(dialog)
 
                 # Refresh inventory list
                 self.load_data()
@@ -582,30 +739,45 @@ class InventoryScreen(ttk.Frame):
             messagebox.showwarning("Warning", "Please select an item first")
             return
 
-        dialog = tk.Toplevel(self)
+        if self._adjustment_dialog is None:
+            self._build_adjustment_dialog()
+        else:
+            self._show_dialog(self._adjustment_dialog)
+
+        item = self._adjusting_item = self.selected_item
+        self._adjust_item_label.configure(text=f"Item: {item[1]}")
+        self._adjust_stock_label.configure(text=f"Current Stock: {item[2]}")
+        self._adjust_type_var.set("add")
+        self._adjust_quantity_var.set(0)
+        self._adjust_reason_var.set("")
+
+    def _build_adjustment_dialog(self):
+        """Create the stock adjustment dialog; show_adjustment_dialog fills it in"""
+        dialog = self._adjustment_dialog = tk.Toplevel(self)
         dialog.title("Stock Adjustment")
         dialog.geometry("400x300")
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
         dialog.grab_set()
 
         # Item details
-        ttk.Label(
+        self._adjust_item_label = ttk.Label(
             dialog,
-            text=f"Item: {self.selected_item[1]}",
             font=("Helvetica", 12, "bold")
-        ).pack(pady=5)
+        )
+        self._adjust_item_label.pack(pady=5)
 
-        ttk.Label(
+        self._adjust_stock_label = ttk.Label(
             dialog,
-            text=f"Current Stock: {self.selected_item[2]}",
             font=("Helvetica", 10)
-        ).pack(pady=5)
+        )
+        self._adjust_stock_label.pack(pady=5)
 
         # Adjustment fields
         frame = ttk.Frame(dialog)
         frame.pack(pady=20)
 
         ttk.Label(frame, text="Adjustment Type:").grid(row=0, column=0, padx=5)
-        type_var = tk.StringVar(value="add")
+        type_var = self._adjust_type_var = tk.StringVar(value="add")
         ttk.Radiobutton(
             frame,
             text="Add Stock",
@@ -620,15 +792,17 @@ class InventoryScreen(ttk.Frame):
         ).grid(row=0, column=2, padx=5)
 
         ttk.Label(frame, text="Quantity:").grid(row=1, column=0, padx=5, pady=10)
-        quantity_var = tk.StringVar(value="0")
+        quantity_var = self._adjust_quantity_var = tk.IntVar()
         ttk.Entry(
             frame,
             textvariable=quantity_var,
-            width=10
+            width=10,
+            validate="key",
+            validatecommand=self._vcmd_int
         ).grid(row=1, column=1, columnspan=2, pady=10)
 
         ttk.Label(frame, text="Reason:").grid(row=2, column=0, padx=5)
-        reason_var = tk.StringVar()
+        reason_var = self._adjust_reason_var = tk.StringVar()
         ttk.Entry(
             frame,
             textvariable=reason_var,
@@ -638,11 +812,8 @@ class InventoryScreen(ttk.Frame):
         def save_adjustment():
             try:
                 # Validate inputs
-                try:
-                    quantity = int(quantity_var.get())
-                    if quantity <= 0:
-                        raise ValueError()
-                except ValueError:
+                quantity = _get_number(quantity_var, "Quantity must be a positive number")
+                if quantity <= 0:
                     raise ValueError("Quantity must be a positive number")
 
                 reason = reason_var.get().strip()
@@ -654,7 +825,7 @@ class InventoryScreen(ttk.Frame):
 
                 # Update stock
                 self.services['inventory'].update_stock(
-                    item_id=self.selected_item[0],
+                    item_id=self._adjusting_item[0],
                     quantity_change=quantity_change,
                     transaction_type='adjustment',
                     user_id=1,  # TODO: Get actual user ID
@@ -662,7 +833,7 @@ class InventoryScreen(ttk.Frame):
                 )
 
                 messagebox.showinfo("Success", "Stock adjusted successfully!")
-                dialog.destroy()
+                self._hide_dialog(dialog)
 
                 # Refresh inventory list
                 self.load_data()
@@ -684,7 +855,7 @@ class InventoryScreen(ttk.Frame):
         """Update selected_item when user single-clicks a row"""
         selection = self.inventory_tree.selection()
         if selection:
-            self.selected_item = self.inventory_tree.item(selection[0])['values']
+            self.selected_item = self._row_by_iid[selection[0]]
 
     def show_item_history(self):
         """Show transaction history for selected item"""
@@ -692,60 +863,70 @@ class InventoryScreen(ttk.Frame):
             return
 
         # Switch to transactions tab and filter for selected item
+        self._tabs_loaded[1] = True
         self.notebook.select(1)  # Switch to transactions tab
         self.load_transactions(item_id=self.selected_item[0], item_name=self.selected_item[1])
 
     def load_transactions(self, item_id: Optional[int] = None, item_name: str = ""):
         """Load transaction history"""
-        try:
-            # Clear existing items
-            for item in self.transactions_tree.get_children():
-                self.transactions_tree.delete(item)
+        # Clear existing items; results of any earlier, slower load are dropped
+        self.transactions_tree.delete(*self.transactions_tree.get_children())
+        self._transactions_request += 1
+        request = self._transactions_request
 
-            if item_id is None:
-                return
+        if item_id is None:
+            return
 
-            # Get transaction history
-            transactions = self.services['inventory'].get_transaction_history(item_id=item_id)
+        def on_done(transactions):
+            if request == self._transactions_request:
+                self._populate_transactions(transactions, item_name or f"Item #{item_id}")
 
-            # Add transactions to treeview
-            for trans in transactions:
-                self.transactions_tree.insert("", "end", values=(
-                    trans['date'],
-                    item_name or f"Item #{item_id}",
-                    trans['type'],
-                    trans['quantity'],
-                    trans['user']['username'],
-                    trans['notes']
-                ))
+        self._run_in_background(
+            lambda: self._get_worker_services()['inventory'].get_transaction_history(item_id=item_id),
+            on_done,
+            self._on_load_transactions_error,
+            buttons=(self.trans_search_btn,)
+        )
 
+    def _populate_transactions(self, transactions, item_label):
+        """Fill the transactions tree from a get_transaction_history result"""
+        try:
+            self._replace_rows(self.transactions_tree, self.transactions_scrollbar, [((
+                trans['date'],
+                item_label,
+                trans['type'],
+                trans['quantity'],
+                trans['user']['username'],
+                trans['notes']
+            ), ()) for trans in transactions])
         except Exception as e:
-            logger.error(f"Error loading transactions: {str(e)}")
-            messagebox.showerror("Error", "Failed to load transaction history")
+            self._on_load_transactions_error(e)
+
+    def _on_load_transactions_error(self, e):
+        logger.error(f"Error loading transactions: {str(e)}")
+        messagebox.showerror("Error", "Failed to load transaction history")
 
     def load_alerts(self):
         """Load inventory alerts"""
         try:
-            # Clear existing alerts
-            for item in self.alerts_tree.get_children():
-                self.alerts_tree.delete(item)
-
             # Get inventory status
-            inventory = self.services['inventory'].get_inventory_status()
+            inventory = self._get_inventory()
 
             # Add low stock and out of stock items
+            rows = []
             for item in inventory['items']:
                 if item['quantity'] <= item['reorder_level']:
                     priority = "Critical" if item['quantity'] == 0 else "Low"
                     status = "Out of Stock" if item['quantity'] == 0 else "Low Stock"
 
-                    self.alerts_tree.insert("", "end", values=(
+                    rows.append(((
                         priority,
                         item['name'],
                         item['quantity'],
                         item['reorder_level'],
                         status
-                    ))
+                    ), ()))
+            self._replace_rows(self.alerts_tree, self.alerts_scrollbar, rows)
 
         except Exception as e:
             logger.error(f"Error loading alerts: {str(e)}")
@@ -753,81 +934,92 @@ class InventoryScreen(ttk.Frame):
 
     def generate_reorder_report(self):
         """Generate and export reorder report"""
-        try:
-            report_data = self.services['inventory'].generate_reorder_report()
-
-            # Save file
-            import tkinter.filedialog as filedialog
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".pdf",
-                filetypes=[("PDF files", "*.pdf")],
-                initialfile=f"reorder_report_{datetime.now().strftime('%Y%m%d')}.pdf"
-            )
-
-            if filename:
-                with open(filename, 'wb') as f:
-                    f.write(report_data)
-                messagebox.showinfo("Success", "Reorder report generated successfully!")
+        # Save file
+        import tkinter.filedialog as filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("PDF files", "*.pdf")],
+            initialfile=f"reorder_report_{self._today.strftime('%Y%m%d')}.pdf"
+        )
+        if not filename:
+            return
 
-        except Exception as e:
-            logger.error(f"Error generating reorder report: {str(e)}")
-            messagebox.showerror("Error", "Failed to generate reorder report")
+        self._run_in_background(
+            lambda: self._write_export(
+                filename, self._get_worker_services()['inventory'].generate_reorder_report
+            ),
+            lambda _: messagebox.showinfo("Success", "Reorder report generated successfully!"),
+            self._on_export_error("generating reorder report", "Failed to generate reorder report"),
+            buttons=(self.reorder_btn,)
+        )
 
     def export_inventory(self):
         """Export current inventory list"""
-        try:
-            # Get current filters
-            search_term = self.search_var.get()
-            status_filter = self.status_var.get()
+        # Get current filters
+        search_term = self.search_var.get()
+        status_filter = self.status_var.get()
+
+        # Save file
+        import tkinter.filedialog as filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            initialfile=f"inventory_{self._today.strftime('%Y%m%d')}.csv"
+        )
+        if not filename:
+            return
 
-            # Generate report
-            report_data = self.services['inventory'].export_inventory(
+        self._run_in_background(
+            lambda: self._write_export(
+                filename,
+                self._get_worker_services()['inventory'].export_inventory,
                 search_term=search_term if search_term else None,
                 status_filter=status_filter if status_filter != "All" else None,
                 format='csv'
-            )
-
-            # Save file
-            import tkinter.filedialog as filedialog
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
-                initialfile=f"inventory_{datetime.now().strftime('%Y%m%d')}.csv"
-            )
-
-            if filename:
-                with open(filename, 'wb') as f:
-                    f.write(report_data)
-                messagebox.showinfo("Success", "Inventory exported successfully!")
-
-        except Exception as e:
-            logger.error(f"Error exporting inventory: {str(e)}")
-            messagebox.showerror("Error", "Failed to export inventory")
+            ),
+            lambda _: messagebox.showinfo("Success", "Inventory exported successfully!"),
+            self._on_export_error("exporting inventory", "Failed to export inventory"),
+            buttons=(self.export_btn,)
+        )
 
     def export_transactions(self):
         """Export transaction history"""
-        try:
-            # Generate report
-            report_data = self.services['inventory'].export_transactions(
-                start_date=self.start_date_var.get(),
-                end_date=self.end_date_var.get(),
-                transaction_type=self.trans_type_var.get() if self.trans_type_var.get() != "All" else None,
-                format='csv'
-            )
-
-            # Save file
-            import tkinter.filedialog as filedialog
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
-                initialfile=f"transactions_{datetime.now().strftime('%Y%m%d')}.csv"
-            )
+        start_date = self.start_date_var.get()
+        end_date = self.end_date_var.get()
+        transaction_type = self.trans_type_var.get()
+
+        # Save file
+        import tkinter.filedialog as filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            initialfile=f"transactions_{self._today.strftime('%Y%m%d')}.csv"
+        )
+        if not filename:
+            return
 
-            if filename:
-                with open(filename, 'wb') as f:
-                    f.write(report_data)
-                messagebox.showinfo("Success", "Transactions exported successfully!")
+        self._run_in_background(
+            lambda: self._write_export(
+                filename,
+                self._get_worker_services()['inventory'].export_transactions,
+                start_date=start_date,
+                end_date=end_date,
+                transaction_type=transaction_type if transaction_type != "All" else None,
+                format='csv'
+            ),
+            lambda _: messagebox.showinfo("Success", "Transactions exported successfully!"),
+            self._on_export_error("exporting transactions", "Failed to export transactions"),
+            buttons=(self.trans_export_btn,)
+        )
 
-        except Exception as e:
-            logger.error(f"Error exporting transactions: {str(e)}")
-            messagebox.showerror("Error", "Failed to export transactions")
\ No newline at end of file
+    @staticmethod
+    def _write_export(filename, export, **kwargs):
+        """Stream an export straight into filename (runs on the worker thread)"""
+        with open(filename, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+            export(out=f, **kwargs)
+
+    def _on_export_error(self, action, message):
+        def on_error(e):
+            logger.error(f"Error {action}: {str(e)}")
+            messagebox.showerror("Error", message)
+        return on_error
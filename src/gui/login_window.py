@@ -2,15 +2,14 @@
 import tkinter as tk
 from tkinter import messagebox
 import logging
-from src.database.database import get_session
-from src.bll import create_auth_service
-from src.gui.main_window import MainWindow
+import re
+from src.bll.service_provider import ServiceProvider
 
 try:
     from src.gui.styles import (
         ESPRESSO, DARK_BROWN, MEDIUM_BROWN, LIGHT_BROWN,
         CREAM, CARD_BG, BORDER, TEXT_DARK, TEXT_MID,
-        FONT_H2, FONT_BODY, FONT_SMALL,
+        FONT_H2, FONT_BODY, FONT_SMALL, init_fonts, screen_dims,
     )
 except ImportError:
     ESPRESSO = "#2C1A0E"; DARK_BROWN = "#4A2C17"; MEDIUM_BROWN = "#8B5E3C"
@@ -18,37 +17,47 @@ except ImportError:
     BORDER = "#C8A882"; TEXT_DARK = "#2D1B0E"; TEXT_MID = "#5C3B24"
     FONT_H2 = ("Helvetica", 15, "bold")
     FONT_BODY = ("Helvetica", 11); FONT_SMALL = ("Helvetica", 10)
+    init_fonts = lambda root: None  # unknown font names fall back to Tk's default
+    screen_dims = lambda root: (root.winfo_screenwidth(), root.winfo_screenheight())
 
 logger = logging.getLogger(__name__)
 
+# Anything that cannot be a username is turned away without a database query
+_USERNAME_RE = re.compile(r'^[A-Za-z0-9_.-]{1,64}$')
+
 
 class LoginWindow:
     _W, _H, _LEFT_W = 860, 560, 340
 
-    def __init__(self):
-        self.root = tk.Tk()
+    def __init__(self, root: tk.Tk):
+        self.root = root
         self._pw_visible = False
+        init_fonts(self.root)
         self._setup_window()
         self._build_left()
         self._build_right()
-        self.session = get_session()
-        self.auth_service = create_auth_service(self.session)
+        # Same session and auth service the main window will use
+        self.auth_service = ServiceProvider.get_instance().get_service('auth')
 
     # ------------------------------------------------------------------ setup
     def _setup_window(self):
         self.root.title("Brew & Bite Café")
         self.root.resizable(False, False)
-        sw = self.root.winfo_screenwidth()
-        sh = self.root.winfo_screenheight()
+        self.root.minsize(self._W, self._H)
+        sw, sh = screen_dims(self.root)
         self.root.geometry(
             f"{self._W}x{self._H}+{(sw - self._W) // 2}+{(sh - self._H) // 2}"
         )
         self.root.configure(bg=ESPRESSO)
         self.root.bind("<Return>", lambda _: self._do_login())
+        # Everything the login screen shows lives in this frame, so it can be
+        # swapped out for the main window without a new Tk root
+        self.frame = tk.Frame(self.root, bg=ESPRESSO)
+        self.frame.pack(fill="both", expand=True)
 
     # ------------------------------------------------------------------ left panel
     def _build_left(self):
-        panel = tk.Frame(self.root, bg=ESPRESSO, width=self._LEFT_W)
+        panel = tk.Frame(self.frame, bg=ESPRESSO, width=self._LEFT_W)
         panel.pack(side="left", fill="y")
         panel.pack_propagate(False)
 
@@ -58,16 +67,16 @@ class LoginWindow:
         icon_frame = tk.Frame(panel, bg=DARK_BROWN, width=90, height=90)
         icon_frame.pack()
         icon_frame.pack_propagate(False)
-        tk.Label(icon_frame, text="☕", font=("Helvetica", 44),
+        tk.Label(icon_frame, text="☕", font="BB_H44",
                  bg=DARK_BROWN, fg=CARD_BG).place(relx=0.5, rely=0.5, anchor="center")
 
         tk.Frame(panel, bg=ESPRESSO, height=18).pack()
 
         tk.Label(panel, text="Brew & Bite",
-                 font=("Helvetica", 26, "bold"),
+                 font="BB_H26B",
                  bg=ESPRESSO, fg=CARD_BG).pack()
         tk.Label(panel, text="C  A  F  É",
-                 font=("Helvetica", 10, "bold"),
+                 font="BB_H10B",
                  bg=ESPRESSO, fg=LIGHT_BROWN).pack(pady=(2, 0))
 
         tk.Frame(panel, bg=DARK_BROWN, height=1).pack(fill="x", padx=36, pady=22)
@@ -86,17 +95,17 @@ class LoginWindow:
             "—   Inventory control",
             "—   Financial analytics",
         ):
-            tk.Label(panel, text=feat, font=("Helvetica", 9),
+            tk.Label(panel, text=feat, font="BB_H9",
                      bg=ESPRESSO, fg="#A07860", anchor="w").pack(
                          fill="x", padx=38, pady=3)
 
         tk.Label(panel, text="v 1.0.0",
-                 font=("Helvetica", 8),
+                 font="BB_H8",
                  bg=ESPRESSO, fg=DARK_BROWN).pack(side="bottom", pady=14)
 
     # ------------------------------------------------------------------ right panel
     def _build_right(self):
-        right = tk.Frame(self.root, bg=CARD_BG)
+        right = tk.Frame(self.frame, bg=CARD_BG)
         right.pack(side="right", fill="both", expand=True)
 
         wrap = tk.Frame(right, bg=CARD_BG)
@@ -104,11 +113,11 @@ class LoginWindow:
 
         # Heading
         tk.Label(wrap, text="Welcome Back",
-                 font=("Helvetica", 22, "bold"),
+                 font="BB_H22B",
                  bg=CARD_BG, fg=ESPRESSO).pack(anchor="w")
         tk.Label(wrap,
                  text="Sign in to your management dashboard",
-                 font=("Helvetica", 10),
+                 font="BB_H10",
                  bg=CARD_BG, fg=TEXT_MID).pack(anchor="w", pady=(3, 0))
         tk.Frame(wrap, bg=BORDER, height=1).pack(fill="x", pady=(16, 0))
 
@@ -129,7 +138,7 @@ class LoginWindow:
         )
         self.password_entry.pack(side="left", fill="x", expand=True,
                                   ipady=9, padx=(10, 0))
-        eye = tk.Label(pw_inner, text="Show", font=("Helvetica", 9),
+        eye = tk.Label(pw_inner, text="Show", font="BB_H9",
                        bg=CARD_BG, fg=TEXT_MID, cursor="hand2", padx=10)
         eye.pack(side="right")
         eye.bind("<Button-1>", self._toggle_pw)
@@ -140,7 +149,7 @@ class LoginWindow:
         self.remember_var = tk.BooleanVar(value=False)
         tk.Checkbutton(row, text="Remember me",
                        variable=self.remember_var,
-                       font=("Helvetica", 9), bg=CARD_BG, fg=TEXT_MID,
+                       font="BB_H9", bg=CARD_BG, fg=TEXT_MID,
                        activebackground=CARD_BG,
                        highlightthickness=0, cursor="hand2").pack(side="left")
         fgt = tk.Label(row, text="Forgot password?",
@@ -154,7 +163,7 @@ class LoginWindow:
         btn_frame = tk.Frame(wrap, bg=MEDIUM_BROWN, cursor="hand2")
         btn_frame.pack(fill="x")
         btn_lbl = tk.Label(btn_frame, text="Sign In",
-                           font=("Helvetica", 12, "bold"),
+                           font="BB_H12B",
                            bg=MEDIUM_BROWN, fg=CARD_BG,
                            cursor="hand2", pady=12)
         btn_lbl.pack(fill="x")
@@ -171,7 +180,7 @@ class LoginWindow:
     @staticmethod
     def _lbl(parent, text):
         tk.Label(parent, text=text,
-                 font=("Helvetica", 10, "bold"),
+                 font="BB_H10B",
                  bg=CARD_BG, fg=TEXT_MID).pack(anchor="w", pady=(14, 3))
 
     @staticmethod
@@ -198,12 +207,16 @@ class LoginWindow:
             messagebox.showerror("Error",
                                  "Please enter both username and password")
             return
+        if not _USERNAME_RE.match(username):
+            # Same message the auth service gives, so it reveals nothing extra
+            messagebox.showerror("Login Failed", "Invalid username or password")
+            self.password_entry.delete(0, "end")
+            return
         try:
             ok, user_data, err = self.auth_service.login(username, password)
             if ok and user_data:
                 logger.info(f"User logged in: {username}")
-                self.root.withdraw()
-                MainWindow(user_data).run()
+                self._open_main_window(user_data)
             else:
                 messagebox.showerror("Login Failed",
                                      err or "Invalid credentials")
@@ -213,6 +226,15 @@ class LoginWindow:
             logger.error(f"Login error: {exc}")
             messagebox.showerror("Error", "An error occurred during login")
 
+    def _open_main_window(self, user_data):
+        """Replace the login form with the main window in the same root"""
+        # Imported here so the login screen paints before the main
+        # window and its screens are loaded
+        from src.gui.main_window import MainWindow
+        self.root.unbind("<Return>")
+        self.frame.destroy()
+        MainWindow(user_data, self.root)
+
     def login(self):
         self._do_login()
 
@@ -229,13 +251,13 @@ class LoginWindow:
         )
 
         tk.Label(win, text="Reset Password",
-                 font=("Helvetica", 16, "bold"),
+                 font="BB_H16B",
                  bg=CARD_BG, fg=ESPRESSO).pack(pady=(24, 4))
         tk.Label(win, text="Enter your email to receive reset instructions.",
-                 font=("Helvetica", 9), bg=CARD_BG, fg=TEXT_MID).pack()
+                 font="BB_H9", bg=CARD_BG, fg=TEXT_MID).pack()
 
         tk.Label(win, text="Email Address",
-                 font=("Helvetica", 10, "bold"),
+                 font="BB_H10B",
                  bg=CARD_BG, fg=TEXT_MID).pack(anchor="w", padx=32, pady=(16, 3))
         outer = tk.Frame(win, bg=BORDER, pady=1, padx=1)
         outer.pack(fill="x", padx=32)
@@ -268,7 +290,7 @@ class LoginWindow:
 
         send_btn = tk.Button(
             win, text="Send Reset Link",
-            font=("Helvetica", 11, "bold"),
+            font="BB_H11B",
             bg=MEDIUM_BROWN, fg=CARD_BG,
             activebackground=DARK_BROWN, activeforeground=CARD_BG,
             relief="flat", bd=0, cursor="hand2", command=_send)
@@ -2,37 +2,53 @@ from typing import Dict, Optional
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import time
 from datetime import datetime, timedelta
 
-from src.gui.dialogs import ChangePasswordDialog, UserManualDialog
-from src.gui.sales_screen import SalesScreen
-from src.gui.inventory_screen import InventoryScreen
-from src.gui.expense_screen import ExpenseScreen
-from src.gui.reports_screen import ReportsScreen
-from src.gui.user_management_screen import UserManagementScreen
-from src.gui.styles import (apply_theme, ESPRESSO, DARK_BROWN, MEDIUM_BROWN,
+# Screens and dialogs are imported when first opened so the main window
+# paints without loading every view module up front
+from src.gui.styles import (apply_theme, screen_dims, ESPRESSO, DARK_BROWN, MEDIUM_BROWN,
                              LIGHT_BROWN, CREAM, CARD_BG, BORDER, SIDEBAR_TEXT,
                              SIDEBAR_MUTED, TEXT_DARK, TEXT_MID, TEXT_LIGHT,
                              SUCCESS, WARNING, DANGER, ROW_DANGER_BG, ROW_WARNING_BG,
                              FONT_H1, FONT_H2, FONT_H3, FONT_BODY, FONT_SMALL)
+from src.gui.background import BackgroundWorker
 from src.database.models import UserRole
 from src.bll.service_provider import ServiceProvider
-from src.bll.user_service import UserService
-from src.bll.sales_service import SalesService
-from src.bll.expense_service import ExpenseService
-from src.bll.inventory_service import InventoryService
-from src.bll.reporting_service import ReportingService
 
 logger = logging.getLogger(__name__)
 
+# Seconds a dashboard figure is reused before it is queried again
+_DASHBOARD_CACHE_TTL = 30
+_ACTIVITY_CACHE_TTL = 10
 
-class MainWindow:
-    def __init__(self, user_data: Dict):
+# Activity feed rows fetched per page; "Load more" appends the next page
+_ACTIVITY_PAGE_SIZE = 200
+
+# Idle time before automatic logout, and how often user activity is recorded
+_IDLE_LOGOUT_SECONDS = 1800
+_ACTIVITY_RESET_INTERVAL = 5
+_ACTIVITY_EVENTS = ("<Key>", "<Button>")
+
+
+class MainWindow(BackgroundWorker):
+    def __init__(self, user_data: Dict, root: tk.Tk):
         self.user_data = user_data
-        self.last_activity = datetime.now()
+        # The auth service sends the role's value, but accept the enum as well
+        self.role_name = getattr(user_data['role'], 'value', user_data['role'])
+        self.is_admin = self.role_name == UserRole.ADMIN.value
+        self.last_activity = time.monotonic()
         self._active_nav = None
-
-        self.root = tk.Tk()
+        self._dashboard_request = 0
+        # Dashboard queries run here, on services bound to the worker's own session
+        self._start_worker("dashboard")
+        self._dash_cache = {}  # (date, user id, figure) -> (fetched_at, result)
+        self._dashboard = None  # built on first visit, then kept
+        self._dashboard_loaded = False
+        self._loading = False  # navigation is ignored while a load is in flight
+        self._pages = {}  # nav key -> (page frame, screen), built on first visit
+
+        self.root = root
         self.style = apply_theme(self.root)
         self.setup_window()
 
@@ -54,23 +70,19 @@ class MainWindow:
         self.root.configure(bg=CREAM)
         self.root.grid_columnconfigure(1, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
+        self.root.bind("<F5>", lambda _: self.refresh_dashboard())
 
         # Start maximised — fills screen but keeps macOS menu bar / Dock
-        self.root.update_idletasks()
-        sw = self.root.winfo_screenwidth()
-        sh = self.root.winfo_screenheight()
+        sw, sh = screen_dims(self.root)
         self.root.geometry(f"{sw}x{sh}+0+0")
 
     def create_services(self):
         try:
-            session = self.auth_service.session
+            # Reuse the provider's services rather than building a second set
+            # on the same session for every login
             self.services = {
-                'auth':      self.auth_service,
-                'user':      UserService(session),
-                'sales':     SalesService(session),
-                'expense':   ExpenseService(session),
-                'inventory': InventoryService(session),
-                'reporting': ReportingService(session),
+                name: self.service_provider.get_service(name)
+                for name in ('auth', 'user', 'sales', 'expense', 'inventory', 'reporting')
             }
         except Exception as e:
             logger.error(f"Error creating services: {e}")
@@ -121,21 +133,21 @@ class MainWindow:
         icon_box = tk.Frame(top_row, bg=ESPRESSO, width=44, height=44)
         icon_box.pack(side="left")
         icon_box.pack_propagate(False)
-        tk.Label(icon_box, text="☕", font=("Helvetica", 22),
+        tk.Label(icon_box, text="☕", font="BB_H22",
                  bg=ESPRESSO, fg=CARD_BG).place(relx=0.5, rely=0.5, anchor="center")
         name_col = tk.Frame(top_row, bg=DARK_BROWN)
         name_col.pack(side="left", padx=(10, 0))
         tk.Label(name_col, text="Brew & Bite",
-                 font=("Helvetica", 14, "bold"),
+                 font="BB_H14B",
                  bg=DARK_BROWN, fg=CARD_BG).pack(anchor="w")
         tk.Label(name_col, text="Café Management",
-                 font=("Helvetica", 8),
+                 font="BB_H8",
                  bg=DARK_BROWN, fg=LIGHT_BROWN).pack(anchor="w")
 
         # --- Nav section label ---
         tk.Frame(self.sidebar, bg=DARK_BROWN, height=1).pack(fill="x")
         tk.Label(self.sidebar, text="  MAIN MENU",
-                 font=("Helvetica", 8, "bold"),
+                 font="BB_H8B",
                  bg=ESPRESSO, fg=SIDEBAR_MUTED).pack(anchor="w", padx=14, pady=(14, 4))
 
         # --- Nav items with left-border indicator ---
@@ -148,7 +160,7 @@ class MainWindow:
             ("expenses",  "Expenses",        self.load_expenses),
             ("reports",   "Reports",         self.load_reports),
         ]
-        if self.user_data['role'] == UserRole.ADMIN.value:
+        if self.is_admin:
             nav_items.append(("users", "User Management", self.load_user_management))
 
         for key, label, cmd in nav_items:
@@ -179,24 +191,24 @@ class MainWindow:
         bottom = tk.Frame(self.sidebar, bg=ESPRESSO, pady=14, padx=14)
         bottom.pack(side="bottom", fill="x")
 
-        role_colour = LIGHT_BROWN if self.user_data['role'] == UserRole.ADMIN.value else "#7DB0A0"
+        role_colour = LIGHT_BROWN if self.is_admin else "#7DB0A0"
         initials = self.user_data['username'][:2].upper()
         avatar = tk.Frame(bottom, bg=MEDIUM_BROWN, width=36, height=36)
         avatar.pack(side="left")
         avatar.pack_propagate(False)
-        tk.Label(avatar, text=initials, font=("Helvetica", 12, "bold"),
+        tk.Label(avatar, text=initials, font="BB_H12B",
                  bg=MEDIUM_BROWN, fg=CARD_BG).place(relx=0.5, rely=0.5, anchor="center")
 
         info = tk.Frame(bottom, bg=ESPRESSO)
         info.pack(side="left", padx=(10, 0))
         tk.Label(info, text=self.user_data['username'],
-                 font=("Helvetica", 10, "bold"),
+                 font="BB_H10B",
                  bg=ESPRESSO, fg=CARD_BG).pack(anchor="w")
-        tk.Label(info, text=self.user_data['role'],
-                 font=("Helvetica", 8),
+        tk.Label(info, text=self.role_name,
+                 font="BB_H8",
                  bg=ESPRESSO, fg=role_colour).pack(anchor="w")
 
-        logout_btn = tk.Label(bottom, text="Logout", font=("Helvetica", 8),
+        logout_btn = tk.Label(bottom, text="Logout", font="BB_H8",
                               bg=ESPRESSO, fg=SIDEBAR_MUTED, cursor="hand2")
         logout_btn.pack(side="right")
         logout_btn.bind("<Button-1>", lambda _: self.logout())
@@ -204,6 +216,8 @@ class MainWindow:
         logout_btn.bind("<Leave>", lambda _: logout_btn.configure(fg=SIDEBAR_MUTED))
 
     def _nav_click(self, key: str, command):
+        if self._loading:
+            return
         for k, (row, ind, cont) in self._nav_buttons.items():
             is_active = (k == key)
             bg = DARK_BROWN if is_active else ESPRESSO
@@ -213,10 +227,16 @@ class MainWindow:
             for child in cont.winfo_children():
                 child.configure(bg=bg,
                                 fg=CARD_BG if is_active else SIDEBAR_TEXT,
-                                font=("Helvetica", 11, "bold") if is_active else FONT_BODY)
+                                font="BB_H11B" if is_active else FONT_BODY)
         self._active_nav = key
         command()
 
+    def _set_loading(self, loading: bool):
+        """Block navigation, showing a busy cursor on the nav items, while a load runs"""
+        self._loading = loading
+        for row, _, _ in self._nav_buttons.values():
+            row.configure(cursor="watch" if loading else "hand2")
+
     def _nav_hover(self, key: str, entering: bool):
         if key == self._active_nav:
             return
@@ -227,10 +247,16 @@ class MainWindow:
             child.configure(bg=bg)
 
     def create_main_content(self):
-        self.main_content = tk.Frame(self.root, bg=CREAM)
-        self.main_content.grid(row=0, column=1, sticky="nsew", padx=0, pady=0)
+        # Each screen is a page of a notebook with no tabs: it is built on
+        # first visit and afterwards only selected, so it keeps its state
+        self.notebook = ttk.Notebook(self.root, style="Hidden.TNotebook")
+        self.notebook.grid(row=0, column=1, sticky="nsew", padx=0, pady=0)
+
+        # The dashboard page
+        self.main_content = tk.Frame(self.notebook, bg=CREAM)
         self.main_content.grid_rowconfigure(0, weight=1)
         self.main_content.grid_columnconfigure(0, weight=1)
+        self.notebook.add(self.main_content)
 
     def create_status_bar(self):
         bar = tk.Frame(self.root, bg=ESPRESSO, height=28)
@@ -238,9 +264,9 @@ class MainWindow:
         bar.grid_propagate(False)
 
         tk.Label(bar, text="  ☕  Brew & Bite  ·  Management System  v1.0",
-                 font=("Helvetica", 9), bg=ESPRESSO, fg=SIDEBAR_MUTED).pack(side="left")
+                 font="BB_H9", bg=ESPRESSO, fg=SIDEBAR_MUTED).pack(side="left")
 
-        self.time_label = tk.Label(bar, font=("Helvetica", 9),
+        self.time_label = tk.Label(bar, font="BB_H9",
                                    bg=ESPRESSO, fg=SIDEBAR_MUTED)
         self.time_label.pack(side="right", padx=12)
         self.update_time()
@@ -249,30 +275,107 @@ class MainWindow:
     # Dashboard
     # ------------------------------------------------------------------
     def load_dashboard(self):
+        if self._loading:
+            return
+        self.notebook.select(self.main_content)
         self._clear_main_content()
         self._nav_click("dashboard", lambda: None)
 
-        today     = datetime.now()
+        # The dashboard is built once and refilled on each visit; until its
+        # first figures arrive a placeholder stands in for it
+        if self._dashboard is None:
+            self._build_dashboard()
+        if self._dashboard_loaded:
+            self._dashboard.pack(fill="both", expand=True, padx=28, pady=20)
+        else:
+            self._show_loading_placeholder()
+            # Paint the placeholder now rather than after the first poll. Only
+            # update_idletasks() may flush here: root.update() would dispatch
+            # pending events (e.g. a second nav click) inside this method.
+            self.main_content.update_idletasks()
+        request = self._dashboard_request
+        today = datetime.now()
+
+        def on_done(data):
+            self._set_loading(False)
+            # Drop results if the user has navigated away in the meantime
+            if request == self._dashboard_request:
+                self._render_dashboard(today, data)
+                if not self._dashboard_loaded:
+                    self._dashboard_loaded = True
+                    self._clear_main_content()
+                    self._dashboard.pack(fill="both", expand=True, padx=28, pady=20)
+
+        def on_error(e):
+            logger.error(f"Error loading dashboard: {e}")
+            self._set_loading(False)
+            if request == self._dashboard_request:
+                self._clear_main_content()
+                self._show_error_placeholder("Could not load the dashboard.")
+
+        self._set_loading(True)
+        self._run_in_background(lambda: self._fetch_dashboard_data(today), on_done, on_error)
+
+    def _fetch_dashboard_data(self, today: datetime) -> Dict:
+        """Run the dashboard queries (on the worker thread, with its own session)"""
+        services = self._get_worker_services()
+
         today_str = today.strftime('%Y-%m-%d')
         week_start = (today - timedelta(days=6)).strftime('%Y-%m-%d')
 
+        def cached(name, fn, ttl=_DASHBOARD_CACHE_TTL):
+            return self._cached((today_str, self.user_data['id'], name), ttl, fn)
+
         # Load each data source independently so one failure doesn't block others
-        sales_summary    = self._safe_service_call(
-            lambda: self.services['sales'].get_daily_sales_summary(today_str),
-            {'summary': {'total_sales': 0.0, 'transaction_count': 0, 'average_sale': 0.0},
-             'top_items': []}
-        )
-        expense_summary  = self._safe_service_call(
-            lambda: self.services['expense'].get_expense_summary(today_str, today_str),
-            {'summary': {'total_amount': 0.0, 'total_transactions': 0}}
-        )
-        inventory_status = self._safe_service_call(
-            lambda: self.services['inventory'].get_inventory_status(),
-            {'items': [], 'total_items': 0, 'total_value': 0.0, 'alerts': []}
-        )
+        data = {
+            'sales': self._safe_service_call(
+                services,
+                lambda: cached('sales', lambda: services['sales'].get_daily_sales_summary(today_str)),
+                {'summary': {'total_sales': 0.0, 'transaction_count': 0, 'average_sale': 0.0},
+                 'top_items': []}
+            ),
+            'expense': self._safe_service_call(
+                services,
+                lambda: cached('expense', lambda: services['expense'].get_expense_summary(
+                    today_str, today_str)),
+                {'summary': {'total_amount': 0.0, 'total_transactions': 0}}
+            ),
+            'inventory': self._safe_service_call(
+                services,
+                lambda: cached('inventory', services['inventory'].get_inventory_status),
+                {'items': [], 'total_items': 0, 'total_value': 0.0, 'alerts': []}
+            ),
+        }
 
-        outer = tk.Frame(self.main_content, bg=CREAM)
-        outer.pack(fill="both", expand=True, padx=28, pady=20)
+        try:
+            report = cached('chart', lambda: services['reporting'].generate_periodic_report(
+                start_date=week_start, end_date=today_str, group_by='day'
+            ))
+            chart_data = []
+            for d in report['sales_analysis']['over_time']:
+                raw_date = str(d['date'])
+                label    = raw_date[5:] if len(raw_date) >= 7 else raw_date
+                chart_data.append((label, float(d['total_amount'])))
+            data['chart'] = chart_data
+        except Exception as e:
+            logger.warning(f"Chart data error: {e}")
+            data['chart'] = []
+
+        try:
+            data['activities'] = cached(
+                'activities',
+                lambda: services['reporting'].get_recent_activities_formatted(
+                    limit=_ACTIVITY_PAGE_SIZE),
+                ttl=_ACTIVITY_CACHE_TTL
+            )
+        except Exception as e:
+            logger.warning(f"Activity feed error: {e}")
+            data['activities'] = None
+        return data
+
+    def _build_dashboard(self):
+        """Create the dashboard widgets once; _render_dashboard fills them in"""
+        outer = self._dashboard = tk.Frame(self.main_content, bg=CREAM)
 
         # ---- Page header ----
         ph = tk.Frame(outer, bg=CREAM)
@@ -281,21 +384,21 @@ class MainWindow:
         left_hdr = tk.Frame(ph, bg=CREAM)
         left_hdr.pack(side="left")
         tk.Label(left_hdr, text="Dashboard",
-                 font=("Helvetica", 22, "bold"), bg=CREAM, fg=ESPRESSO).pack(anchor="w")
-        tk.Label(left_hdr, text=today.strftime("%A, %d %B %Y"),
-                 font=FONT_SMALL, bg=CREAM, fg=TEXT_MID).pack(anchor="w", pady=(2, 0))
+                 font="BB_H22B", bg=CREAM, fg=ESPRESSO).pack(anchor="w")
+        self._dash_date_lbl = tk.Label(left_hdr, font=FONT_SMALL, bg=CREAM, fg=TEXT_MID)
+        self._dash_date_lbl.pack(anchor="w", pady=(2, 0))
 
         btn_frame = tk.Frame(ph, bg=CREAM)
         btn_frame.pack(side="right")
         new_sale = tk.Button(btn_frame, text="  + New Sale  ",
-                             font=("Helvetica", 10, "bold"),
+                             font="BB_H10B",
                              bg=MEDIUM_BROWN, fg=CARD_BG,
                              activebackground=DARK_BROWN, activeforeground=CARD_BG,
                              relief="flat", bd=0, cursor="hand2",
                              command=self.load_sales)
         new_sale.pack(side="right", ipady=7, ipadx=2)
         new_expense = tk.Button(btn_frame, text="  + Expense  ",
-                                font=("Helvetica", 10),
+                                font="BB_H10",
                                 bg=CARD_BG, fg=MEDIUM_BROWN,
                                 activebackground=BORDER, activeforeground=ESPRESSO,
                                 relief="flat", bd=0, cursor="hand2",
@@ -309,31 +412,11 @@ class MainWindow:
         for _i in range(4):
             cards_row.grid_columnconfigure(_i, weight=1)
 
-        net = (sales_summary['summary']['total_sales']
-               - expense_summary['summary']['total_amount'])
-        low_stock = len([i for i in inventory_status['items']
-                         if i['quantity'] <= i['reorder_level']])
-
-        card_data = [
-            ("Today's Revenue",
-             f"${sales_summary['summary']['total_sales']:,.2f}",
-             f"{sales_summary['summary']['transaction_count']} transactions",
-             MEDIUM_BROWN),
-            ("Today's Expenses",
-             f"${expense_summary['summary']['total_amount']:,.2f}",
-             f"{expense_summary['summary']['total_transactions']} recorded",
-             WARNING),
-            ("Net Income",
-             f"${net:,.2f}",
-             "Revenue − Expenses",
-             SUCCESS if net >= 0 else DANGER),
-            ("Inventory Alerts",
-             str(low_stock),
-             f"of {inventory_status['total_items']} items at reorder level",
-             DANGER if low_stock > 0 else SUCCESS),
+        self._stat_cards = [
+            self._make_stat_card(cards_row, title, col)
+            for col, title in enumerate(("Today's Revenue", "Today's Expenses",
+                                         "Net Income", "Inventory Alerts"))
         ]
-        for col, (title, value, sub, colour) in enumerate(card_data):
-            self._make_stat_card(cards_row, title, value, sub, colour, col)
 
         # ---- Lower section: chart (left) + activity feed (right) ----
         lower = tk.Frame(outer, bg=CREAM)
@@ -350,28 +433,14 @@ class MainWindow:
         ch_hdr = tk.Frame(chart_card, bg=CARD_BG)
         ch_hdr.pack(fill="x", padx=16, pady=(14, 4))
         tk.Label(ch_hdr, text="Sales — Last 7 Days",
-                 font=("Helvetica", 11, "bold"), bg=CARD_BG, fg=ESPRESSO).pack(side="left")
-        tk.Label(ch_hdr, text=f"{week_start}  →  {today_str}",
-                 font=("Helvetica", 8), bg=CARD_BG, fg=TEXT_MID).pack(side="right")
+                 font="BB_H11B", bg=CARD_BG, fg=ESPRESSO).pack(side="left")
+        self._chart_range_lbl = tk.Label(ch_hdr, font="BB_H8", bg=CARD_BG, fg=TEXT_MID)
+        self._chart_range_lbl.pack(side="right")
         tk.Frame(chart_card, bg=BORDER, height=1).pack(fill="x", padx=16)
 
         from src.gui.charts import BarChart
-        chart = BarChart(chart_card, bar_color=MEDIUM_BROWN)
-        chart.pack(fill="both", expand=True, padx=10, pady=(0, 10))
-
-        try:
-            report = self.services['reporting'].generate_periodic_report(
-                start_date=week_start, end_date=today_str, group_by='day'
-            )
-            chart_data = []
-            for d in report['sales_analysis']['over_time']:
-                raw_date = str(d['date'])
-                label    = raw_date[5:] if len(raw_date) >= 7 else raw_date
-                chart_data.append((label, float(d['total_amount'])))
-            chart.set_data(chart_data)
-        except Exception as e:
-            logger.warning(f"Chart data error: {e}")
-            chart.set_data([])
+        self._chart = BarChart(chart_card, bar_color=MEDIUM_BROWN)
+        self._chart.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
         # -- Recent activity feed --
         act_card = tk.Frame(lower, bg=CARD_BG,
@@ -381,48 +450,151 @@ class MainWindow:
         act_hdr = tk.Frame(act_card, bg=CARD_BG)
         act_hdr.pack(fill="x", padx=16, pady=(14, 4))
         tk.Label(act_hdr, text="Recent Activity",
-                 font=("Helvetica", 11, "bold"), bg=CARD_BG, fg=ESPRESSO).pack(side="left")
+                 font="BB_H11B", bg=CARD_BG, fg=ESPRESSO).pack(side="left")
+        self._act_more_btn = ttk.Button(act_hdr, text="Load more", style="Secondary.TButton",
+                                        command=self._load_more_activities, state="disabled")
+        self._act_more_btn.pack(side="right")
+        self._act_details_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(act_hdr, text="Details", variable=self._act_details_var,
+                        command=self._toggle_activity_details).pack(side="right", padx=(0, 8))
         tk.Frame(act_card, bg=BORDER, height=1).pack(fill="x", padx=16)
 
-        act_scroll = tk.Frame(act_card, bg=CARD_BG)
-        act_scroll.pack(fill="both", expand=True, padx=12, pady=(6, 10))
+        self._act_msg = tk.Label(act_card, bg=CARD_BG, fg=TEXT_MID, font=FONT_SMALL)
+
+        # Only the rows in view are drawn, so the feed can hold several pages
+        self._act_body = tk.Frame(act_card, bg=CARD_BG)
+        self._act_tree = ttk.Treeview(self._act_body, columns=("time", "type", "details", "amount"),
+                                      show="headings", selectmode="none")
+        # Fixed-width columns so a resize only widens Details; Details is
+        # hidden unless asked for so fewer cells are drawn per row
+        for col, heading, width, anchor in (("time", "Time", 80, "w"),
+                                            ("type", "Type", 70, "w"),
+                                            ("details", "Details", 160, "w"),
+                                            ("amount", "Amount", 80, "e")):
+            self._act_tree.heading(col, text=heading, anchor=anchor)
+            self._act_tree.column(col, width=width, anchor=anchor, stretch=(col == "details"))
+        self._toggle_activity_details()
+        # Rows are tagged with their type column ("Sale" / "Expense")
+        self._act_tree.tag_configure("Sale", foreground=SUCCESS)
+        self._act_tree.tag_configure("Expense", foreground=DANGER)
+        act_sb = ttk.Scrollbar(self._act_body, orient="vertical", command=self._act_tree.yview)
+        self._act_tree.configure(yscrollcommand=act_sb.set)
+        self._act_tree.pack(side="left", fill="both", expand=True)
+        act_sb.pack(side="right", fill="y")
+
+    def _render_dashboard(self, today: datetime, data: Dict):
+        """Update the dashboard widgets from _fetch_dashboard_data() results"""
+        sales_summary    = data['sales']
+        expense_summary  = data['expense']
+        inventory_status = data['inventory']
+        today_str  = today.strftime('%Y-%m-%d')
+        week_start = (today - timedelta(days=6)).strftime('%Y-%m-%d')
+
+        self._dash_date_lbl.configure(text=today.strftime("%A, %d %B %Y"))
+
+        net = (sales_summary['summary']['total_sales']
+               - expense_summary['summary']['total_amount'])
+        low_stock = len([i for i in inventory_status['items']
+                         if i['quantity'] <= i['reorder_level']])
+
+        card_data = [
+            (f"${sales_summary['summary']['total_sales']:,.2f}",
+             f"{sales_summary['summary']['transaction_count']} transactions",
+             MEDIUM_BROWN),
+            (f"${expense_summary['summary']['total_amount']:,.2f}",
+             f"{expense_summary['summary']['total_transactions']} recorded",
+             WARNING),
+            (f"${net:,.2f}",
+             "Revenue − Expenses",
+             SUCCESS if net >= 0 else DANGER),
+            (str(low_stock),
+             f"of {inventory_status['total_items']} items at reorder level",
+             DANGER if low_stock > 0 else SUCCESS),
+        ]
+        for (stripe, value_lbl, sub_lbl), (value, sub, colour) in zip(self._stat_cards, card_data):
+            stripe.configure(bg=colour)
+            value_lbl.configure(text=value, fg=colour)
+            sub_lbl.configure(text=sub)
+
+        self._chart_range_lbl.configure(text=f"{week_start}  →  {today_str}")
+        self._chart.set_data(data['chart'])
+
+        self._fill_activity_feed(data['activities'])
+
+    def _fill_activity_feed(self, activities):
+        """Replace the activity feed rows; activities is None if it failed to load"""
+        if not activities:
+            self._act_body.pack_forget()
+            self._act_more_btn.state(["disabled"])
+            self._act_msg.configure(text="Could not load activity." if activities is None
+                                    else "No activity recorded yet.")
+            self._act_msg.pack(pady=30)
+            return
 
+        self._act_msg.pack_forget()
+        # Refill the tree while it is unpacked so Tk lays it out once, not per row
+        self._act_body.pack_forget()
         try:
-            activities = self.services['reporting'].get_recent_activities()
-            if not activities:
-                tk.Label(act_scroll, text="No activity recorded yet.",
-                         bg=CARD_BG, fg=TEXT_MID,
-                         font=FONT_SMALL).pack(pady=30)
-            else:
-                for i, act in enumerate(activities[:14]):
-                    row_bg = "#F9F5F0" if i % 2 == 0 else CARD_BG
-                    row = tk.Frame(act_scroll, bg=row_bg, pady=5, padx=6)
-                    row.pack(fill="x")
-
-                    tk.Label(row, text=act['timestamp'].strftime("%H:%M"),
-                             font=("Courier", 8), bg=row_bg, fg=TEXT_MID,
-                             width=5, anchor="w").pack(side="left")
-
-                    badge_bg = MEDIUM_BROWN if act['type'] == 'SALE' else "#C87030"
-                    badge = tk.Label(row, text=f" {act['type'][:4]} ",
-                                     font=("Helvetica", 8, "bold"),
-                                     bg=badge_bg, fg=CARD_BG)
-                    badge.pack(side="left", padx=(4, 6))
-
-                    tk.Label(row, text=act['details'][:22],
-                             font=("Helvetica", 9), bg=row_bg,
-                             fg=TEXT_DARK, anchor="w").pack(side="left", fill="x", expand=True)
-
-                    amt_color = SUCCESS if act['type'] == 'SALE' else DANGER
-                    tk.Label(row, text=f"${act['amount']:,.2f}",
-                             font=("Helvetica", 9, "bold"), bg=row_bg,
-                             fg=amt_color, anchor="e").pack(side="right")
-        except Exception as e:
-            logger.warning(f"Activity feed error: {e}")
-            tk.Label(act_scroll, text="Could not load activity.",
-                     bg=CARD_BG, fg=TEXT_MID, font=FONT_SMALL).pack(pady=20)
+            self._act_tree.delete(*self._act_tree.get_children())
+            self._append_activities(activities)
+        finally:
+            self._act_body.pack(fill="both", expand=True, padx=12, pady=(6, 10))
+
+    def _append_activities(self, activities):
+        """Add a page of pre-formatted activity rows to the end of the feed"""
+        tree = self._act_tree
+        for row in activities:
+            tree.insert("", "end", values=row, tags=(row[1],))
+        # A short page means there is nothing further back to load
+        self._act_more_btn.state(["!disabled" if len(activities) == _ACTIVITY_PAGE_SIZE
+                                  else "disabled"])
+
+    def _toggle_activity_details(self):
+        """Show or hide the Details column of the activity feed"""
+        self._act_tree.configure(displaycolumns=(
+            ("time", "type", "details", "amount") if self._act_details_var.get()
+            else ("time", "type", "amount")
+        ))
+
+    def _load_more_activities(self):
+        """Fetch the next page of activities and append it to the feed"""
+        offset = len(self._act_tree.get_children())
+        request = self._dashboard_request
+        self._act_more_btn.state(["disabled"])
+
+        def on_done(activities):
+            if request == self._dashboard_request:
+                self._append_activities(activities)
+
+        def on_error(e):
+            logger.error(f"Error loading activities: {e}")
+            if request == self._dashboard_request:
+                self._act_more_btn.state(["!disabled"])
+                messagebox.showerror("Error", "Could not load more activity.")
+
+        self._run_in_background(
+            lambda: self._get_worker_services()['reporting'].get_recent_activities_formatted(
+                limit=_ACTIVITY_PAGE_SIZE, offset=offset),
+            on_done, on_error
+        )
 
-    def _safe_service_call(self, fn, default):
+    def _cached(self, key, ttl: float, fn):
+        """fn(), reusing a result for key that is younger than ttl seconds"""
+        cached = self._dash_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        result = fn()
+        self._dash_cache[key] = (time.monotonic(), result)
+        return result
+
+    def refresh_dashboard(self):
+        """Reload the dashboard, bypassing cached figures"""
+        if self._active_nav == "dashboard":
+            self._dash_cache.clear()
+            self.load_dashboard()
+
+    @staticmethod
+    def _safe_service_call(services, fn, default):
         """Call a service function; on failure rollback session and return default."""
         try:
             return fn()
@@ -430,21 +602,33 @@ class MainWindow:
             logger.error(f"Service call failed: {e}")
             try:
                 # Recover the shared session so subsequent calls can still work
-                self.services['sales'].session.rollback()
+                services['sales'].session.rollback()
             except Exception:
                 pass
             return default
 
+    def _show_loading_placeholder(self):
+        """Show a loading message in the main content area."""
+        f = tk.Frame(self.main_content, bg=CREAM)
+        f.pack(fill="both", expand=True)
+        tk.Label(f, text="Loading…", font=FONT_BODY,
+                 bg=CREAM, fg=TEXT_MID).pack(pady=(80, 0))
+
+    def _worker_widget(self):
+        """Dashboard results are dropped once it is gone (logged out)"""
+        return self.main_content
+
     def _show_error_placeholder(self, message: str):
         """Show a styled error message in the main content area."""
         f = tk.Frame(self.main_content, bg=CREAM)
         f.pack(fill="both", expand=True)
-        tk.Label(f, text="!", font=("Helvetica", 40, "bold"),
+        tk.Label(f, text="!", font="BB_H40B",
                  bg=CREAM, fg=DANGER).pack(pady=(60, 8))
         tk.Label(f, text=message, font=FONT_BODY,
                  bg=CREAM, fg=TEXT_MID, justify="center").pack()
 
-    def _make_stat_card(self, parent, title, value, subtitle, colour, col):
+    def _make_stat_card(self, parent, title, col):
+        """Create a KPI card; returns the (stripe, value, subtitle) widgets to update"""
         card = tk.Frame(parent, bg=CARD_BG,
                         highlightbackground=BORDER, highlightthickness=1)
         card.grid(row=0, column=col, padx=5, pady=4, sticky="nsew")
@@ -452,80 +636,124 @@ class MainWindow:
         body = tk.Frame(card, bg=CARD_BG)
         body.pack(fill="both", expand=True)
 
-        tk.Frame(body, bg=colour, width=5).pack(side="left", fill="y")
+        stripe = tk.Frame(body, bg=BORDER, width=5)
+        stripe.pack(side="left", fill="y")
 
         content = tk.Frame(body, bg=CARD_BG, padx=14, pady=14)
         content.pack(side="left", fill="both", expand=True)
 
-        tk.Label(content, text=title, font=("Helvetica", 9),
-                 bg=CARD_BG, fg=TEXT_MID).pack(anchor="w")
-        tk.Label(content, text=value,
-                 font=("Helvetica", 24, "bold"),
-                 bg=CARD_BG, fg=colour).pack(anchor="w", pady=(6, 2))
-        tk.Label(content, text=subtitle,
-                 font=("Helvetica", 9),
+        tk.Label(content, text=title, font="BB_H9",
                  bg=CARD_BG, fg=TEXT_MID).pack(anchor="w")
+        value_lbl = tk.Label(content, text="—",
+                             font="BB_H24B",
+                             bg=CARD_BG, fg=TEXT_MID)
+        value_lbl.pack(anchor="w", pady=(6, 2))
+        sub_lbl = tk.Label(content, text="",
+                           font="BB_H9",
+                           bg=CARD_BG, fg=TEXT_MID)
+        sub_lbl.pack(anchor="w")
+        return stripe, value_lbl, sub_lbl
 
     # ------------------------------------------------------------------
     # Navigation helpers
     # ------------------------------------------------------------------
     def _clear_main_content(self):
+        # Clearing the dashboard page also discards a dashboard load still in flight
+        self._dashboard_request += 1
         for w in self.main_content.winfo_children():
-            w.destroy()
+            if w is self._dashboard:
+                w.pack_forget()
+            else:
+                w.destroy()
+
+    def _show_page(self, key: str, build, refresh=None):
+        """Select the page for key, building its screen with build(parent) on first
+        visit; on later visits refresh(screen), if given, reloads its data"""
+        if key in self._pages:
+            page, screen = self._pages[key]
+            self.notebook.select(page)
+            if refresh:
+                refresh(screen)
+            return
+        # Screens pack themselves, so each gets a plain frame as its page
+        page = tk.Frame(self.notebook, bg=CREAM)
+        self.notebook.add(page)
+        self.notebook.select(page)
+        screen = build(page)
+        screen.pack(fill="both", expand=True)
+        self._pages[key] = (page, screen)
 
     def load_sales(self):
-        self._clear_main_content()
-        SalesScreen(self.main_content, self.services).pack(fill="both", expand=True)
+        self._dash_cache.clear()  # the dashboard figures may change from here
+        from src.gui.sales_screen import SalesScreen
+        self._show_page("sales", lambda parent: SalesScreen(parent, self.services),
+                        SalesScreen.load_data)
 
     def load_inventory(self):
-        self._clear_main_content()
-        InventoryScreen(self.main_content, self.services).pack(fill="both", expand=True)
+        self._dash_cache.clear()  # the dashboard figures may change from here
+        from src.gui.inventory_screen import InventoryScreen
+        self._show_page("inventory", lambda parent: InventoryScreen(parent, self.services),
+                        InventoryScreen.load_data)
 
     def load_expenses(self):
-        self._clear_main_content()
-        ExpenseScreen(self.main_content, self.services).pack(fill="both", expand=True)
+        self._dash_cache.clear()  # the dashboard figures may change from here
+        from src.gui.expense_screen import ExpenseScreen
+        self._show_page("expenses", lambda parent: ExpenseScreen(parent, self.services),
+                        ExpenseScreen.load_data)
 
     def load_reports(self):
-        self._clear_main_content()
-        ReportsScreen(self.main_content, self.services).pack(fill="both", expand=True)
+        from src.gui.reports_screen import ReportsScreen
+        self._show_page("reports", lambda parent: ReportsScreen(parent, self.services),
+                        ReportsScreen.load_initial_data)
 
     def load_user_management(self):
-        self._clear_main_content()
-        UserManagementScreen(
-            self.main_content, self.services, self.user_data
-        ).pack(fill="both", expand=True)
+        # Users only change from this screen, so it needs no refresh on return
+        from src.gui.user_management_screen import UserManagementScreen
+        self._show_page("users", lambda parent: UserManagementScreen(
+            parent, self.services, self.user_data
+        ))
 
     # ------------------------------------------------------------------
     # Activity tracking / auto-logout
     # ------------------------------------------------------------------
     def setup_activity_tracking(self):
-        self.last_activity = datetime.now()
-        self.root.bind_all("<Key>",        self.reset_activity_timer)
-        self.root.bind_all("<Button>",     self.reset_activity_timer)
-        self.root.bind_all("<MouseWheel>", self.reset_activity_timer)
+        self.last_activity = time.monotonic()
+        # Bound on the main window only (its widgets all carry the root's
+        # bindtag), not on every dialog; wheel scrolling does not count
+        for sequence in _ACTIVITY_EVENTS:
+            self.root.bind(sequence, self.reset_activity_timer)
         self.check_activity()
 
     def reset_activity_timer(self, event=None):
-        self.last_activity = datetime.now()
+        # Runs on every key press and click; only record it every few seconds
+        now = time.monotonic()
+        if now - self.last_activity > _ACTIVITY_RESET_INTERVAL:
+            self.last_activity = now
 
     def check_activity(self):
-        if (datetime.now() - self.last_activity).seconds > 1800:
+        if time.monotonic() - self.last_activity > _IDLE_LOGOUT_SECONDS:
+            logger.info(f"Logging out {self.user_data['username']} after inactivity "
+                        f"at {datetime.now():%H:%M:%S}")
             self.logout()
         else:
-            self.root.after(60000, self.check_activity)
+            self._idle_job = self.root.after(60000, self.check_activity)
 
     def update_time(self):
-        self.time_label.config(
-            text=datetime.now().strftime("  %Y-%m-%d  %H:%M:%S  "))
-        self.root.after(1000, self.update_time)
+        # The clock shows minutes, so wake up once at the start of each minute
+        now = datetime.now()
+        self.time_label.config(text=now.strftime("  %Y-%m-%d  %H:%M  "))
+        self._clock_job = self.root.after(
+            (60 - now.second) * 1000 - now.microsecond // 1000, self.update_time)
 
     # ------------------------------------------------------------------
     # Dialogs / actions
     # ------------------------------------------------------------------
     def show_change_password(self):
+        from src.gui.dialogs import ChangePasswordDialog
         ChangePasswordDialog(self.root, self.services['auth'], self.user_data['id'])
 
     def show_manual(self):
+        from src.gui.dialogs import UserManualDialog
         UserManualDialog(self.root)
 
     def show_about(self):
@@ -542,9 +770,24 @@ class MainWindow:
             self.auth_service.logout(self.user_data['id'])
         except Exception:
             pass
-        self.root.destroy()
+        # Return connections to the pool and forget this user's loaded objects.
+        # This only stops the dashboard worker; each screen stops its own when
+        # it is destroyed below
+        self.service_provider.get_session().close()
+        self._stop_worker()
+        # Any dashboard result still in flight is for a window that is gone
+        self._dashboard_request += 1
+
+        # Hand the root back to a fresh login screen instead of creating a new Tk
+        for job in (self._clock_job, self._idle_job):
+            self.root.after_cancel(job)
+        for sequence in _ACTIVITY_EVENTS + ("<F5>",):
+            self.root.unbind(sequence)
+        self.root.config(menu="")
+        for widget in self.root.winfo_children():
+            widget.destroy()
         from src.gui.login_window import LoginWindow
-        LoginWindow().run()
+        LoginWindow(self.root)
 
     def quit_app(self):
         if messagebox.askyesno("Exit", "Are you sure you want to exit?"):
@@ -2,8 +2,11 @@ from typing import Dict, Optional
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from decimal import Decimal
+from src.gui.background import BackgroundWorker
 
 try:
     from src.gui.styles import (CREAM, CARD_BG, ESPRESSO, MEDIUM_BROWN, DARK_BROWN,
@@ -22,8 +25,30 @@ class DatePicker(ttk.Entry):
 
 logger = logging.getLogger(__name__)
 
+# Delay before a report type change regenerates the report, so scrolling
+# through the types with the arrow keys only builds the one settled on
+_REGEN_DELAY_MS = 200
 
-class ReportsScreen(ttk.Frame):
+# Report rows inserted per page; more are added as the view nears the end
+_REPORT_PAGE_SIZE = 100
+
+_money = "${:,.2f}".format
+
+# Seconds a fetched report is reused for the same type and date range, and how
+# many such reports are kept
+_REPORT_CACHE_TTL = 60
+_REPORT_CACHE_SIZE = 16
+
+# Write buffer for report exports; the report is streamed straight into it
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def _averages(totals, counts):
+    """totals[i] / counts[i] for each row, 0 where the count is 0"""
+    return [t / n if n > 0 else 0 for t, n in zip(totals, counts)]
+
+
+class ReportsScreen(BackgroundWorker, ttk.Frame):
     def __init__(self, parent, services: Dict):
         super().__init__(parent)
         self.parent = parent
@@ -37,6 +62,14 @@ class ReportsScreen(ttk.Frame):
         self.end_date_var = tk.StringVar(
             value=datetime.now().strftime("%Y-%m-%d")
         )
+        self._report_cache = OrderedDict()  # (kind, start, end) -> (fetched_at, report)
+        self._regen_after_id = None
+        # Report queries run on the worker so the window stays responsive; a
+        # newer request supersedes any still in flight
+        self._start_worker("reports-screen")
+        self._report_request = 0
+        self._active_pane = None
+        self.bind("<Destroy>", self._on_destroy)
 
         self.create_widgets()
         self.load_initial_data()
@@ -61,16 +94,16 @@ class ReportsScreen(ttk.Frame):
                  font=("Helvetica", 9),
                  bg=bg, fg=TEXT_MID if _HAS_STYLES else "#555").pack(anchor="w", pady=(2, 0))
 
-        export_btn = tk.Button(inner_hdr, text="  Export CSV  ",
-                               font=("Helvetica", 10),
-                               bg=CARD_BG if _HAS_STYLES else "white",
-                               fg=MEDIUM_BROWN if _HAS_STYLES else "#8B5E3C",
-                               activebackground=BORDER if _HAS_STYLES else "#ccc",
-                               relief="flat", bd=0, cursor="hand2",
-                               highlightbackground=BORDER if _HAS_STYLES else "#ccc",
-                               highlightthickness=1,
-                               command=self.export_report)
-        export_btn.pack(side="right", ipady=8)
+        self.export_btn = tk.Button(inner_hdr, text="  Export CSV  ",
+                                    font=("Helvetica", 10),
+                                    bg=CARD_BG if _HAS_STYLES else "white",
+                                    fg=MEDIUM_BROWN if _HAS_STYLES else "#8B5E3C",
+                                    activebackground=BORDER if _HAS_STYLES else "#ccc",
+                                    relief="flat", bd=0, cursor="hand2",
+                                    highlightbackground=BORDER if _HAS_STYLES else "#ccc",
+                                    highlightthickness=1,
+                                    command=self.export_report)
+        self.export_btn.pack(side="right", ipady=8)
 
         tk.Frame(hdr, bg=BORDER if _HAS_STYLES else "#ccc", height=1).pack(fill="x")
 
@@ -101,249 +134,291 @@ class ReportsScreen(ttk.Frame):
                  fg=TEXT_MID if _HAS_STYLES else "#555").pack(side="left")
         DatePicker(ctrl, self.end_date_var).pack(side="left", padx=(4, 20))
 
-        gen_btn = tk.Button(ctrl, text="  Generate Report  ",
-                            font=("Helvetica", 10, "bold"),
-                            bg=MEDIUM_BROWN if _HAS_STYLES else "#8B5E3C",
-                            fg="white",
-                            activebackground=DARK_BROWN if _HAS_STYLES else "#4A2C17",
-                            activeforeground="white",
-                            relief="flat", bd=0, cursor="hand2",
-                            command=self.generate_report)
-        gen_btn.pack(side="left", ipady=6)
+        self.gen_btn = tk.Button(ctrl, text="  Generate Report  ",
+                                 font=("Helvetica", 10, "bold"),
+                                 bg=MEDIUM_BROWN if _HAS_STYLES else "#8B5E3C",
+                                 fg="white",
+                                 activebackground=DARK_BROWN if _HAS_STYLES else "#4A2C17",
+                                 activeforeground="white",
+                                 relief="flat", bd=0, cursor="hand2",
+                                 command=self.generate_report)
+        self.gen_btn.pack(side="left", ipady=6)
 
         # Report display area
         outer = tk.Frame(self, bg=bg)
         outer.pack(fill="both", expand=True, padx=12, pady=4)
         self.report_frame = ttk.Frame(outer)
         self.report_frame.pack(fill="both", expand=True)
+        self._build_report_panes()
 
         self.pack(fill="both", expand=True)
-        report_combo.bind("<<ComboboxSelected>>", lambda e: self.generate_report())
+        report_combo.bind("<<ComboboxSelected>>", self._schedule_regen)
+
+    def _build_report_panes(self):
+        """Build one hidden pane per report type; regenerating only refills it"""
+        title_font = ("Helvetica", 12, "bold")
+
+        # Daily sales: summary and top items
+        self._daily_pane = ttk.Frame(self.report_frame)
+        self._daily_title_var = tk.StringVar(self)
+        ttk.Label(self._daily_pane, textvariable=self._daily_title_var,
+                  font=title_font).pack(pady=10)
+        self._daily_total_var, self._daily_count_var, self._daily_average_var = \
+            self._summary_vars(self._daily_pane, ("Total Sales:", "Transactions:", "Average Sale:"))
+
+        items_frame = ttk.LabelFrame(self._daily_pane, text="Top Selling Items")
+        items_frame.pack(fill="x", padx=5, pady=5)
+        columns = ("Item", "Quantity", "Revenue")
+        self._daily_tree = ttk.Treeview(items_frame, columns=columns, displaycolumns=columns,
+                                        show="headings", height=5)
+        self._configure_tree(self._daily_tree, columns, 100)
+        self._daily_tree.pack(fill="x", padx=5, pady=5)
+
+        # Monthly sales: summary and sales per day
+        self._monthly_pane = ttk.Frame(self.report_frame)
+        ttk.Label(self._monthly_pane, text="Monthly Sales Report", font=title_font).pack(pady=10)
+        self._monthly_revenue_var, self._monthly_count_var, self._monthly_average_var = \
+            self._summary_vars(self._monthly_pane,
+                               ("Total Revenue:", "Total Transactions:", "Average Transaction:"))
+
+        daily_frame = ttk.LabelFrame(self._monthly_pane, text="Daily Sales")
+        daily_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        columns = ("Date", "Sales", "Transactions", "Average")
+        self._monthly_tree = ttk.Treeview(daily_frame, columns=columns, displaycolumns=columns,
+                                          show="headings")
+        self._configure_tree(self._monthly_tree, columns, 100)
+        self._monthly_scrollbar = ttk.Scrollbar(daily_frame, orient="vertical",
+                                                command=self._monthly_tree.yview)
+        self._monthly_tree.pack(side="left", fill="both", expand=True)
+        self._monthly_scrollbar.pack(side="right", fill="y")
+
+        # Product performance
+        self._product_pane = ttk.Frame(self.report_frame)
+        ttk.Label(self._product_pane, text="Product Performance Report",
+                  font=title_font).pack(pady=10)
+        columns = ("Product", "Units Sold", "Revenue", "Average Price")
+        self._product_tree = ttk.Treeview(self._product_pane, columns=columns,
+                                          displaycolumns=columns, show="headings")
+        self._configure_tree(self._product_tree, columns, 150)
+        self._product_scrollbar = ttk.Scrollbar(self._product_pane, orient="vertical",
+                                                command=self._product_tree.yview)
+        self._product_tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        self._product_scrollbar.pack(side="right", fill="y")
+
+    @staticmethod
+    def _configure_tree(tree, columns, width):
+        """Set every column's heading to its name and its width, in one Tcl call per column"""
+        path = str(tree)
+        call = tree.tk.call
+        for col in columns:
+            call(path, 'heading', col, '-text', col)
+            call(path, 'column', col, '-width', width)
+
+    def _summary_vars(self, parent, labels):
+        """Add a Summary box with a row per label; returns the StringVars holding the values"""
+        summary_frame = ttk.LabelFrame(parent, text="Summary")
+        summary_frame.pack(fill="x", padx=5, pady=5)
+        values = []
+        for i, label in enumerate(labels):
+            var = tk.StringVar(self)
+            ttk.Label(summary_frame, text=label).grid(row=i, column=0, padx=5, pady=2)
+            ttk.Label(summary_frame, textvariable=var).grid(row=i, column=1, padx=5, pady=2)
+            values.append(var)
+        return values
 
     def load_initial_data(self):
         """Load initial report"""
+        self._report_cache.clear()  # figures may have changed since the last visit
         self.generate_report()
 
+    def _cached_report(self, key):
+        """A fetched report for key younger than the TTL, or None"""
+        cached = self._report_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _REPORT_CACHE_TTL:
+            self._report_cache.move_to_end(key)
+            return cached[1]
+        return None
+
+    def _store_report(self, key, report):
+        """Remember a fetched report, dropping the least recently used beyond the limit"""
+        self._report_cache[key] = (time.monotonic(), report)
+        self._report_cache.move_to_end(key)
+        if len(self._report_cache) > _REPORT_CACHE_SIZE:
+            self._report_cache.popitem(last=False)
+
+    def _schedule_regen(self, event=None):
+        """Regenerate the report once the selection has been left alone briefly"""
+        if self._regen_after_id:
+            self.after_cancel(self._regen_after_id)
+        self._regen_after_id = self.after(_REGEN_DELAY_MS, self.generate_report)
+
     def generate_report(self):
         """Generate selected report"""
-        try:
-            # Clear report frame
-            for widget in self.report_frame.winfo_children():
-                widget.destroy()
+        if self._regen_after_id:
+            self.after_cancel(self._regen_after_id)
+            self._regen_after_id = None
+        report_type = self.report_type_var.get()
+        start_date = self.start_date_var.get()
+        end_date = self.end_date_var.get()
+
+        if report_type == "Daily Sales":
+            today = datetime.now().strftime('%Y-%m-%d')
+            key = ('daily', today, today)
+            pane = self._daily_pane
+            fetch = lambda: self._fetch_daily_sales_report(today)
+            render = lambda data: self._render_daily_sales_report(today, data)
+        elif report_type == "Monthly Sales":
+            key = ('monthly', start_date, end_date)
+            pane = self._monthly_pane
+            fetch = lambda: self._fetch_monthly_sales_report(start_date, end_date)
+            render = self._render_monthly_sales_report
+        else:  # Product Performance
+            key = ('products', start_date, end_date)
+            pane = self._product_pane
+            fetch = lambda: self._fetch_product_performance_report(start_date, end_date)
+            render = self._render_product_performance_report
+
+        self._report_request += 1
+        request = self._report_request
+        cached = self._cached_report(key)
+        if cached is not None:
+            self._show_report(pane, render, cached)
+            return
+
+        def on_done(data):
+            self._store_report(key, data)
+            if request == self._report_request:
+                self._show_report(pane, render, data)
+
+        def on_error(e):
+            logger.error(f"Error generating report: {str(e)}")
+            if request == self._report_request:
+                messagebox.showerror("Error", "Failed to generate report")
 
-            report_type = self.report_type_var.get()
+        self._run_in_background(fetch, on_done, on_error, buttons=(self.gen_btn,))
 
-            if report_type == "Daily Sales":
-                self._generate_daily_sales_report()
-            elif report_type == "Monthly Sales":
-                self._generate_monthly_sales_report()
-            else:  # Product Performance
-                self._generate_product_performance_report()
+    def _show_report(self, pane, render, data):
+        """Refill pane with render(data) and show it in place of the previous report"""
+        try:
+            render(data)
+            if pane is not self._active_pane:
+                if self._active_pane is not None:
+                    self._active_pane.pack_forget()
+                pane.pack(fill="both", expand=True)
+                self._active_pane = pane
 
         except Exception as e:
             logger.error(f"Error generating report: {str(e)}")
             messagebox.showerror("Error", "Failed to generate report")
 
-    def _generate_daily_sales_report(self):
-        """Generate daily sales report"""
-        try:
-            # Get today's date
-            today = datetime.now().strftime('%Y-%m-%d')
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self._stop_worker()
 
-            # Get sales data
-            report_data = self.services['reporting'].generate_daily_report(today)
-
-            # Create report widgets
-            ttk.Label(
-                self.report_frame,
-                text=f"Daily Sales Report - {today}",
-                font=("Helvetica", 12, "bold")
-            ).pack(pady=10)
-
-            # Summary frame
-            summary_frame = ttk.LabelFrame(self.report_frame, text="Summary")
-            summary_frame.pack(fill="x", padx=5, pady=5)
-
-            # Add summary info
-            summary_info = [
-                ("Total Sales:", f"${report_data['overview']['total_sales']:,.2f}"),
-                ("Transactions:", str(report_data['overview']['transaction_count'])),
-                ("Average Sale:",
-                 f"${report_data['overview']['total_sales'] / report_data['overview']['transaction_count']:,.2f}"
-                 if report_data['overview']['transaction_count'] > 0 else "$0.00")
-            ]
-
-            for i, (label, value) in enumerate(summary_info):
-                ttk.Label(summary_frame, text=label).grid(row=i, column=0, padx=5, pady=2)
-                ttk.Label(summary_frame, text=value).grid(row=i, column=1, padx=5, pady=2)
-
-            # Top items frame
-            items_frame = ttk.LabelFrame(self.report_frame, text="Top Selling Items")
-            items_frame.pack(fill="x", padx=5, pady=5)
-
-            # Create treeview for top items
-            columns = ("Item", "Quantity", "Revenue")
-            items_tree = ttk.Treeview(
-                items_frame,
-                columns=columns,
-                show="headings",
-                height=5
-            )
+    # Fetchers run on the worker thread and only call its services
 
-            for col in columns:
-                items_tree.heading(col, text=col)
-                items_tree.column(col, width=100)
+    def _fetch_daily_sales_report(self, today: str) -> Dict:
+        return self._get_worker_services()['reporting'].generate_daily_report(today)
 
-            items_tree.pack(fill="x", padx=5, pady=5)
-
-            # Add top items
-            for item in report_data['sales']['top_items']:
-                items_tree.insert("", "end", values=(
-                    item['name'],
-                    item['quantity'],
-                    f"${item['revenue']:,.2f}"
-                ))
-
-        except Exception as e:
-            logger.error(f"Error generating daily sales report: {str(e)}")
-            raise
-
-    def _generate_monthly_sales_report(self):
-        """Generate monthly sales report"""
-        try:
-            start_date = self.start_date_var.get()
-            end_date = self.end_date_var.get()
-
-            # Get sales data
-            report_data = self.services['reporting'].generate_periodic_report(
-                start_date=start_date,
-                end_date=end_date,
-                group_by='day'
-            )
-
-            # Create report widgets
-            ttk.Label(
-                self.report_frame,
-                text=f"Monthly Sales Report",
-                font=("Helvetica", 12, "bold")
-            ).pack(pady=10)
-
-            # Summary frame
-            summary_frame = ttk.LabelFrame(self.report_frame, text="Summary")
-            summary_frame.pack(fill="x", padx=5, pady=5)
-
-            # Add summary info
-            summary_info = [
-                ("Total Revenue:", f"${report_data['overview']['total_sales']:,.2f}"),
-                ("Total Transactions:", str(report_data['overview']['total_transactions'])),
-                ("Average Transaction:",
-                 f"${report_data['overview']['total_sales'] / report_data['overview']['total_transactions']:,.2f}"
-                 if report_data['overview']['total_transactions'] > 0 else "$0.00")
-            ]
-
-            for i, (label, value) in enumerate(summary_info):
-                ttk.Label(summary_frame, text=label).grid(row=i, column=0, padx=5, pady=2)
-                ttk.Label(summary_frame, text=value).grid(row=i, column=1, padx=5, pady=2)
-
-            # Daily sales frame
-            daily_frame = ttk.LabelFrame(self.report_frame, text="Daily Sales")
-            daily_frame.pack(fill="both", expand=True, padx=5, pady=5)
-
-            # Create treeview for daily sales
-            columns = ("Date", "Sales", "Transactions", "Average")
-            daily_tree = ttk.Treeview(
-                daily_frame,
-                columns=columns,
-                show="headings"
-            )
+    def _fetch_monthly_sales_report(self, start_date: str, end_date: str) -> Dict:
+        # The sales report already groups by day in SQL; the periodic report
+        # would also summarise expenses, which this report does not show
+        return self._get_worker_services()['sales'].get_sales_report(
+            start_date, end_date, group_by='day'
+        )
 
-            for col in columns:
-                daily_tree.heading(col, text=col)
-                daily_tree.column(col, width=100)
+    def _fetch_product_performance_report(self, start_date: str, end_date: str):
+        return self._get_worker_services()['sales'].get_top_selling_items(
+            start_date=start_date,
+            end_date=end_date,
+            limit=20
+        )
 
-            # Add scrollbar
-            scrollbar = ttk.Scrollbar(
-                daily_frame,
-                orient="vertical",
-                command=daily_tree.yview
-            )
-            daily_tree.configure(yscrollcommand=scrollbar.set)
-
-            daily_tree.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-
-            # Add daily sales data
-            for day in report_data['sales_analysis']['over_time']:
-                avg_sale = (day['total_amount'] / day['transaction_count']
-                            if day['transaction_count'] > 0 else 0)
-                daily_tree.insert("", "end", values=(
-                    day['date'],
-                    f"${day['total_amount']:,.2f}",
-                    day['transaction_count'],
-                    f"${avg_sale:,.2f}"
-                ))
+    # Renderers run on the Tk thread and refill the panes built up front
 
-        except Exception as e:
-            logger.error(f"Error generating monthly sales report: {str(e)}")
-            raise
+    def _render_daily_sales_report(self, today: str, report_data: Dict):
+        """Generate daily sales report"""
+        overview = report_data['overview']
+        count = overview['transaction_count']
+        self._daily_title_var.set(f"Daily Sales Report - {today}")
+        self._daily_total_var.set(_money(overview['total_sales']))
+        self._daily_count_var.set(str(count))
+        self._daily_average_var.set(
+            _money(overview['total_sales'] / count) if count > 0 else "$0.00"
+        )
 
-    def _generate_product_performance_report(self):
+        # Replace the top items
+        items_tree = self._daily_tree
+        items_tree.delete(*items_tree.get_children())
+        top_items = report_data['sales']['top_items']
+        revenues = list(map(_money, (item['revenue'] for item in top_items)))
+        # Raw Tcl insert skips Treeview.insert's per-call option handling
+        tree = str(items_tree)
+        call = self.tk.call
+        for item, revenue in zip(top_items, revenues):
+            call(tree, 'insert', '', 'end', '-values', (
+                item['name'],
+                item['quantity'],
+                revenue
+            ))
+
+    def _render_monthly_sales_report(self, report_data: Dict):
+        """Generate monthly sales report"""
+        summary = report_data['summary']
+        self._monthly_revenue_var.set(_money(summary['total_revenue']))
+        self._monthly_count_var.set(str(summary['total_transactions']))
+        self._monthly_average_var.set(_money(summary['average_transaction']))
+
+        # Add daily sales data
+        # Built column by column, then zipped into rows; the daily
+        # totals, counts and averages all come aggregated from SQL
+        over_time = report_data['sales_over_time']
+        rows = list(zip(
+            [day['date'] for day in over_time],
+            map(_money, [day['total_amount'] for day in over_time]),
+            [day['transaction_count'] for day in over_time],
+            map(_money, [day['average_sale'] for day in over_time])
+        ))
+        self._show_rows(self._monthly_tree, self._monthly_scrollbar, rows)
+
+    def _render_product_performance_report(self, products):
         """Generate product performance report"""
-        try:
-            start_date = self.start_date_var.get()
-            end_date = self.end_date_var.get()
-
-            # Get products data
-            products = self.services['sales'].get_top_selling_items(
-                start_date=start_date,
-                end_date=end_date,
-                limit=20
-            )
-
-            # Create report widgets
-            ttk.Label(
-                self.report_frame,
-                text="Product Performance Report",
-                font=("Helvetica", 12, "bold")
-            ).pack(pady=10)
-
-            # Create treeview for products
-            columns = ("Product", "Units Sold", "Revenue", "Average Price")
-            product_tree = ttk.Treeview(
-                self.report_frame,
-                columns=columns,
-                show="headings"
-            )
-
-            for col in columns:
-                product_tree.heading(col, text=col)
-                product_tree.column(col, width=150)
-
-            # Add scrollbar
-            scrollbar = ttk.Scrollbar(
-                self.report_frame,
-                orient="vertical",
-                command=product_tree.yview
-            )
-            product_tree.configure(yscrollcommand=scrollbar.set)
-
-            product_tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
-            scrollbar.pack(side="right", fill="y")
-
-            # Add product data
-            for product in products:
-                avg_price = (product['revenue'] / product['quantity']
-                             if product['quantity'] > 0 else 0)
-                product_tree.insert("", "end", values=(
-                    product['name'],
-                    product['quantity'],
-                    f"${product['revenue']:,.2f}",
-                    f"${avg_price:,.2f}"
-                ))
-
-        except Exception as e:
-            logger.error(f"Error generating product performance report: {str(e)}")
-            raise
+        # Add product data
+        # Built column by column, then zipped into rows
+        revenues = [product['revenue'] for product in products]
+        quantities = [product['quantity'] for product in products]
+        rows = list(zip(
+            [product['name'] for product in products],
+            quantities,
+            map(_money, revenues),
+            map(_money, _averages(revenues, quantities))
+        ))
+        self._show_rows(self._product_tree, self._product_scrollbar, rows)
+
+    @staticmethod
+    def _show_rows(tree, scrollbar, rows):
+        """Replace tree's rows with rows a page at a time, adding the next page as the view nears the end"""
+        tree.delete(*tree.get_children())
+        shown = 0
+
+        # Raw Tcl insert skips Treeview.insert's per-call option handling
+        path = str(tree)
+        call = tree.tk.call
+
+        def render_more():
+            nonlocal shown
+            end = min(shown + _REPORT_PAGE_SIZE, len(rows))
+            for values in rows[shown:end]:
+                call(path, 'insert', '', 'end', '-values', values)
+            shown = end
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            if float(last) >= 0.95 and shown < len(rows):
+                render_more()
+
+        tree.configure(yscrollcommand=on_scroll)
+        render_more()
 
     def export_report(self):
         """Export current report"""
@@ -352,30 +427,39 @@ class ReportsScreen(ttk.Frame):
             "Monthly Sales": "periodic",
             "Product Performance": "periodic",
         }
-        try:
-            selected = self.report_type_var.get()
-            report_type = _TYPE_MAP.get(selected, "periodic")
-            safe_name = selected.lower().replace(" ", "_")
+        selected = self.report_type_var.get()
+        report_type = _TYPE_MAP.get(selected, "periodic")
+        safe_name = selected.lower().replace(" ", "_")
+        start_date = self.start_date_var.get()
+        end_date = self.end_date_var.get()
+
+        from tkinter import filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            initialfile=f"{safe_name}_report_{datetime.now().strftime('%Y%m%d')}.csv"
+        )
+        if not filename:
+            return
+
+        def on_error(e):
+            logger.error(f"Error exporting report: {str(e)}")
+            messagebox.showerror("Error", "Failed to export report")
+
+        self._run_in_background(
+            lambda: self._write_report(filename, report_type, start_date, end_date),
+            lambda _: messagebox.showinfo("Success", "Report exported successfully!"),
+            on_error,
+            buttons=(self.export_btn,)
+        )
 
-            report_data = self.services['reporting'].export_report(
+    def _write_report(self, filename, report_type, start_date, end_date):
+        """Stream the CSV report to disk (runs on the worker thread)"""
+        with open(filename, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+            self._get_worker_services()['reporting'].write_report(
                 report_type=report_type,
-                start_date=self.start_date_var.get(),
-                end_date=self.end_date_var.get(),
+                start_date=start_date,
+                end_date=end_date,
+                fileobj=f,
                 format='csv'
             )
-
-            from tkinter import filedialog
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
-                initialfile=f"{safe_name}_report_{datetime.now().strftime('%Y%m%d')}.csv"
-            )
-
-            if filename:
-                with open(filename, 'wb') as f:
-                    f.write(report_data)
-                messagebox.showinfo("Success", "Report exported successfully!")
-
-        except Exception as e:
-            logger.error(f"Error exporting report: {str(e)}")
-            messagebox.showerror("Error", "Failed to export report")
\ No newline at end of file
@@ -4,6 +4,7 @@ import logging
 from datetime import datetime
 from typing import Dict, List
 from src.database.models import UserRole
+from src.gui.background import BackgroundWorker
 
 try:
     from src.gui.styles import (CREAM, CARD_BG, ESPRESSO, MEDIUM_BROWN, DARK_BROWN,
@@ -16,8 +17,11 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Exports are streamed to disk through a buffer of this size
+_EXPORT_BUFFER_SIZE = 1 << 20
 
-class SalesScreen(ttk.Frame):
+
+class SalesScreen(BackgroundWorker, ttk.Frame):
     def __init__(self, parent, services):
         super().__init__(parent)
         self.parent = parent
@@ -26,6 +30,8 @@ class SalesScreen(ttk.Frame):
         # Initialize variables
         self.current_sale_items = []
         self.selected_item = None
+        self._start_worker("sales-screen")
+        self.bind("<Destroy>", self._on_destroy)
 
         self.create_widgets()
         self.load_data()
@@ -250,11 +256,12 @@ class SalesScreen(ttk.Frame):
             command=self.load_sales_history
         ).pack(side="left", padx=5)
 
-        ttk.Button(
+        self.history_export_btn = ttk.Button(
             controls_frame,
             text="Export",
             command=self.export_sales_history
-        ).pack(side="right", padx=5)
+        )
+        self.history_export_btn.pack(side="right", padx=5)
 
         # Create treeview for sales history
         columns = ("Date", "Sale ID", "Items", "Total", "Payment", "User")
@@ -308,11 +315,12 @@ class SalesScreen(ttk.Frame):
             command=self.generate_report
         ).pack(side="left", padx=5)
 
-        ttk.Button(
+        self.report_export_btn = ttk.Button(
             controls_frame,
             text="Export",
             command=self.export_report
-        ).pack(side="right", padx=5)
+        )
+        self.report_export_btn.pack(side="right", padx=5)
 
         # Report content frame
         self.report_frame = ttk.Frame(tab)
@@ -709,32 +717,43 @@ class SalesScreen(ttk.Frame):
 
     def export_sales_history(self):
         """Export sales history to CSV"""
-        try:
-            start_date = self.start_date_var.get()
-            end_date = self.end_date_var.get()
+        start_date = self.start_date_var.get()
+        end_date = self.end_date_var.get()
+
+        import tkinter.filedialog as filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            initialfile=f"sales_history_{start_date}_to_{end_date}.csv"
+        )
+        if not filename:
+            return
+
+        def on_error(e):
+            logger.error(f"Error exporting sales history: {str(e)}")
+            messagebox.showerror("Error", "Failed to export sales history")
 
-            report_data = self.services['reporting'].export_report(
-                report_type='periodic',
+        self._run_in_background(
+            lambda: self._write_report(filename, 'periodic', start_date, end_date),
+            lambda _: messagebox.showinfo("Success", "Sales history exported successfully!"),
+            on_error,
+            buttons=(self.history_export_btn,)
+        )
+
+    def _write_report(self, filename, report_type, start_date, end_date):
+        """Stream a CSV report to disk (runs on the worker thread)"""
+        with open(filename, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+            self._get_worker_services()['reporting'].write_report(
+                report_type=report_type,
                 start_date=start_date,
                 end_date=end_date,
+                fileobj=f,
                 format='csv'
             )
 
-            import tkinter.filedialog as filedialog
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
-                initialfile=f"sales_history_{start_date}_to_{end_date}.csv"
-            )
-
-            if filename:
-                with open(filename, 'wb') as f:
-                    f.write(report_data)
-                messagebox.showinfo("Success", "Sales history exported successfully!")
-
-        except Exception as e:
-            logger.error(f"Error exporting sales history: {str(e)}")
-            messagebox.showerror("Error", "Failed to export sales history")
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self._stop_worker()
 
     def generate_report(self):
         """Generate selected sales report"""
@@ -946,31 +965,27 @@ class SalesScreen(ttk.Frame):
             "Monthly Sales": "periodic",
             "Product Performance": "periodic",
         }
-        try:
-            today = datetime.now().strftime('%Y-%m-%d')
-            selected = self.report_type_var.get()
-            report_type = _TYPE_MAP.get(selected, "periodic")
-
-            report_data = self.services['reporting'].export_report(
-                report_type=report_type,
-                start_date=today,
-                end_date=today,
-                format='csv'
-            )
-
-            import tkinter.filedialog as filedialog
-            safe_name = selected.lower().replace(" ", "_")
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
-                initialfile=f"{safe_name}_report_{datetime.now().strftime('%Y%m%d')}.csv"
-            )
-
-            if filename:
-                with open(filename, 'wb') as f:
-                    f.write(report_data)
-                messagebox.showinfo("Success", "Report exported successfully!")
+        today = datetime.now().strftime('%Y-%m-%d')
+        selected = self.report_type_var.get()
+        report_type = _TYPE_MAP.get(selected, "periodic")
+
+        import tkinter.filedialog as filedialog
+        safe_name = selected.lower().replace(" ", "_")
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            initialfile=f"{safe_name}_report_{datetime.now().strftime('%Y%m%d')}.csv"
+        )
+        if not filename:
+            return
 
-        except Exception as e:
+        def on_error(e):
             logger.error(f"Error exporting report: {str(e)}")
-            messagebox.showerror("Error", "Failed to export report")
\ No newline at end of file
+            messagebox.showerror("Error", "Failed to export report")
+
+        self._run_in_background(
+            lambda: self._write_report(filename, report_type, today, today),
+            lambda _: messagebox.showinfo("Success", "Report exported successfully!"),
+            on_error,
+            buttons=(self.report_export_btn,)
+        )
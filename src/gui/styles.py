@@ -7,6 +7,7 @@ Contrast targets (WCAG AA):
 All foreground/background pairs below meet or exceed these targets.
 """
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk
 
 # --- Palette ---
@@ -41,10 +42,56 @@ FONT_BODY = ("Helvetica", 11)
 FONT_SMALL= ("Helvetica", 10)
 FONT_MONO = ("Courier", 10)
 
+# Named Helvetica fonts, resolved once per interpreter instead of once per
+# widget: name -> (size, weight). Register them with init_fonts().
+FONT_SPECS = {
+    "BB_H44":  (44, "normal"),
+    "BB_H40B": (40, "bold"),
+    "BB_H26B": (26, "bold"),
+    "BB_H24B": (24, "bold"),
+    "BB_H22B": (22, "bold"),
+    "BB_H22":  (22, "normal"),
+    "BB_H20B": (20, "bold"),
+    "BB_H16B": (16, "bold"),
+    "BB_H14B": (14, "bold"),
+    "BB_H12B": (12, "bold"),
+    "BB_H12":  (12, "normal"),
+    "BB_H11B": (11, "bold"),
+    "BB_H10B": (10, "bold"),
+    "BB_H10":  (10, "normal"),
+    "BB_H9B":  (9, "bold"),
+    "BB_H9":   (9, "normal"),
+    "BB_H8B":  (8, "bold"),
+    "BB_H8":   (8, "normal")
+}
+_fonts = []
+
+
+def init_fonts(root) -> None:
+    """Register the named fonts once per Tk interpreter"""
+    existing = set(tkfont.names(root))
+    for name, (size, weight) in FONT_SPECS.items():
+        if name not in existing:
+            # Keep a reference; Tk deletes a named font when its Font object is collected
+            _fonts.append(tkfont.Font(root=root, name=name, family="Helvetica",
+                                      size=size, weight=weight))
+
+
+_screen = None
+
+
+def screen_dims(root) -> tuple:
+    """(width, height) of the screen, asked of Tk only the first time"""
+    global _screen
+    if _screen is None:
+        _screen = (root.winfo_screenwidth(), root.winfo_screenheight())
+    return _screen
+
 
 def apply_theme(root: tk.Tk) -> ttk.Style:
     """Apply the Brew & Bite café theme to the given root window."""
     root.configure(bg=CREAM)
+    init_fonts(root)
     style = ttk.Style(root)
     style.theme_use("clam")          # clam is the most customisable cross-platform theme
 
@@ -70,6 +117,9 @@ def apply_theme(root: tk.Tk) -> ttk.Style:
     style.map("TNotebook.Tab",
               background=[("selected", MEDIUM_BROWN), ("active", DARK_BROWN)],
               foreground=[("selected", CARD_BG),      ("active", CARD_BG)])
+    # Tab-less notebook the main window switches its screens with
+    style.configure("Hidden.TNotebook", background=CREAM, borderwidth=0, padding=0)
+    style.layout("Hidden.TNotebook.Tab", [])
 
     # ---- Buttons ----
     style.configure("TButton",
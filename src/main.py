@@ -70,7 +70,10 @@ class BrewAndBiteApp:
     def start_gui(self):
         """Initialize and start the GUI"""
         try:
-            login_window = LoginWindow()
+            # One root for the whole session; the login and main windows take
+            # turns building into it
+            root = tk.Tk()
+            login_window = LoginWindow(root)
             login_window.run()
         except Exception as e:
             self.logger.error(f"GUI initialization failed: {str(e)}")
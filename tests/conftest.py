@@ -10,6 +10,7 @@ from sqlalchemy.orm import sessionmaker, Session
 from datetime import datetime
 from typing import Generator
 
+from src.dal import audit_queue
 from src.database.models import Base, User, Category, UserRole, InventoryItem
 from src.utils.security import hash_password
 
@@ -36,7 +37,9 @@ def test_db() -> Generator[Session, None, None]:
 
     yield session
 
-    # Cleanup
+    # Cleanup; the audit writer must not outlive the database it writes to
+    audit_queue.flush()
+    audit_queue.stop()
     session.close()
     os.close(db_fd)
     os.unlink(db_path)
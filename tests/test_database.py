@@ -6,7 +6,7 @@ import pytest
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 
-from src.database.models import User, Category, Expense, InventoryItem, Sale, UserRole
+from src.database.models import User, Category, Expense, InventoryItem, Sale, UserRole, AuditLog
 from src.utils.security import hash_password, verify_password
 
 
@@ -168,4 +168,37 @@ def test_relationships(test_db, test_user, test_category, test_inventory_item):
     assert test_user.expenses[0].amount == 75.00
 
     # Test category relationships
-    assert test_category.expenses[0].description == "Test relationship expense"
\ No newline at end of file
+    assert test_category.expenses[0].description == "Test relationship expense"
+
+def test_audit_queue_writes_on_commit(test_db):
+    """Test audit entries are written after commit and dropped on rollback"""
+    from src.dal.audit_queue import audit_queue, flush
+
+    audit_queue.put(test_db, user_id=1, action='TEST', table_name='users',
+                    details='rolled back entry')
+    test_db.rollback()
+
+    audit_queue.put(test_db, user_id=1, action='TEST', table_name='users',
+                    details='committed entry')
+    test_db.commit()
+    flush()
+
+    details = [a.details for a in test_db.query(AuditLog).filter_by(action='TEST')]
+    assert details == ['committed entry']
+
+def test_audit_queue_restarts_after_stop(test_db):
+    """Test stop writes queued entries and a later commit starts a new writer"""
+    from src.dal.audit_queue import audit_queue, flush, stop
+
+    audit_queue.put(test_db, user_id=1, action='STOP_TEST', table_name='users',
+                    details='before stop')
+    test_db.commit()
+    stop()
+
+    audit_queue.put(test_db, user_id=1, action='STOP_TEST', table_name='users',
+                    details='after stop')
+    test_db.commit()
+    flush()
+
+    details = [a.details for a in test_db.query(AuditLog).filter_by(action='STOP_TEST')]
+    assert sorted(details) == ['after stop', 'before stop']
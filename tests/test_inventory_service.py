@@ -5,6 +5,9 @@ Tests for inventory service functionality.
 import pytest
 from datetime import datetime
 from decimal import Decimal
+from io import BytesIO
+
+from src.database.models import InventoryItem
 
 
 def test_add_inventory_item(inventory_service):
@@ -227,4 +230,59 @@ def test_batch_stock_update(inventory_service, test_inventory_item):
     # Verify final quantity
     status = inventory_service.get_inventory_status()
     item = next(item for item in status['items'] if item['id'] == test_inventory_item.id)
-    assert item['quantity'] == test_inventory_item.quantity + 40  # +50 -20 +10
\ No newline at end of file
+    assert item['quantity'] == test_inventory_item.quantity + 40  # +50 -20 +10
+
+def test_export_inventory_csv(inventory_service):
+    """Test inventory CSV export to a file object"""
+    out = BytesIO()
+    inventory_service.export_inventory(out, search_term="coffee")
+
+    lines = out.getvalue().decode('utf-8').splitlines()
+    assert lines[0] == "ID,Item,Quantity,Unit Cost,Total Value,Reorder Level,Status"
+    assert any(",Coffee Beans,100,20.00,2000.00,20,In Stock" in line for line in lines[1:])
+    assert not any("Milk" in line for line in lines)
+    assert not out.closed
+
+def test_get_inventory_status_filters(inventory_service):
+    """Test inventory status filtered by name and stock status"""
+    status = inventory_service.get_inventory_status(search_term="coffee")
+    assert status['items']
+    assert all("coffee" in item['name'].lower() for item in status['items'])
+
+    status = inventory_service.get_inventory_status(status='normal')
+    assert all(item['status'] == 'normal' for item in status['items'])
+
+    with pytest.raises(ValueError):
+        inventory_service.get_inventory_status(status='missing')
+
+def test_get_inventory_status_search_is_literal(test_db, inventory_service):
+    """Test LIKE wildcards in a search term match only themselves"""
+    for name in ('Cocoa 50%', 'Cocoa 500g', 'Oat_Milk', 'OatsMilk'):
+        test_db.add(InventoryItem(name=name, quantity=10, unit_cost=1.00, reorder_level=2))
+    test_db.commit()
+
+    names = {item['name'] for item in inventory_service.get_inventory_status(search_term="50%")['items']}
+    assert names == {'Cocoa 50%'}
+
+    names = {item['name'] for item in inventory_service.get_inventory_status(search_term="oat_")['items']}
+    assert names == {'Oat_Milk'}
+
+
+def test_export_transactions_csv(inventory_service, test_inventory_item):
+    """Test transaction CSV export streams rows for the date range"""
+    inventory_service.update_stock(
+        item_id=test_inventory_item.id,
+        quantity_change=5,
+        transaction_type='restock',
+        user_id=1,
+        notes="Export test"
+    )
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    out = BytesIO()
+    inventory_service.export_transactions(out, today, today, transaction_type="Restock")
+
+    lines = out.getvalue().decode('utf-8').splitlines()
+    assert lines[0] == "Date,Item,Type,Quantity,User,Notes"
+    assert any(f",{test_inventory_item.name},restock,5," in line and "Export test" in line
+               for line in lines[1:])